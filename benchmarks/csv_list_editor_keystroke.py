@@ -0,0 +1,71 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Benchmark of the work a CSVListEditor does for each keystroke when
+    editing a long list of floats with 'auto_set' enabled.
+
+    For each simulated keystroke the text is converted to a list twice, as
+    the text editors do (once to set the trait, and once to check whether the
+    text must be updated), and the list is compared with the trait value.
+    This needs no GUI toolkit::
+
+        python csv_list_editor_keystroke.py [number of items]
+"""
+
+from __future__ import print_function
+
+import random
+import sys
+import time
+
+from traitsui.editors.csv_list_editor import (
+    _eval_list_str, _format_list_str, _ListStrEvaluator)
+
+
+def keystrokes(text, count, rng):
+    """ Yields the texts produced by typing digits at random positions.
+    """
+    for i in range(count):
+        index = rng.randint(0, len(text))
+        # Only insert after a digit, so that the text stays valid:
+        while index > 0 and not text[index - 1].isdigit():
+            index -= 1
+        text = text[:index] + str(rng.randint(0, 9)) + text[index:]
+        yield text
+
+
+def run(evaluate, texts):
+    """ Returns the mean time per keystroke, in milliseconds.
+    """
+    start = time.time()
+    value = None
+    for text in texts:
+        value = evaluate(text)
+        if evaluate(text) != value:
+            raise RuntimeError('Inconsistent conversion')
+    return 1000.0 * (time.time() - start) / len(texts)
+
+
+def main(size=50000, count=50):
+    rng = random.Random(0)
+    values = [rng.uniform(-1000.0, 1000.0) for i in range(size)]
+    text = _format_list_str(values)
+    texts = list(keystrokes(text, count, rng))
+
+    start = time.time()
+    for i in range(10):
+        _format_list_str(values)
+    print('Formatting %d items: %.1f ms' % (
+        size, 100.0 * (time.time() - start)))
+
+    full = lambda s: _eval_list_str(s, item_eval=float)
+    print('Full conversion:        %.1f ms per keystroke' % run(full, texts))
+
+    incremental = _ListStrEvaluator(item_eval=float, strip=False)
+    incremental(text)
+    print('Incremental conversion: %.1f ms per keystroke' % run(
+        incremental, texts))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,262 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Runs the benchmark suite in the 'suite' package and stores the results as
+    JSON, or compares two result files.
+
+    The benchmarks follow the conventions of asv (airspeed velocity): each
+    class in a 'bench_*' module of the suite may define 'params' (a list of
+    values, or a list of lists of values combined with 'param_names'),
+    'setup' and 'teardown' methods, which are called around every timed run,
+    and 'time_*' methods, which are timed. A class may also set 'repeat' to
+    override the number of timed runs.
+
+    Expensive state (such as a large UI) can be built by a 'setup_cache'
+    method. Unlike asv's, it is called with the parameters, once per set of
+    parameters for all of the 'time_*' methods of the class, and its result
+    is passed as the first argument to 'setup', 'teardown' and the 'time_*'
+    methods. An optional 'teardown_cache' method is called with the same
+    arguments once the class's benchmarks have run.
+
+    The suite runs headless, using Qt's offscreen platform by default::
+
+        python run_suite.py                    # all benchmarks
+        python run_suite.py --quick -k table   # smallest size of matching ones
+        python run_suite.py compare results/OLD.json results/NEW.json
+
+    Results are written to 'results/<commit>.json' unless '--output' is used.
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import fnmatch
+import importlib
+import inspect
+import itertools
+import json
+import os
+import pkgutil
+import platform
+import subprocess
+import sys
+import timeit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# The default number of timed runs of each benchmark:
+REPEAT = 5
+
+
+def git_commit():
+    """ Returns the commit hash of the source tree, or None.
+    """
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', 'HEAD'], cwd=HERE,
+            stderr=open(os.devnull, 'w'))
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def discover(pattern=None):
+    """ Yields (name, class, method name) for each benchmark of the suite
+        whose name matches the 'pattern' (a substring or glob pattern).
+    """
+    import suite
+
+    for _, module_name, _ in pkgutil.iter_modules(suite.__path__):
+        if not module_name.startswith('bench_'):
+            continue
+        module = importlib.import_module('suite.' + module_name)
+        classes = inspect.getmembers(module, inspect.isclass)
+        for class_name, klass in sorted(classes):
+            if klass.__module__ != module.__name__:
+                continue
+            for method_name in sorted(dir(klass)):
+                if not method_name.startswith('time_'):
+                    continue
+                name = '%s.%s.%s' % (module_name, class_name, method_name)
+                if pattern is None or pattern in name or \
+                        fnmatch.fnmatch(name, pattern):
+                    yield name, klass, method_name
+
+
+def param_sets(klass, quick=False):
+    """ Returns the list of argument tuples a benchmark class is run with.
+    """
+    params = getattr(klass, 'params', None)
+    if params is None:
+        return [()]
+
+    if len(getattr(klass, 'param_names', ())) > 1:
+        sets = list(itertools.product(*params))
+    else:
+        sets = [(param,) for param in params]
+    if quick:
+        sets = sets[:1]
+    return sets
+
+
+def cached_setup(cache, klass, args):
+    """ Returns the result of the 'setup_cache' method of a benchmark class
+        for a set of parameters, only calling it the first time.
+    """
+    key = (klass, args)
+    if key not in cache:
+        cache[key] = klass().setup_cache(*args)
+    return cache[key]
+
+
+def release_cache(cache):
+    """ Calls the 'teardown_cache' method of the benchmark classes for each
+        of their cached results, and empties the cache.
+    """
+    for (klass, args), value in cache.items():
+        if hasattr(klass, 'teardown_cache'):
+            klass().teardown_cache(value, *args)
+    cache.clear()
+
+
+def run_benchmark(klass, method_name, args, repeat, cache):
+    """ Returns the times (in seconds) of the timed runs of a benchmark, or
+        None if its setup raised NotImplementedError (meaning the benchmark
+        does not apply to these parameters).
+    """
+    repeat = getattr(klass, 'repeat', repeat)
+    if hasattr(klass, 'setup_cache'):
+        try:
+            args = (cached_setup(cache, klass, args),) + args
+        except NotImplementedError:
+            return None
+    times = []
+    for i in range(repeat):
+        benchmark = klass()
+        if hasattr(benchmark, 'setup'):
+            try:
+                benchmark.setup(*args)
+            except NotImplementedError:
+                return None
+        try:
+            method = getattr(benchmark, method_name)
+            start = timeit.default_timer()
+            method(*args)
+            times.append(timeit.default_timer() - start)
+        finally:
+            if hasattr(benchmark, 'teardown'):
+                benchmark.teardown(*args)
+    return times
+
+
+def run(options):
+    """ Runs the benchmarks and saves the results.
+    """
+    os.environ.setdefault('ETS_TOOLKIT', 'qt4')
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    sys.path.insert(0, HERE)
+
+    commit = git_commit()
+    results = {}
+    # The results of 'setup_cache' for the class being run:
+    cache = {}
+    for name, klass, method_name in discover(options.filter):
+        if any(cached is not klass for cached, _ in cache):
+            release_cache(cache)
+        results[name] = entries = {}
+        for args in param_sets(klass, options.quick):
+            key = ', '.join(repr(arg) for arg in args)
+            times = run_benchmark(klass, method_name, args, options.repeat,
+                                  cache)
+            if times is None:
+                continue
+            times.sort()
+            entries[key] = {
+                'min': times[0],
+                'median': times[len(times) // 2],
+                'max': times[-1],
+                'repeat': len(times),
+            }
+            print('%-60s %-20s %10.4f s' % (name, key, times[0]))
+            sys.stdout.flush()
+    release_cache(cache)
+
+    output = options.output
+    if output is None:
+        output = os.path.join(HERE, 'results', '%s.json' % (commit or 'local'))
+    directory = os.path.dirname(output)
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+    with open(output, 'w') as fh:
+        json.dump({
+            'commit': commit,
+            'date': datetime.datetime.utcnow().isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'toolkit': os.environ.get('ETS_TOOLKIT'),
+            'qt_api': os.environ.get('QT_API'),
+            'results': results,
+        }, fh, indent=2, sort_keys=True)
+    print('Results written to %s' % output)
+
+
+def compare(options):
+    """ Prints the ratio of the minimum times of two result files, flagging
+        the benchmarks that got slower or faster by more than the threshold.
+    """
+    with open(options.old) as fh:
+        old = json.load(fh)['results']
+    with open(options.new) as fh:
+        new = json.load(fh)['results']
+
+    regressions = 0
+    for name in sorted(set(old) & set(new)):
+        for key in sorted(set(old[name]) & set(new[name])):
+            before = old[name][key]['min']
+            after = new[name][key]['min']
+            ratio = after / before if before > 0 else float('inf')
+            flag = ''
+            if ratio > options.threshold:
+                flag = 'SLOWER'
+                regressions += 1
+            elif ratio < 1.0 / options.threshold:
+                flag = 'faster'
+            print('%-60s %-20s %10.4f %10.4f %7.2f %s' % (
+                name, key, before, after, ratio, flag))
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    subparsers = parser.add_subparsers(dest='command')
+
+    run_parser = subparsers.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('-k', '--filter',
+                            help='only run benchmarks matching this pattern')
+    run_parser.add_argument('--quick', action='store_true',
+                            help='only run the first set of parameters')
+    run_parser.add_argument('--repeat', type=int, default=REPEAT,
+                            help='number of timed runs of each benchmark')
+    run_parser.add_argument('-o', '--output', help='JSON file to write')
+
+    compare_parser = subparsers.add_parser('compare',
+                                           help='compare two result files')
+    compare_parser.add_argument('old')
+    compare_parser.add_argument('new')
+    compare_parser.add_argument('--threshold', type=float, default=1.1,
+                                help='ratio above which to flag a change')
+
+    if argv is None:
+        argv = sys.argv[1:]
+    if not argv or argv[0] not in ('run', 'compare', '-h', '--help'):
+        argv = ['run'] + list(argv)
+    options = parser.parse_args(argv)
+    if options.command == 'compare':
+        return compare(options)
+    run(options)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,23 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" The benchmarks run by run_suite.py. See that script for the conventions
+    they follow.
+"""
+
+from pyface.api import GUI
+
+
+def process_events():
+    """ Processes the pending GUI events, so that layout and painting caused
+        by a benchmark are included in its time.
+    """
+    GUI.process_events()
+
+
+def dispose_all(uis):
+    """ Disposes of a list of UIs.
+    """
+    for ui in uis:
+        ui.dispose()
+    del uis[:]
@@ -0,0 +1,60 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Benchmarks of sorting and filtering the rows displayed by a
+    DataFrameEditor.
+"""
+
+from traits.api import HasTraits, Instance
+
+
+class Frame(HasTraits):
+
+    data = Instance('pandas.core.frame.DataFrame')
+
+
+# The data frames created so far, keyed by size:
+_frames = {}
+
+
+def make_frame(size):
+    """ Returns (and caches) a data frame with 'size' rows.
+    """
+    if size not in _frames:
+        import numpy as np
+        import pandas as pd
+
+        rng = np.random.RandomState(size)
+        _frames[size] = pd.DataFrame({
+            'value': rng.random_sample(size),
+            'count': rng.randint(0, 1000, size),
+        })
+    return _frames[size]
+
+
+class DataFrameSortFilter(object):
+    """ Times computing the order of the rows displayed by a DataFrameAdapter.
+    """
+
+    params = [100000, 5000000]
+    param_names = ['rows']
+
+    def setup(self, size):
+        try:
+            from traitsui.ui_editors.data_frame_editor import DataFrameAdapter
+            self.frame = Frame(data=make_frame(size))
+        except ImportError:
+            raise NotImplementedError
+        self.adapter = DataFrameAdapter()
+
+    def time_sort(self, size):
+        self.adapter.sort_column = 'value'
+        self.adapter.get_positions(self.frame, 'data')
+
+    def time_sort_descending(self, size):
+        self.adapter.trait_set(sort_column='count', sort_ascending=False)
+        self.adapter.get_positions(self.frame, 'data')
+
+    def time_filter_and_sort(self, size):
+        self.adapter.trait_set(query='count < 500', sort_column='value')
+        self.adapter.get_positions(self.frame, 'data')
@@ -0,0 +1,99 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Benchmarks of paging through an SQLite table with a TabularEditor.
+"""
+
+import atexit
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+
+from traits.api import HasTraits, Instance
+from traitsui.api import Item, TabularEditor, View
+from traitsui.tabular_data_source import (
+    DataSourceAdapter, ITabularDataSource, SQLiteDataSource)
+
+from . import dispose_all, process_events
+
+
+class Results(HasTraits):
+
+    rows = Instance(ITabularDataSource)
+
+    traits_view = View(
+        Item('rows', show_label=False, editor=TabularEditor(
+            adapter=DataSourceAdapter(columns=['name', 'value', 'count']))),
+        width=600, height=400, resizable=True,
+    )
+
+
+# The databases created so far, keyed by size:
+_databases = {}
+
+
+def make_database(size):
+    """ Returns the path of (and caches) a database whose 'results' table has
+        'size' rows.
+    """
+    if size not in _databases:
+        directory = tempfile.mkdtemp()
+        atexit.register(shutil.rmtree, directory, True)
+        path = os.path.join(directory, 'results.db')
+        rng = random.Random(size)
+        connection = sqlite3.connect(path)
+        connection.execute(
+            'CREATE TABLE results (name TEXT, value REAL, count INTEGER)')
+        connection.executemany(
+            'INSERT INTO results VALUES (?, ?, ?)',
+            (('row %d' % i, rng.random(), rng.randint(0, 1000))
+             for i in range(size)))
+        connection.commit()
+        connection.close()
+        _databases[size] = path
+    return _databases[size]
+
+
+class DataSourcePaging(object):
+    """ Times fetching rows spread over a table, before and after sorting it,
+        and scrolling through a TabularEditor displaying it.
+    """
+
+    params = [100000, 1000000]
+    param_names = ['rows']
+
+    def setup(self, size):
+        self.source = SQLiteDataSource(database=make_database(size),
+                                       table='results')
+        self.results = Results(rows=self.source)
+        self.adapter = DataSourceAdapter(columns=['name', 'value', 'count'])
+        self.uis = []
+
+    def teardown(self, size):
+        dispose_all(self.uis)
+        self.source.connection.close()
+
+    def time_page_through(self, size):
+        adapter, results = self.adapter, self.results
+        for row in range(0, size, max(1, size // 200)):
+            for column in range(3):
+                adapter.get_text(results, 'rows', row, column)
+
+    def time_sort(self, size):
+        adapter, results = self.adapter, self.results
+        self.source.sort('value')
+        for row in (0, size // 2, size - 1):
+            adapter.get_text(results, 'rows', row, 0)
+
+    def time_scroll_paint(self, size):
+        self.uis.append(self.results.edit_traits())
+        process_events()
+        control = self.uis[0].get_editors('rows')[0].control
+        scroll_bar = control.verticalScrollBar()
+        maximum = scroll_bar.maximum()
+        for i in range(51):
+            scroll_bar.setValue(maximum * i // 50)
+            control.viewport().repaint()
+        process_events()
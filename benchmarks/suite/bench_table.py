@@ -0,0 +1,97 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Benchmarks of TableEditor sorting and filtering.
+"""
+
+import random
+
+from traits.api import Float, HasTraits, Int, List, Str
+from traitsui.api import Item, ObjectColumn, TableEditor, View
+
+from . import process_events
+
+
+class Row(HasTraits):
+
+    name = Str
+
+    value = Float
+
+    count = Int
+
+
+table_editor = TableEditor(
+    columns=[ObjectColumn(name='name'), ObjectColumn(name='value'),
+             ObjectColumn(name='count')],
+    sortable=True,
+    editable=False,
+)
+
+
+class Table(HasTraits):
+
+    rows = List(Row)
+
+    traits_view = View(
+        Item('rows', editor=table_editor, show_label=False),
+        width=600, height=400, resizable=True,
+    )
+
+
+# The rows created so far, keyed by size:
+_rows = {}
+
+
+def make_rows(size):
+    """ Returns (and caches) a list of 'size' rows.
+    """
+    if size not in _rows:
+        rng = random.Random(size)
+        _rows[size] = [Row(name='row %d' % i, value=rng.random(),
+                           count=rng.randint(0, 1000)) for i in range(size)]
+    return _rows[size]
+
+
+class TableSortFilter(object):
+    """ Times sorting and filtering a TableEditor.
+    """
+
+    params = [10000, 100000, 1000000]
+    param_names = ['rows']
+
+    # Building the largest tables is slow, so use fewer runs:
+    repeat = 3
+
+    def setup_cache(self, size):
+        # The table is only built once for each size, and reset before each
+        # timed run:
+        ui = Table(rows=make_rows(size)).edit_traits()
+        process_events()
+        return ui
+
+    def teardown_cache(self, ui, size):
+        ui.dispose()
+
+    def setup(self, ui, size):
+        from pyface.qt import QtCore
+
+        self.editor = editor = ui.get_editors('rows')[0]
+        editor.filter = None
+        editor.model.sort(-1, QtCore.Qt.AscendingOrder)
+        process_events()
+
+    def time_sort(self, ui, size):
+        from pyface.qt import QtCore
+
+        self.editor.model.sort(1, QtCore.Qt.DescendingOrder)
+        process_events()
+
+    def time_filter(self, ui, size):
+        self.editor.filter = lambda row: row.value > 0.5
+        process_events()
+
+    def time_filter_and_clear(self, ui, size):
+        self.editor.filter = lambda row: row.count % 10 == 0
+        self.editor.filter = None
+        process_events()
@@ -0,0 +1,90 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Benchmarks of TabularEditor cell data and scrolling throughput.
+"""
+
+import random
+
+from traits.api import Float, HasTraits, Int, List, Str
+from traitsui.api import Item, TabularEditor, View
+from traitsui.tabular_adapter import TabularAdapter
+
+from . import dispose_all, process_events
+
+
+class Row(HasTraits):
+
+    name = Str
+
+    value = Float
+
+    count = Int
+
+
+class RowAdapter(TabularAdapter):
+
+    columns = [('Name', 'name'), ('Value', 'value'), ('Count', 'count')]
+
+
+class Table(HasTraits):
+
+    rows = List(Row)
+
+    traits_view = View(
+        Item('rows', editor=TabularEditor(adapter=RowAdapter()),
+             show_label=False),
+        width=600, height=400, resizable=True,
+    )
+
+
+# The rows created so far, keyed by size:
+_rows = {}
+
+
+def make_rows(size):
+    """ Returns (and caches) a list of 'size' rows.
+    """
+    if size not in _rows:
+        rng = random.Random(size)
+        _rows[size] = [Row(name='row %d' % i, value=rng.random(),
+                           count=rng.randint(0, 1000)) for i in range(size)]
+    return _rows[size]
+
+
+class TabularScroll(object):
+    """ Times fetching cell data and scrolling through a TabularEditor.
+    """
+
+    params = [10000, 100000]
+    param_names = ['rows']
+
+    def setup(self, size):
+        self.table = Table(rows=make_rows(size))
+        self.uis = [self.table.edit_traits()]
+        self.editor = self.uis[0].get_editors('rows')[0]
+        process_events()
+
+    def teardown(self, size):
+        dispose_all(self.uis)
+
+    def time_cell_data(self, size):
+        from pyface.qt import QtCore
+
+        model = self.editor.model
+        columns = model.columnCount(QtCore.QModelIndex())
+        step = max(1, size // 1000)
+        for row in range(0, size, step):
+            for column in range(columns):
+                index = model.index(row, column)
+                model.data(index, QtCore.Qt.DisplayRole)
+                model.data(index, QtCore.Qt.BackgroundRole)
+
+    def time_scroll_paint(self, size):
+        control = self.editor.control
+        scroll_bar = control.verticalScrollBar()
+        maximum = scroll_bar.maximum()
+        for i in range(51):
+            scroll_bar.setValue(maximum * i // 50)
+            control.viewport().repaint()
+        process_events()
@@ -0,0 +1,87 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Benchmarks of expanding TreeEditor nodes of wide and deep trees.
+"""
+
+from traits.api import HasTraits, Instance, List, Str
+from traitsui.api import Item, TreeEditor, TreeNode, View
+
+from . import dispose_all, process_events
+
+
+class Folder(HasTraits):
+
+    name = Str
+
+    children = List
+
+
+tree_editor = TreeEditor(
+    nodes=[TreeNode(node_for=[Folder], children='children', label='name')],
+    editable=False,
+    hide_root=False,
+)
+
+
+class Model(HasTraits):
+
+    root = Instance(Folder)
+
+    traits_view = View(Item('root', editor=tree_editor, show_label=False),
+                       width=400, height=600, resizable=True)
+
+
+def make_wide(size):
+    """ Returns a root folder holding a folder of 'size' folders, each holding
+        one folder.
+    """
+    return Folder(name='root', children=[Folder(name='wide', children=[
+        Folder(name='folder %d' % i, children=[Folder(name='leaf')])
+        for i in range(size)])])
+
+
+def make_deep(depth):
+    """ Returns a chain of 'depth' nested folders, each with some siblings.
+    """
+    folder = Folder(name='leaf')
+    for i in range(depth):
+        siblings = [Folder(name='sibling %d' % j) for j in range(5)]
+        folder = Folder(name='level %d' % i, children=[folder] + siblings)
+    return folder
+
+
+class TreeExpand(object):
+    """ Times expanding the (not yet expanded) wide folder of a wide tree,
+        and every level of a deep tree.
+    """
+
+    params = [[1000, 10000], ['wide', 'deep']]
+    param_names = ['size', 'shape']
+
+    def setup(self, size, shape):
+        if shape == 'wide':
+            root = make_wide(size)
+        else:
+            # Deep trees have 'size' // 50 levels, to stay well within the
+            # recursion limit of TreeEditor.expand_levels:
+            root = make_deep(size // 50)
+        self.model = Model(root=root)
+        self.uis = [self.model.edit_traits()]
+        self.editor = self.uis[0].get_editors('root')[0]
+        process_events()
+
+    def teardown(self, size, shape):
+        dispose_all(self.uis)
+
+    def time_expand(self, size, shape):
+        editor = self.editor
+        root = self.model.root
+        if shape == 'wide':
+            # The root is expanded when the tree is built, but its only child
+            # is not:
+            nid = editor._get_object_nid(root.children[0])
+            nid.setExpanded(True)
+        else:
+            editor.expand_levels(editor._get_object_nid(root), size)
+        process_events()
@@ -0,0 +1,54 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Benchmarks of building UIs for large generated Views.
+"""
+
+from traits.api import Bool, Float, HasTraits, Int, Str
+from traitsui.api import Group, Item, View
+
+from . import dispose_all, process_events
+
+# The trait types used for the generated traits, in turn:
+TRAIT_TYPES = [Str, Int, Float, Bool]
+
+
+def make_object(size):
+    """ Returns an object with 'size' traits of various types.
+    """
+    traits = dict(('trait_%d' % i, TRAIT_TYPES[i % len(TRAIT_TYPES)]())
+                  for i in range(size))
+    klass = type('Generated%d' % size, (HasTraits,), traits)
+    return klass()
+
+
+def make_view(size, layout, group_size=20):
+    """ Returns a View of 'size' items, in groups of 'group_size' items.
+    """
+    groups = [
+        Group(*[Item('trait_%d' % j)
+                for j in range(i, min(i + group_size, size))],
+              label='Group %d' % (i // group_size))
+        for i in range(0, size, group_size)
+    ]
+    return View(Group(*groups, layout=layout), scrollable=True)
+
+
+class UIBuild(object):
+    """ Times building (and showing) a UI.
+    """
+
+    params = [[100, 1000], ['normal', 'tabbed']]
+    param_names = ['items', 'layout']
+
+    def setup(self, size, layout):
+        self.object = make_object(size)
+        self.view = make_view(size, layout)
+        self.uis = []
+
+    def teardown(self, size, layout):
+        dispose_all(self.uis)
+
+    def time_edit_traits(self, size, layout):
+        self.uis.append(self.object.edit_traits(view=self.view))
+        process_events()
@@ -0,0 +1,60 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Benchmarks of the cost of 'visible_when' and 'enabled_when' conditions,
+    which are evaluated after every change of the context objects (such as
+    each keystroke in a text field).
+"""
+
+from traits.api import Enum, HasTraits, Int, Str
+from traitsui.api import Item, View
+
+from . import dispose_all, process_events
+
+
+class Form(HasTraits):
+
+    mode = Enum('a', 'b', 'c')
+
+    text = Str
+
+    count = Int
+
+
+def make_view(size):
+    """ Returns a View with 'size' conditional items.
+    """
+    items = [Item('mode'), Item('text')]
+    for i in range(size):
+        items.append(Item('count', label='Count %d' % i,
+                          visible_when="mode == '%s'" % 'abc'[i % 3],
+                          enabled_when='len(text) > %d' % (i % 5)))
+    return View(*items, scrollable=True)
+
+
+class Keystroke(object):
+    """ Times typing text into a field of a UI with many conditions.
+    """
+
+    params = [10, 100, 1000]
+    param_names = ['conditions']
+
+    def setup(self, size):
+        self.form = Form()
+        self.uis = [self.form.edit_traits(view=make_view(size))]
+        process_events()
+
+    def teardown(self, size):
+        dispose_all(self.uis)
+
+    def time_keystrokes(self, size):
+        form = self.form
+        for i in range(20):
+            form.text += 'x'
+        process_events()
+
+    def time_toggle_visibility(self, size):
+        form = self.form
+        for mode in 'bcab':
+            form.mode = mode
+        process_events()
@@ -0,0 +1,99 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Times expanding TreeEditor nodes with varying numbers of children.
+
+    Run with the Qt backend, e.g.::
+
+        QT_QPA_PLATFORM=offscreen ETS_TOOLKIT=qt4 python tree_editor_expand.py
+"""
+
+from __future__ import print_function
+
+import time
+
+from traits.api import HasTraits, Instance, List, Str
+from traitsui.api import Item, TreeEditor, TreeNode, View
+
+
+class Folder(HasTraits):
+
+    name = Str
+
+    children = List
+
+
+class Leaf(HasTraits):
+
+    name = Str
+
+
+tree_editor = TreeEditor(
+    nodes=[
+        TreeNode(node_for=[Folder], children='children', label='name'),
+        TreeNode(node_for=[Leaf], label='name'),
+    ],
+    editable=False,
+    hide_root=False,
+)
+
+
+class Model(HasTraits):
+
+    root = Instance(Folder)
+
+    traits_view = View(Item('root', editor=tree_editor, show_label=False))
+
+
+def make_folder(size):
+    """ Returns a folder with 'size' leaves inside a sub-folder.
+    """
+    leaves = [Leaf(name='leaf %d' % i) for i in range(size)]
+    return Folder(name='root',
+                  children=[Folder(name='folder', children=leaves)])
+
+
+def time_expand(size):
+    """ Returns the time taken to expand a folder holding 'size' leaves.
+    """
+    model = Model(root=make_folder(size))
+    ui = model.edit_traits()
+    try:
+        editor = ui.get_editors('root')[0]
+        folder = model.root.children[0]
+        nid = editor._get_object_nid(folder, 'children')
+        start = time.time()
+        nid.setExpanded(True)
+        return time.time() - start
+    finally:
+        ui.dispose()
+
+
+def time_append(size):
+    """ Returns the time taken to append 'size' leaves to an expanded folder.
+    """
+    model = Model(root=make_folder(0))
+    ui = model.edit_traits()
+    try:
+        editor = ui.get_editors('root')[0]
+        folder = model.root.children[0]
+        nid = editor._get_object_nid(folder, 'children')
+        editor._expand_node(nid)
+        nid.setExpanded(True)
+        leaves = [Leaf(name='leaf %d' % i) for i in range(size)]
+        start = time.time()
+        folder.children.extend(leaves)
+        return time.time() - start
+    finally:
+        ui.dispose()
+
+
+def main(sizes=(100, 1000, 10000, 20000)):
+    print('{:>8} {:>12} {:>12}'.format('children', 'expand (s)', 'append (s)'))
+    for size in sizes:
+        print('{:>8} {:>12.4f} {:>12.4f}'.format(
+            size, time_expand(size), time_append(size)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  License: BSD Style.
+
+""" Stress test for TreeEditor bookkeeping: performs many random mutations of
+    the children of a node with a very large number of children, then checks
+    that the tree matches the model.
+
+    Run with the Qt backend, e.g.::
+
+        QT_QPA_PLATFORM=offscreen ETS_TOOLKIT=qt4 python tree_editor_stress.py
+"""
+
+from __future__ import print_function
+
+import random
+import time
+
+from traits.api import HasTraits, Instance, List, Str
+from traitsui.api import Item, TreeEditor, TreeNode, View
+
+
+class Folder(HasTraits):
+
+    name = Str
+
+    children = List
+
+
+tree_editor = TreeEditor(
+    nodes=[TreeNode(node_for=[Folder], children='children', label='name')],
+    editable=False,
+    hide_root=False,
+)
+
+
+class Model(HasTraits):
+
+    root = Instance(Folder)
+
+    traits_view = View(Item('root', editor=tree_editor, show_label=False))
+
+
+def mutate(children, rng):
+    """ Applies one random mutation to a list of children.
+    """
+    choice = rng.randint(0, 3)
+    index = rng.randint(0, len(children) - 1)
+    if choice == 0:
+        children.insert(index, Folder(name='inserted'))
+    elif choice == 1:
+        del children[index]
+    elif choice == 2:
+        children[index] = Folder(name='replaced')
+    else:
+        # Delete a node and rename one of its siblings, as a user would:
+        node = children[index]
+        del children[index]
+        children[min(index, len(children) - 1)].name = node.name
+
+
+def main(size=100000, mutations=10000, seed=0):
+    rng = random.Random(seed)
+    root = Folder(name='root',
+                  children=[Folder(name='child %d' % i) for i in range(size)])
+    ui = Model(root=root).edit_traits()
+    try:
+        editor = ui.get_editors('root')[0]
+        nid = editor._get_object_nid(root, 'children')
+
+        start = time.time()
+        for i in range(mutations):
+            mutate(root.children, rng)
+        elapsed = time.time() - start
+
+        assert nid.childCount() == len(root.children)
+        for i in range(0, len(root.children), max(1, size // 1000)):
+            child = root.children[i]
+            cnid = editor._get_object_nid(child, 'children')
+            assert editor._node_index(cnid)[2] == i
+            assert cnid.text(0) == child.name
+
+        print('{} mutations on {} children: {:.3f}s'.format(
+            mutations, size, elapsed))
+    finally:
+        ui.dispose()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,337 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2017, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the support for the conditions controlling the state of editors,
+    buttons and actions (such as 'visible_when', 'enabled_when' and
+    'checked_when' expressions).
+
+    Each condition is parsed once, to find out which traits it reads, so that
+    it only needs to be evaluated again when one of those traits changes.
+    Conditions whose dependencies cannot be determined (for example, because
+    they call a method) are evaluated again whenever anything changes.
+"""
+
+#-------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import ast
+
+from traits.api import HasTraits
+
+from .helper import COMPILE_CACHE_SIZE, compiled
+
+#-------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------
+
+# The builtin functions which only read their arguments, and so can be called
+# by a condition without hiding what it depends on:
+PURE_BUILTINS = frozenset([
+    'abs', 'all', 'any', 'bool', 'float', 'int', 'isinstance', 'len', 'long',
+    'max', 'min', 'repr', 'round', 'str', 'sum', 'unicode'
+])
+
+# The parsed conditions, keyed by source:
+_conditions = {}
+
+#-------------------------------------------------------------------------
+#  'Condition' class:
+#-------------------------------------------------------------------------
+
+
+class Condition(object):
+    """ A parsed condition.
+    """
+
+    __slots__ = ('source', 'code', 'names')
+
+    def __init__(self, source):
+        #: The source of the condition:
+        self.source = source
+
+        #: The code object evaluating the condition:
+        self.code = compiled(source)
+
+        #: The names read by the condition, as tuples of a name and (if the
+        #: condition reads one of its attributes) an attribute name, or None
+        #: if they cannot be determined:
+        self.names = _names_read(source)
+
+    #-------------------------------------------------------------------------
+    #  Returns the traits read by the condition in a specified context:
+    #-------------------------------------------------------------------------
+
+    def traits(self, context, object=None):
+        """ Returns the list of (object, trait name) pairs read by the
+            condition when it is evaluated in *context*, whose other names
+            are looked up on the traits of *object* (if any), or None if the
+            condition may depend on other values.
+        """
+        if self.names is None:
+            return None
+
+        traits = []
+        for names in self.names:
+            name = names[0]
+            if name in context:
+                if len(names) == 1:
+                    continue
+                target, trait_name = context[name], names[1]
+            elif (object is not None) and (object.trait(name) is not None):
+                if len(names) > 1:
+                    # An attribute of a trait of the object (such as
+                    # 'child.flag') depends on the object the trait refers to:
+                    return None
+                target, trait_name = object, name
+            else:
+                # A global or builtin name:
+                continue
+
+            if not (isinstance(target, HasTraits) and
+                    _notifies(target.base_trait(trait_name))):
+                return None
+
+            traits.append((target, trait_name))
+
+        return traits
+
+    def __repr__(self):
+        return 'Condition(%r)' % self.source
+
+#-------------------------------------------------------------------------
+#  Returns the (cached) parsed version of a condition:
+#-------------------------------------------------------------------------
+
+
+def parse_condition(source):
+    """ Returns the parsed Condition for the expression *source*. Conditions
+        are only parsed the first time they are used.
+    """
+    condition = _conditions.get(source)
+    if condition is None:
+        if len(_conditions) >= COMPILE_CACHE_SIZE:
+            _conditions.clear()
+        condition = _conditions[source] = Condition(source)
+
+    return condition
+
+#-------------------------------------------------------------------------
+#  'ConditionContext' class:
+#-------------------------------------------------------------------------
+
+
+class ConditionContext(dict):
+    """ The namespace conditions are evaluated in: the names of a context,
+        plus the traits of a main object, which are only fetched when a
+        condition reads them.
+    """
+
+    def __init__(self, context, object=None):
+        super(ConditionContext, self).__init__(context)
+
+        #: The object whose traits are also defined by the namespace:
+        self.object = object
+
+    def __missing__(self, name):
+        object = self.object
+        if (object is None) or (object.trait(name) is None):
+            raise KeyError(name)
+        try:
+            return getattr(object, name)
+        except AttributeError:
+            # Events cannot be read:
+            raise KeyError(name)
+
+#-------------------------------------------------------------------------
+#  'ConditionCache' class:
+#-------------------------------------------------------------------------
+
+
+class ConditionCache(object):
+    """ Caches the values of conditions evaluated in a context (such as the
+        context of a context menu), until one of the traits they read
+        changes or the context changes.
+    """
+
+    def __init__(self, namespace=None):
+        #: The global namespace conditions are evaluated in:
+        self.namespace = {} if namespace is None else namespace
+
+        #: The current context:
+        self.context = None
+
+        # The cached values, keyed by condition source:
+        self._values = {}
+
+        # The sources of the cached values which must be discarded when the
+        # context is set, because their dependencies are not known:
+        self._volatile = set()
+
+        # The sources of the cached values depending on each trait, keyed by
+        # (object id, trait name):
+        self._dependents = {}
+
+        # The (object, trait name) pairs being listened to:
+        self._listeners = []
+
+    #-------------------------------------------------------------------------
+    #  Sets the context conditions are evaluated in:
+    #-------------------------------------------------------------------------
+
+    def set_context(self, context):
+        """ Sets the context conditions are evaluated in, keeping the values
+            cached for the previous context if it contains the same objects.
+        """
+        old = self.context
+        if ((old is None) or (len(old) != len(context)) or
+                any(old.get(name, self) is not value
+                    for name, value in context.items())):
+            self.reset()
+        else:
+            for source in self._volatile:
+                self._values.pop(source, None)
+            self._volatile.clear()
+
+        self.context = context
+
+    #-------------------------------------------------------------------------
+    #  Returns the value of a condition:
+    #-------------------------------------------------------------------------
+
+    def evaluate(self, source):
+        """ Returns the value of the condition *source* in the current
+            context. Any exception raised by the condition is propagated.
+        """
+        try:
+            return self._values[source]
+        except KeyError:
+            pass
+
+        condition = parse_condition(source)
+        context = self.context
+        value = eval(condition.code, self.namespace, context)
+        traits = condition.traits(context)
+        if traits is None:
+            self._volatile.add(source)
+        else:
+            for object, name in traits:
+                self._depend_on(object, name, source)
+                if object.trait(name + '_items') is not None:
+                    self._depend_on(object, name + '_items', source)
+        self._values[source] = value
+
+        return value
+
+    #-------------------------------------------------------------------------
+    #  Discards all cached values:
+    #-------------------------------------------------------------------------
+
+    def reset(self):
+        """ Discards all of the cached values and stops listening to the
+            traits they depend on.
+        """
+        for object, name in self._listeners:
+            object.on_trait_change(self._trait_changed, name, remove=True)
+        self._listeners = []
+        self._dependents.clear()
+        self._values.clear()
+        self._volatile.clear()
+        self.context = None
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _depend_on(self, object, name, source):
+        """ Records that the value of a condition depends on a trait.
+        """
+        key = (id(object), name)
+        dependents = self._dependents.get(key)
+        if dependents is None:
+            dependents = self._dependents[key] = set()
+            object.on_trait_change(self._trait_changed, name)
+            self._listeners.append((object, name))
+        dependents.add(source)
+
+    def _trait_changed(self, object, name, new):
+        """ Discards the values depending on a trait which has changed.
+        """
+        for source in self._dependents.get((id(object), name), ()):
+            self._values.pop(source, None)
+
+#-------------------------------------------------------------------------
+#  Helper functions:
+#-------------------------------------------------------------------------
+
+
+class _Unknown(Exception):
+    """ Raised when the names read by a condition cannot be determined.
+    """
+
+
+class _NamesVisitor(ast.NodeVisitor):
+    """ Collects the names read by an expression.
+    """
+
+    def __init__(self):
+        self.names = set()
+
+    def visit_Name(self, node):
+        self.names.add((node.id,))
+
+    def visit_Attribute(self, node):
+        # Only a single attribute of a name can be tracked: the value of a
+        # chain such as 'object.child.flag' also depends on the traits of
+        # the object it passes through:
+        value = node.value
+        if not isinstance(value, ast.Name):
+            raise _Unknown
+        self.names.add((value.id, node.attr))
+
+    def visit_Call(self, node):
+        func = node.func
+        if not (isinstance(func, ast.Name) and func.id in PURE_BUILTINS):
+            raise _Unknown
+        self.generic_visit(node)
+
+    def _unknown(self, node):
+        raise _Unknown
+
+    visit_Lambda = visit_ListComp = visit_SetComp = visit_DictComp = \
+        visit_GeneratorExp = visit_Yield = _unknown
+
+
+def _names_read(source):
+    """ Returns the frozenset of names read by the expression *source*, or
+        None if they cannot be determined.
+    """
+    try:
+        tree = ast.parse(source.lstrip(' \t'), mode='eval')
+        visitor = _NamesVisitor()
+        visitor.visit(tree)
+    except (_Unknown, SyntaxError):
+        return None
+
+    return frozenset(visitor.names)
+
+
+def _notifies(trait):
+    """ Returns whether changes to a trait are notified.
+    """
+    type = trait.type
+    if type == 'property':
+        return trait.depends_on is not None
+
+    return type in ('trait', 'event', 'delegate', 'constant')
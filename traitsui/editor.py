@@ -48,6 +48,10 @@ from .context_value import ContextValue
 
 from .undo import UndoItem
 
+from . import profiling
+
+from .helper import compiled
+
 from .item import Item
 
 #-------------------------------------------------------------------------
@@ -162,6 +166,7 @@ class Editor(HasPrivateTraits):
     def prepare(self, parent):
         """ Finishes setting up the editor.
         """
+        start = profiling.start()
         name = self.extended_name
         if name != 'None':
             self.context_object.on_trait_change(self._update_editor, name,
@@ -169,6 +174,8 @@ class Editor(HasPrivateTraits):
         self.init(parent)
         self._sync_values()
         self.update_editor()
+        if start is not None:
+            profiling.editor_built(self, start)
 
     #-------------------------------------------------------------------------
     #  Finishes initializing the editor by creating the underlying toolkit
@@ -360,7 +367,8 @@ class Editor(HasPrivateTraits):
         # been modified. In this case, we need to rebind the current object
         # being edited:
         if object is not self.object:
-            self.object = eval(self.object_name, globals(), self.ui.context)
+            self.object = eval(compiled(self.object_name), globals(),
+                               self.ui.context)
 
         # If the editor has gone away for some reason, disconnect and exit:
         if self.control is None:
@@ -376,7 +384,12 @@ class Editor(HasPrivateTraits):
         # If the change was not caused by the editor itself:
         if not self._no_update:
             # Update the editor control to reflect the current object state:
+            start = profiling.start()
             self.update_editor()
+            if start is not None:
+                profiling.editor_updated(self, start)
+        elif profiling.enabled:
+            profiling.editor_dropped(self)
 
     #-------------------------------------------------------------------------
     #  Logs a change made in the editor:
@@ -446,7 +459,7 @@ class Editor(HasPrivateTraits):
         else:
             object, name = self.ui.context[name[: col]], name[col + 1:]
 
-        return (object, name, eval("lambda obj=object: obj." + name))
+        return (object, name, eval(compiled("lambda obj=object: obj." + name)))
 
     #-------------------------------------------------------------------------
     #  Initializes and synchronizes (as needed) editor traits with the value of
@@ -523,9 +536,8 @@ class Editor(HasPrivateTraits):
                     user_ref += ('.' + user_name[: col])
                     user_name = user_name[col + 1:]
 
-            user_value = compile('%s.%s' % (user_ref, user_name),
-                                 '<string>', 'eval')
-            user_ref = compile(user_ref, '<string>', 'eval')
+            user_value = compiled('%s.%s' % (user_ref, user_name))
+            user_ref = compiled(user_ref)
 
             if mode in ('from', 'both'):
 
@@ -31,7 +31,7 @@ import logging
 
 from traits.api import HasPrivateTraits, Callable, Str, Bool, Event, Any, Property
 
-from .helper import enum_values_changed
+from .helper import enum_values_changed, invalidate_enum_values
 
 from .toolkit import toolkit_object
 
@@ -297,9 +297,14 @@ class EditorWithListFactory(EditorFactory):
     #  Recomputes the mappings whenever the 'values' trait is changed:
     #-------------------------------------------------------------------------
 
-    def _values_changed(self):
+    def _values_changed(self, old, new):
         """ Recomputes the mappings whenever the **values** trait is changed.
         """
+        # Results shared with other editors for the old values may be stale:
+        if old is not None:
+            invalidate_enum_values(old)
+        invalidate_enum_values(new)
+
         self._names, self._mapping, self._inverse_mapping = \
             enum_values_changed(self.values)
 
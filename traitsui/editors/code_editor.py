@@ -25,7 +25,7 @@ useful for tools such as debuggers.
 
 from __future__ import absolute_import
 
-from traits.api import Instance, Str, Color, Enum, Bool
+from traits.api import Instance, Str, Color, Enum, Bool, Int
 
 from ..editor_factory import EditorFactory
 
@@ -86,6 +86,11 @@ class ToolkitEditorFactory(EditorFactory):
     # Is user input set on every change?
     auto_set = Bool(True)
 
+    # The number of milliseconds to wait after a change before updating the
+    # trait from the editor, or the editor from the trait, so that bursts of
+    # changes to a large document cause a single update (Qt only):
+    update_delay = Int(0)
+
     # Should the editor auto-scroll when a new **selected_line** value is set?
     auto_scroll = Bool(True)
 
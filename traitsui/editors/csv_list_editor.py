@@ -24,7 +24,7 @@ from traits.api import Str, Int, Float, Enum, Range, Bool, Trait, TraitError
 from traits.trait_handlers import RangeTypes
 
 from .text_editor import TextEditor
-from ..helper import enum_values_changed
+from ..helper import common_length, compiled, enum_values_changed
 
 
 def _eval_list_str(s, sep=',', item_eval=None,
@@ -54,15 +54,22 @@ def _eval_list_str(s, sep=',', item_eval=None,
     """
     if item_eval is None:
         item_eval = lambda x: x
+    return [item_eval(x.strip()) for x in
+            _split_list_str(s, sep, ignore_trailing_sep)]
+
+
+def _split_list_str(s, sep=',', ignore_trailing_sep=True):
+    """Split a string into the (unstripped) strings of its list items.
+
+    The parameters are the same as those of `_eval_list_str`.
+    """
     s = s.strip()
     if sep is not None and ignore_trailing_sep and s.endswith(sep):
         s = s[:-len(sep)]
         s = s.rstrip()
     if s == '':
-        values = []
-    else:
-        values = [item_eval(x.strip()) for x in s.split(sep)]
-    return values
+        return []
+    return s.split(sep)
 
 
 def _format_list_str(values, sep=',', item_format=str):
@@ -91,10 +98,66 @@ def _format_list_str(values, sep=',', item_format=str):
         joiner = ' '
     else:
         joiner = sep + ' '
-    s = joiner.join(item_format(x) for x in values)
+    s = joiner.join(map(item_format, values))
     return s
 
 
+class _ListStrEvaluator(object):
+    """Convert strings into lists, remembering the previous conversion.
+
+    Each keystroke in a CSVListEditor with `auto_set` converts the whole
+    text of the editor (twice: once to set the trait, and once more to
+    check whether the text needs to be updated).  This returns the previous
+    list when the text is unchanged, and otherwise only evaluates the items
+    that differ from those of the previous call.
+
+    If `strip` is False, the items are passed to `item_eval` without
+    removing surrounding whitespace first, which is faster for evaluation
+    functions such as `int` and `float` that ignore it anyway.
+    """
+
+    def __init__(self, sep=',', item_eval=None, ignore_trailing_sep=True,
+                 strip=True):
+        if item_eval is None:
+            item_eval = lambda x: x
+        self.sep = sep
+        self.item_eval = item_eval
+        self.ignore_trailing_sep = ignore_trailing_sep
+        self.strip = strip
+        self._text = None
+        self._items = None
+        self._values = None
+
+    def __call__(self, s):
+        if s == self._text:
+            return list(self._values)
+
+        items = _split_list_str(s, self.sep, self.ignore_trailing_sep)
+        old_items = self._items
+        if old_items is None:
+            values = self._eval_items(items)
+        else:
+            # Only evaluate the span of items that differ from the previous
+            # call:
+            limit = min(len(items), len(old_items))
+            start = common_length(items, old_items, limit)
+            end = common_length(items, old_items, limit - start, True)
+            values = (self._values[:start] +
+                      self._eval_items(items[start:len(items) - end]) +
+                      self._values[len(old_items) - end:])
+
+        self._text, self._items, self._values = s, items, values
+        return list(values)
+
+    def _eval_items(self, items):
+        """Evaluate a list of item strings.
+        """
+        item_eval = self.item_eval
+        if self.strip:
+            return [item_eval(x.strip()) for x in items]
+        return list(map(item_eval, items))
+
+
 def _validate_range_value(range_object, object, name, value):
     """Validate a Range value.
 
@@ -131,8 +194,8 @@ def _validate_range_value(range_object, object, name, value):
         is float and the input value is an int, the return
         value will be a float).
     """
-    low = eval(range_object._low)
-    high = eval(range_object._high)
+    low = eval(compiled(range_object._low))
+    high = eval(compiled(range_object._high))
     if low is None and high is None:
         if isinstance(value, RangeTypes):
             return value
@@ -284,17 +347,17 @@ class CSVListEditor(TextEditor):
         # given inner trait.
         if it.is_trait_type(Int) or it.is_trait_type(Float) or \
                 it.is_trait_type(Str):
-            evaluate = lambda s: _eval_list_str(
-                s,
+            # int() and float() ignore surrounding whitespace themselves.
+            evaluate = _ListStrEvaluator(
                 sep=self.sep,
                 item_eval=it.trait_type.evaluate,
-                ignore_trailing_sep=self.ignore_trailing_sep)
+                ignore_trailing_sep=self.ignore_trailing_sep,
+                strip=it.is_trait_type(Str))
             fmt_func = lambda vals: _format_list_str(vals,
                                                      sep=self.sep)
         elif it.is_trait_type(Enum):
             values, mapping, inverse_mapping = enum_values_changed(it)
-            evaluate = lambda s: _eval_list_str(
-                s,
+            evaluate = _ListStrEvaluator(
                 sep=self.sep,
                 item_eval=mapping.__getitem__,
                 ignore_trailing_sep=self.ignore_trailing_sep)
@@ -315,19 +378,25 @@ class CSVListEditor(TextEditor):
             typ = type(defval)
 
             if range_object.validate is None:
-                # This will be the case for dynamic ranges.
+                # This will be the case for dynamic ranges.  The bounds can
+                # change between calls, so every item is validated again
+                # rather than reusing the values of the previous call.
                 item_eval = lambda s: _validate_range_value(
                     range_object, object, name, typ(s))
+                evaluate = lambda s: _eval_list_str(
+                    s,
+                    sep=self.sep,
+                    item_eval=item_eval,
+                    ignore_trailing_sep=self.ignore_trailing_sep)
             else:
                 # Static ranges have a validate method.
                 item_eval = lambda s: range_object.validate(
                     object, name, typ(s))
+                evaluate = _ListStrEvaluator(
+                    sep=self.sep,
+                    item_eval=item_eval,
+                    ignore_trailing_sep=self.ignore_trailing_sep)
 
-            evaluate = lambda s: _eval_list_str(
-                s,
-                sep=self.sep,
-                item_eval=item_eval,
-                ignore_trailing_sep=self.ignore_trailing_sep)
             fmt_func = lambda vals: _format_list_str(vals,
                                                      sep=self.sep)
         else:
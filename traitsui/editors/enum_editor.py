@@ -63,6 +63,11 @@ class ToolkitEditorFactory(EditorWithListFactory):
     # Display modes supported for a custom style editor:
     mode = Mode
 
+    # Should the simple style editor use a virtual list model with an
+    # incremental search completer, for enumerations with a very large number
+    # of values? (Qt only)
+    large_vocabulary = Bool(False)
+
     #-------------------------------------------------------------------------
     #  'Editor' factory methods:
     #-------------------------------------------------------------------------
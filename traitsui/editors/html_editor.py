@@ -25,7 +25,7 @@
 
 from __future__ import absolute_import
 
-from traits.api import Str, false
+from traits.api import Int, Str, false
 
 from ..basic_editor_factory import BasicEditorFactory
 
@@ -65,6 +65,14 @@ class ToolkitEditorFactory(BasicEditorFactory):
     # Should implicit text formatting be converted to HTML?
     format_text = false
 
+    # Should the text formatting be done in a background thread? (Qt only)
+    format_in_background = false
+
+    # The number of milliseconds to wait after a change of the trait before
+    # updating the view, so that bursts of changes cause a single update (Qt
+    # only):
+    update_delay = Int(0)
+
     # External objects referenced in the HTML are relative to this url
     base_url = Str
 
@@ -43,7 +43,8 @@ class ImageEditor(BasicEditorFactory):
 
     # The optional image resource to be displayed by the editor (if not
     # specified, the editor's object value is used as the ImageResource to
-    # display):
+    # display; on Qt the value may also be a uint8 or uint16 NumPy array of
+    # shape (height, width), (height, width, 3) or (height, width, 4)):
     image = Image
 
     # The following traits are currently supported on Qt only
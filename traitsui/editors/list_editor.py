@@ -107,6 +107,10 @@ class ToolkitEditorFactory(EditorFactory):
     # Show a right-click context menu for the notebook tabs?  (Qt only)
     show_notebook_menu = Bool(False)
 
+    # Only create editors for the visible items of a long list, re-using them
+    # as the list is scrolled? (Qt only)
+    virtual = Bool(False)
+
     #-- Notebook Specific Traits ---------------------------------------------
 
     # Are notebook items deletable?
@@ -165,9 +169,16 @@ class ToolkitEditorFactory(EditorFactory):
     #  'Editor' factory methods:
     #-------------------------------------------------------------------------
 
+    def _get_simple_editor_class(self):
+        if self.virtual:
+            return toolkit_object('list_editor:VirtualEditor')
+        return super(ToolkitEditorFactory, self)._get_simple_editor_class()
+
     def _get_custom_editor_class(self):
         if self.use_notebook:
             return toolkit_object('list_editor:NotebookEditor')
+        if self.virtual:
+            return toolkit_object('list_editor:VirtualEditor')
         return toolkit_object('list_editor:CustomEditor')
 
 #-------------------------------------------------------------------------
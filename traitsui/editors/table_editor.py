@@ -45,7 +45,7 @@ from ..editor_factory import EditorFactory
 
 from ..handler import Handler
 
-from ..helper import Orientation
+from ..helper import Orientation, compiled
 
 from ..item import Item
 
@@ -485,12 +485,12 @@ class BaseTableEditor(object):
         """ Returns whether the action should be defined in the user interface.
         """
         if action.defined_when != '':
-            if not eval(action.defined_when, globals(),
+            if not eval(compiled(action.defined_when), globals(),
                         self._menu_context):
                 return False
 
         if action.visible_when != '':
-            if not eval(action.visible_when, globals(),
+            if not eval(compiled(action.visible_when), globals(),
                         self._menu_context):
                 return False
 
@@ -519,7 +519,7 @@ class BaseTableEditor(object):
             if method_name.find('(') < 0:
                 method_name += '()'
             try:
-                eval(method_name, globals(), context)
+                eval(compiled(method_name), globals(), context)
             except:
                 # fixme: Should the exception be logged somewhere?
                 pass
@@ -545,7 +545,8 @@ class BaseTableEditor(object):
         object trait based on the result, which is assumed to be a Boolean.
         """
         if condition != '':
-            value = bool(eval(condition, globals(), self._menu_context))
+            value = bool(eval(compiled(condition), globals(),
+                              self._menu_context))
             setattr(object, trait, value)
 
 #-------------------------------------------------------------------------
@@ -65,6 +65,9 @@ class TabularEditor(BasicEditorFactory):
     # trait should be a list of objects derived from HasTraits. Also,
     # performance can be affected when very long lists are used, since enabling
     # this feature adds and removed Traits listeners to each item in the list.
+    # Whether each item can be edited and dragged is only cached while this is
+    # enabled (or the adapter's 'uniform_flags' is set), since otherwise the
+    # editor is not told when the items change.
     auto_update = Bool(False)
 
     # The optional extended name of the trait to synchronize the selection
@@ -25,6 +25,8 @@
 
 from __future__ import absolute_import
 
+from collections import OrderedDict
+from inspect import ismethod
 from operator import itemgetter
 
 from traits.api import BaseTraitHandler, CTrait, Enum, TraitError
@@ -82,10 +84,86 @@ def commatize(value):
 #-------------------------------------------------------------------------
 
 
-def enum_values_changed(values, strfunc=unicode):
+# The maximum number of value sets remembered by 'enum_values_changed':
+ENUM_VALUES_CACHE_SIZE = 256
+
+# Cached results of 'enum_values_changed', keyed by (id(source), strfunc key):
+_enum_values_cache = OrderedDict()
+
+
+def enum_values_changed(values, strfunc=unicode, key=None):
     """ Recomputes the mappings for a new set of enumeration values.
+
+        Results are shared by all callers passing the same (unchanged) values
+        and string function, so they must not be modified. Since a bound
+        method differs for every editor, callers formatting values with one
+        should pass a hashable 'key' identifying how the values are formatted;
+        otherwise the result is not cached.
+
+        Only the length of the values is checked for in place changes, so
+        code replacing values in place must call 'invalidate_enum_values'.
+    """
+    source = values
+    if not isinstance(values, (dict,) + SequenceTypes):
+        if isinstance(source, CTrait):
+            source = source.handler
+        if not isinstance(source, BaseTraitHandler):
+            raise TraitError("Invalid value for 'values' specified")
+
+    if key is None:
+        if ismethod(strfunc):
+            return _enum_values_for(values, strfunc)
+        key = strfunc
+
+    try:
+        cache_key = (id(source), key)
+        entry = _enum_values_cache.pop(cache_key)
+    except KeyError:
+        entry = None
+    except TypeError:
+        # Unhashable key, so the result can't be cached:
+        return _enum_values_for(values, strfunc)
+
+    size = _enum_values_size(source)
+    if entry is not None:
+        cached_source, cached_size, result = entry
+        if (cached_source is source) and (cached_size == size):
+            _enum_values_cache[cache_key] = entry
+            return result
+
+    result = _enum_values_for(values, strfunc)
+    _enum_values_cache[cache_key] = (source, size, result)
+    while len(_enum_values_cache) > ENUM_VALUES_CACHE_SIZE:
+        _enum_values_cache.popitem(last=False)
+
+    return result
+
+
+def invalidate_enum_values(values):
+    """ Discards any cached 'enum_values_changed' results for a set of
+        enumeration values, so they are recomputed the next time they are
+        used.
     """
+    if isinstance(values, CTrait):
+        values = values.handler
+    ident = id(values)
+    for cache_key in [k for k in _enum_values_cache if k[0] == ident]:
+        del _enum_values_cache[cache_key]
 
+
+def _enum_values_size(source):
+    """ Returns the identity and length of the values held by a value
+        source, used to cheaply detect values added to or removed from it.
+    """
+    if isinstance(source, BaseTraitHandler):
+        source = source.map if source.is_mapped else source.values
+
+    return (id(source), len(source))
+
+
+def _enum_values_for(values, strfunc):
+    """ Computes the mappings for a set of enumeration values.
+    """
     if isinstance(values, dict):
         data = [(strfunc(v), n) for n, v in values.items()]
         if len(data) > 0:
@@ -115,3 +193,110 @@ def enum_values_changed(values, strfunc=unicode):
         inverse_mapping[value] = name
 
     return (names, mapping, inverse_mapping)
+
+#-------------------------------------------------------------------------
+#  Returns the number of leading or trailing items two sequences share:
+#-------------------------------------------------------------------------
+
+
+def common_length(a, b, limit=None, reverse=False):
+    """ Returns the number of leading (or, if *reverse* is True, trailing)
+        items, up to *limit*, that the sequences *a* and *b* have in common.
+
+        The sequences are compared in slices, using a binary search, so that
+        long lists of strings are compared at C speed.
+    """
+    na, nb = len(a), len(b)
+    low, high = 0, min(na, nb)
+    if limit is not None:
+        high = min(high, limit)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if reverse:
+            same = a[na - mid:na - low] == b[nb - mid:nb - low]
+        else:
+            same = a[low:mid] == b[low:mid]
+        if same:
+            low = mid
+        else:
+            high = mid - 1
+
+    return low
+
+#-------------------------------------------------------------------------
+#  Returns whether a method of an object overrides the one of a base class:
+#-------------------------------------------------------------------------
+
+
+def is_overridden(object, name, base):
+    """ Returns whether the method *name* of *object* is not the one defined
+        by the class *base* (because a subclass, or the object itself,
+        overrides it).
+    """
+    if name in getattr(object, '__dict__', ()):
+        return True
+
+    for klass in type(object).__mro__:
+        if name in klass.__dict__:
+            return klass is not base
+
+    return True
+
+#-------------------------------------------------------------------------
+#  Compiles expressions, sharing the code objects across the process:
+#-------------------------------------------------------------------------
+
+# The maximum number of code objects remembered by 'compiled':
+COMPILE_CACHE_SIZE = 1024
+
+# The code objects returned by 'compiled', keyed by (source, mode):
+_compile_cache = OrderedDict()
+
+# The number of cache hits and misses of 'compiled':
+_compile_stats = {'hits': 0, 'misses': 0}
+
+
+def compiled(source, mode='eval'):
+    """ Returns the code object for the expression (or, depending on *mode*,
+        statements) *source*, ready to be passed to **eval**.
+
+        Code objects are kept in a process-wide LRU cache of up to
+        COMPILE_CACHE_SIZE entries, shared by all the places TraitsUI
+        evaluates strings (object names, 'when' conditions, synced trait
+        names, table expressions...). If *source* is not a string (for
+        example, if it is already a code object), it is returned unchanged.
+    """
+    if not isinstance(source, basestring):
+        return source
+
+    key = (source, mode)
+    code = _compile_cache.pop(key, None)
+    if code is None:
+        # Like eval, ignore leading spaces and tabs in expressions:
+        if mode == 'eval':
+            code = compile(source.lstrip(' \t'), '<string>', mode)
+        else:
+            code = compile(source, '<string>', mode)
+        _compile_stats['misses'] += 1
+        if len(_compile_cache) >= COMPILE_CACHE_SIZE:
+            _compile_cache.popitem(last=False)
+    else:
+        _compile_stats['hits'] += 1
+    _compile_cache[key] = code
+
+    return code
+
+
+def compile_cache_info():
+    """ Returns a dictionary with the number of 'hits' and 'misses' of the
+        compiled expression cache, its current 'size' and its 'maxsize'.
+    """
+    return dict(_compile_stats, size=len(_compile_cache),
+                maxsize=COMPILE_CACHE_SIZE)
+
+
+def clear_compile_cache():
+    """ Empties the compiled expression cache and resets its counters.
+    """
+    _compile_cache.clear()
+    _compile_stats['hits'] = _compile_stats['misses'] = 0
@@ -39,6 +39,8 @@ from .ui_traits import ContainerDelegate, EditorStyle
 
 from .editor_factory import EditorFactory
 
+from .helper import compiled
+
 #-------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------
@@ -327,7 +329,7 @@ class Item(ViewSubElement):
         if self.help != '':
             return self.help
 
-        object = eval(self.object_, globals(), ui.context)
+        object = eval(compiled(self.object_), globals(), ui.context)
 
         return object.base_trait(self.name).get_help()
 
@@ -359,7 +361,7 @@ class Item(ViewSubElement):
             return label
 
         name = self.name
-        object = eval(self.object_, globals(), ui.context)
+        object = eval(compiled(self.object_), globals(), ui.context)
         trait = object.base_trait(name)
         label = user_name_for(name)
         tlabel = trait.label
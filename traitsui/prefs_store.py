@@ -0,0 +1,394 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2017, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the stores used to persist user interface preferences, such as
+    window positions and editor column widths.
+
+    The stores keep the preferences of the current process in memory, and only
+    write changed entries back to disk in batches: after a short delay, when
+    **flush** is called, or when the process exits. Preferences which are not
+    in a store are read from the legacy Traits UI shelve database (if any).
+"""
+
+#-------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import atexit
+import logging
+import os
+import shelve
+import sqlite3
+import tempfile
+import threading
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from traits.api import Any, Dict, Float, HasPrivateTraits, Str
+from traits.trait_base import traits_home
+
+logger = logging.getLogger(__name__)
+
+#-------------------------------------------------------------------------
+#  'PrefsStore' class:
+#-------------------------------------------------------------------------
+
+
+class PrefsStore(HasPrivateTraits):
+    """ Base class for preference stores, which cache the preferences in
+        memory and write the changed entries back in batches.
+
+        Preferences are pickled when they are set, so later changes to the
+        objects passed to **set** are not saved, and each **get** returns a
+        new copy.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The number of seconds to wait before writing changed preferences (if
+    # zero, changes are only written by 'flush'):
+    delay = Float(2.0)
+
+    # The name of the legacy shelve database to read the preferences missing
+    # from the store from (if empty, no legacy database is used):
+    legacy_filename = Str
+
+    # The pickled preferences read so far, keyed by id
+    _cache = Dict
+
+    # The pickled preferences changed since the last flush, keyed by id
+    _dirty = Dict
+
+    # The pending write-behind timer (if any)
+    _timer = Any
+
+    # Lock protecting the cache and the pending changes
+    _lock = Any
+
+    # The open legacy shelve database (False if it could not be opened)
+    _legacy = Any
+
+    #-------------------------------------------------------------------------
+    #  Initializes the object:
+    #-------------------------------------------------------------------------
+
+    def __init__(self, **traits):
+        """ Initializes the object.
+        """
+        super(PrefsStore, self).__init__(**traits)
+        self._lock = threading.RLock()
+
+    #-------------------------------------------------------------------------
+    #  Returns the preferences for an id:
+    #-------------------------------------------------------------------------
+
+    def get(self, id, default=None):
+        """ Returns (a copy of) the preferences saved for *id*, or *default*
+            if there are none.
+        """
+        with self._lock:
+            data = self._cache.get(id)
+            if data is None and id not in self._cache:
+                data = self._read(id)
+                if data is None:
+                    data = self._read_legacy(id)
+                self._cache[id] = data
+        if data is None:
+            return default
+
+        return pickle.loads(data)
+
+    #-------------------------------------------------------------------------
+    #  Sets the preferences for an id:
+    #-------------------------------------------------------------------------
+
+    def set(self, id, prefs):
+        """ Saves the preferences for *id*. They are written to disk by the
+            next flush.
+        """
+        data = pickle.dumps(prefs, -1)
+        with self._lock:
+            self._cache[id] = self._dirty[id] = data
+            if self.delay > 0 and self._timer is None:
+                self._timer = timer = threading.Timer(self.delay, self.flush)
+                timer.daemon = True
+                timer.start()
+
+    #-------------------------------------------------------------------------
+    #  Writes any changed preferences:
+    #-------------------------------------------------------------------------
+
+    def flush(self):
+        """ Writes the preferences changed since the last flush.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            dirty = self._dirty
+            if not dirty:
+                return
+            self._dirty = {}
+            try:
+                self._write(dirty)
+            except Exception:
+                logger.exception('Unable to save user interface preferences')
+
+    #-------------------------------------------------------------------------
+    #  Writes any changes and releases any resources held by the store:
+    #-------------------------------------------------------------------------
+
+    def close(self):
+        """ Writes any changed preferences and releases any resources held by
+            the store.
+        """
+        self.flush()
+        with self._lock:
+            if self._legacy:
+                self._legacy.close()
+            self._legacy = None
+
+    #-------------------------------------------------------------------------
+    #  Reads the preferences for an id from the legacy database:
+    #-------------------------------------------------------------------------
+
+    def _read_legacy(self, id):
+        """ Returns the pickled preferences for *id* from the legacy shelve
+            database, or None. The database is opened (read-only) on first
+            use and kept open until the store is closed.
+        """
+        if (not self.legacy_filename) or (self._legacy is False):
+            return None
+
+        if self._legacy is None:
+            try:
+                self._legacy = shelve.open(self.legacy_filename, flag='r',
+                                           protocol=-1)
+            except Exception:
+                # There is no legacy database (or it is unreadable):
+                self._legacy = False
+                return None
+
+        try:
+            prefs = self._legacy.get(id)
+        except Exception:
+            logger.exception('Unable to read user interface preferences '
+                             'from %r', self.legacy_filename)
+            return None
+        if prefs is None:
+            return None
+
+        return pickle.dumps(prefs, -1)
+
+    #-- Methods to be implemented by subclasses ------------------------------
+
+    def _read(self, id):
+        """ Returns the pickled preferences for *id* from disk, or None.
+        """
+        raise NotImplementedError
+
+    def _write(self, entries):
+        """ Writes a dictionary of pickled preferences to disk.
+        """
+        raise NotImplementedError
+
+#-------------------------------------------------------------------------
+#  'PicklePrefsStore' class:
+#-------------------------------------------------------------------------
+
+
+class PicklePrefsStore(PrefsStore):
+    """ A preference store holding all of the preferences in a single pickle
+        file, which is read once and atomically replaced when it is written.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The name of the file holding the preferences
+    filename = Str
+
+    # The pickled preferences read from the file, keyed by id
+    _entries = Any
+
+    #-- PrefsStore Implementation --------------------------------------------
+
+    def _read(self, id):
+        """ Returns the pickled preferences for *id* from disk, or None.
+        """
+        if self._entries is None:
+            self._entries = self._load()
+
+        return self._entries.get(id)
+
+    def _write(self, entries):
+        """ Merges the changed entries into the file, so that entries written
+            by other processes since it was read are kept.
+        """
+        stored = self._load()
+        stored.update(entries)
+
+        directory = os.path.dirname(self.filename) or '.'
+        fd, temp_name = tempfile.mkstemp(dir=directory, prefix='.traits_ui')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                pickle.dump(stored, fh, -1)
+            if os.name == 'nt' and os.path.exists(self.filename):
+                os.remove(self.filename)
+            os.rename(temp_name, self.filename)
+        except:
+            if os.path.exists(temp_name):
+                os.remove(temp_name)
+            raise
+
+        self._entries = stored
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _load(self):
+        """ Returns the dictionary of pickled preferences held in the file.
+        """
+        try:
+            with open(self.filename, 'rb') as fh:
+                entries = pickle.load(fh)
+        except (IOError, OSError):
+            return {}
+        except Exception:
+            logger.exception('Unable to read user interface preferences '
+                             'from %r', self.filename)
+            return {}
+
+        if not isinstance(entries, dict):
+            return {}
+
+        return entries
+
+#-------------------------------------------------------------------------
+#  'SQLitePrefsStore' class:
+#-------------------------------------------------------------------------
+
+
+class SQLitePrefsStore(PrefsStore):
+    """ A preference store backed by an SQLite database, which is kept open
+        and written to in a single transaction per flush. SQLite's locking
+        makes it safe for several processes to share the database.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The name of the database file
+    filename = Str
+
+    # The open database connection
+    _connection = Any
+
+    #-- PrefsStore Implementation --------------------------------------------
+
+    def close(self):
+        """ Writes any changed preferences and closes the database.
+        """
+        super(SQLitePrefsStore, self).close()
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _read(self, id):
+        """ Returns the pickled preferences for *id* from disk, or None.
+        """
+        row = self._get_connection().execute(
+            'SELECT value FROM prefs WHERE id = ?', (id,)).fetchone()
+        if row is None:
+            return None
+
+        return bytes(row[0])
+
+    def _write(self, entries):
+        """ Writes the changed entries in a single transaction.
+        """
+        connection = self._get_connection()
+        with connection:
+            connection.executemany(
+                'INSERT OR REPLACE INTO prefs (id, value) VALUES (?, ?)',
+                [(id, sqlite3.Binary(data)) for id, data in entries.items()])
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _get_connection(self):
+        """ Returns the database connection, opening it if necessary.
+        """
+        if self._connection is None:
+            connection = sqlite3.connect(self.filename, timeout=10.0,
+                                         check_same_thread=False)
+            with connection:
+                connection.execute('CREATE TABLE IF NOT EXISTS prefs '
+                                   '(id TEXT PRIMARY KEY, value BLOB)')
+            self._connection = connection
+
+        return self._connection
+
+#-------------------------------------------------------------------------
+#  The preference store used by all user interfaces:
+#-------------------------------------------------------------------------
+
+_prefs_store = None
+
+
+def get_prefs_store():
+    """ Returns the preference store used to save user interface preferences,
+        creating the default SQLite store in the traits home directory if no
+        store has been set. The default store falls back to the preferences
+        saved in the legacy 'traits_ui' shelve database by older versions.
+    """
+    global _prefs_store
+
+    if _prefs_store is None:
+        home = traits_home()
+        _prefs_store = SQLitePrefsStore(
+            filename=os.path.join(home, 'traits_ui_prefs.sqlite'),
+            legacy_filename=os.path.join(home, 'traits_ui'))
+
+    return _prefs_store
+
+
+def set_prefs_store(store):
+    """ Sets the preference store used to save user interface preferences,
+        closing the previous store.
+    """
+    global _prefs_store
+
+    if _prefs_store is not None:
+        _prefs_store.close()
+    _prefs_store = store
+
+
+def flush_prefs():
+    """ Writes any changed user interface preferences to disk. This is called
+        automatically when the process exits.
+    """
+    if _prefs_store is not None:
+        _prefs_store.flush()
+
+
+atexit.register(flush_prefs)
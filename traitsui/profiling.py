@@ -0,0 +1,424 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2017, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Opt-in profiling of user interfaces, to find out which editors make a
+    user interface slow without attaching an external profiler.
+
+    Profiling is enabled by calling **enable** (or by setting the
+    TRAITSUI_PROFILE environment variable), or within a **profiled** block::
+
+        from traitsui import profiling
+
+        with profiling.profiled():
+            ui = model.edit_traits()
+            ...
+        print(profiling.report())
+
+    While it is enabled, the following are recorded:
+
+    - the time taken to build each kind of editor (Editor.prepare),
+    - the number and duration of editor updates caused by trait changes, and
+      the number of notifications dropped (because the editor caused the
+      change itself) or coalesced (by editors that delay their updates),
+    - the time taken by UI.prepare_ui and by panels adding their items,
+    - the number of cell data requests made to the Qt item models, per role.
+
+    When profiling is disabled, each hook only tests the module's **enabled**
+    flag.
+"""
+
+#-------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import os
+from contextlib import contextmanager
+from timeit import default_timer as clock
+
+from traits.api import (
+    Any, Button, Float, HasPrivateTraits, HasTraits, Int, List, Str)
+
+#-------------------------------------------------------------------------
+#  Profiling state:
+#-------------------------------------------------------------------------
+
+# Is profiling currently enabled?
+enabled = bool(os.environ.get('TRAITSUI_PROFILE'))
+
+# The statistics recorded so far, keyed by (kind, name):
+_stats = {}
+
+# The number of cell data requests, keyed by (model class name, role):
+_cell_data = {}
+
+#-------------------------------------------------------------------------
+#  '_Stats' class:
+#-------------------------------------------------------------------------
+
+
+class _Stats(object):
+    """ The statistics recorded for an editor, UI or panel.
+    """
+
+    __slots__ = ('calls', 'time', 'updates', 'update_time', 'dropped',
+                 'coalesced')
+
+    def __init__(self):
+        self.calls = self.updates = self.dropped = self.coalesced = 0
+        self.time = self.update_time = 0.0
+
+
+def _stats_for(kind, name):
+    """ Returns the statistics for a named editor, UI or panel.
+    """
+    key = (kind, name)
+    stats = _stats.get(key)
+    if stats is None:
+        stats = _stats[key] = _Stats()
+    return stats
+
+
+def _editor_name(editor):
+    """ Returns the name statistics for an editor are recorded under.
+    """
+    klass = editor.__class__
+    return '%s.%s(%s.%s)' % (klass.__module__, klass.__name__,
+                             editor.object_name, editor.name)
+
+#-------------------------------------------------------------------------
+#  Public API:
+#-------------------------------------------------------------------------
+
+
+def enable():
+    """ Starts recording profiling information.
+    """
+    global enabled
+    enabled = True
+
+
+def disable():
+    """ Stops recording profiling information (keeping what was recorded).
+    """
+    global enabled
+    enabled = False
+
+
+def reset():
+    """ Discards all of the profiling information recorded so far.
+    """
+    _stats.clear()
+    _cell_data.clear()
+
+
+@contextmanager
+def profiled(clear=True):
+    """ A context manager enabling profiling within a block (and, if *clear*
+        is True, discarding any information recorded before it).
+    """
+    global enabled
+    if clear:
+        reset()
+    was_enabled = enabled
+    enabled = True
+    try:
+        yield
+    finally:
+        enabled = was_enabled
+
+
+def report():
+    """ Returns the profiling information recorded so far, as a dictionary
+        of lists of dictionaries with the keys:
+
+        - 'editors': editor, builds, build_time, updates, update_time,
+          dropped and coalesced; sorted by total time,
+        - 'uis': view, calls and time,
+        - 'panels': group, calls and time,
+        - 'cell_data': model, role and calls.
+
+        Times are in seconds.
+    """
+    editors, uis, panels = [], [], []
+    for (kind, name), stats in _stats.items():
+        if kind == 'editor':
+            editors.append({
+                'editor': name,
+                'builds': stats.calls,
+                'build_time': stats.time,
+                'updates': stats.updates,
+                'update_time': stats.update_time,
+                'dropped': stats.dropped,
+                'coalesced': stats.coalesced,
+            })
+        else:
+            (uis if kind == 'ui' else panels).append({
+                'view' if kind == 'ui' else 'group': name,
+                'calls': stats.calls,
+                'time': stats.time,
+            })
+    editors.sort(key=lambda info: -(info['build_time'] +
+                                    info['update_time']))
+    uis.sort(key=lambda info: -info['time'])
+    panels.sort(key=lambda info: -info['time'])
+    cell_data = sorted(
+        ({'model': model, 'role': role, 'calls': calls}
+         for (model, role), calls in _cell_data.items()),
+        key=lambda info: -info['calls'])
+
+    return {'editors': editors, 'uis': uis, 'panels': panels,
+            'cell_data': cell_data}
+
+
+def show_inspector(**traits):
+    """ Displays a live view of the profiling information, and returns the
+        ProfileInspector displaying it.
+    """
+    inspector = ProfileInspector(**traits)
+    inspector.show()
+    return inspector
+
+#-------------------------------------------------------------------------
+#  Hooks called by the editors, UIs, panels and models:
+#-------------------------------------------------------------------------
+
+
+def start():
+    """ Returns the start time of an operation to be profiled, or None if
+        profiling is disabled.
+    """
+    if enabled:
+        return clock()
+    return None
+
+
+def editor_built(editor, start):
+    """ Records the time taken to build an editor.
+    """
+    stats = _stats_for('editor', _editor_name(editor))
+    stats.calls += 1
+    stats.time += clock() - start
+
+
+def editor_updated(editor, start):
+    """ Records the time taken by an editor update.
+    """
+    stats = _stats_for('editor', _editor_name(editor))
+    stats.updates += 1
+    stats.update_time += clock() - start
+
+
+def editor_dropped(editor):
+    """ Records a trait notification ignored by an editor.
+    """
+    _stats_for('editor', _editor_name(editor)).dropped += 1
+
+
+def editor_coalesced(editor):
+    """ Records a trait notification merged into an already pending update.
+    """
+    _stats_for('editor', _editor_name(editor)).coalesced += 1
+
+
+def ui_prepared(ui, start):
+    """ Records the time taken to prepare a user interface.
+    """
+    view = ui.view
+    name = ui.id or view.id or view.title or '<anonymous view>'
+    stats = _stats_for('ui', name)
+    stats.calls += 1
+    stats.time += clock() - start
+
+
+def items_added(panel, start):
+    """ Records the time taken by a panel to add the items of a group.
+    """
+    group = panel.group
+    name = group.id or group.label or '<group in %s>' % (
+        panel.ui.view.title or panel.ui.id or 'anonymous view')
+    stats = _stats_for('panel', name)
+    stats.calls += 1
+    stats.time += clock() - start
+
+
+def cell_data(model, role):
+    """ Records a cell data request made to an item model.
+    """
+    key = (model.__class__.__name__, int(role))
+    _cell_data[key] = _cell_data.get(key, 0) + 1
+
+#-------------------------------------------------------------------------
+#  Live inspector:
+#-------------------------------------------------------------------------
+
+
+class EditorProfile(HasTraits):
+    """ The profiling information for one kind of editor.
+    """
+
+    editor = Str
+
+    builds = Int
+
+    build_time = Float
+
+    updates = Int
+
+    update_time = Float
+
+    dropped = Int
+
+    coalesced = Int
+
+
+class TimeProfile(HasTraits):
+    """ The profiling information for a user interface or group.
+    """
+
+    name = Str
+
+    calls = Int
+
+    time = Float
+
+
+class CellDataProfile(HasTraits):
+    """ The number of cell data requests made to a model for a role.
+    """
+
+    model = Str
+
+    role = Int
+
+    calls = Int
+
+
+class ProfileInspector(HasPrivateTraits):
+    """ A view of the profiling information recorded so far, which can be
+        refreshed periodically.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The number of milliseconds between refreshes (0 means never)
+    interval = Int(1000)
+
+    # The profiling information for each editor
+    editors = List(EditorProfile)
+
+    # The profiling information for each user interface and group
+    uis = List(TimeProfile)
+
+    # The cell data requests made to each model
+    cell_data = List(CellDataProfile)
+
+    # Refreshes the information
+    refresh = Button('Refresh')
+
+    # Discards the information recorded so far
+    clear = Button('Reset')
+
+    # The user interface displaying the information
+    _ui = Any
+
+    # The timer used to refresh the information
+    _timer = Any
+
+    #-------------------------------------------------------------------------
+    #  HasTraits interface:
+    #-------------------------------------------------------------------------
+
+    def __init__(self, **traits):
+        super(ProfileInspector, self).__init__(**traits)
+        self.update()
+
+    def default_traits_view(self):
+        from .api import Group, HGroup, Item, TableEditor, View
+        from .table_column import ObjectColumn
+
+        def table(names):
+            return TableEditor(
+                columns=[ObjectColumn(name=name) for name in names],
+                editable=False, sortable=True)
+
+        return View(
+            Group(
+                Item('editors', show_label=False, editor=table(
+                    ['editor', 'builds', 'build_time', 'updates',
+                     'update_time', 'dropped', 'coalesced'])),
+                Item('uis', label='UIs and groups', show_label=False,
+                     editor=table(['name', 'calls', 'time'])),
+                Item('cell_data', show_label=False,
+                     editor=table(['model', 'role', 'calls'])),
+                layout='tabbed',
+            ),
+            HGroup(Item('refresh', show_label=False),
+                   Item('clear', show_label=False)),
+            title='TraitsUI Profile',
+            width=800, height=500, resizable=True,
+        )
+
+    #-------------------------------------------------------------------------
+    #  Displays the information, refreshing it periodically:
+    #-------------------------------------------------------------------------
+
+    def show(self):
+        """ Displays the information, refreshing it every **interval**
+            milliseconds until the window is closed.
+        """
+        from pyface.timer.api import Timer
+
+        self._ui = self.edit_traits()
+        if self.interval > 0:
+            self._timer = Timer(self.interval, self._tick)
+
+    def _tick(self):
+        """ Refreshes the information, or stops the timer if the window has
+            been closed.
+        """
+        if self._ui is None or self._ui.control is None:
+            self._timer.Stop()
+            self._timer = self._ui = None
+        else:
+            self.update()
+
+    #-------------------------------------------------------------------------
+    #  Updates the information displayed:
+    #-------------------------------------------------------------------------
+
+    def update(self):
+        """ Updates the information displayed from the recorded profile.
+        """
+        info = report()
+        self.editors = [EditorProfile(**editor) for editor in info['editors']]
+        self.uis = ([TimeProfile(name='UI: ' + ui['view'], calls=ui['calls'],
+                                 time=ui['time']) for ui in info['uis']] +
+                    [TimeProfile(name='Group: ' + panel['group'],
+                                 calls=panel['calls'], time=panel['time'])
+                     for panel in info['panels']])
+        self.cell_data = [CellDataProfile(**data)
+                          for data in info['cell_data']]
+
+    #-- Trait Event Handlers -------------------------------------------------
+
+    def _refresh_fired(self):
+        self.update()
+
+    def _clear_fired(self):
+        reset()
+        self.update()
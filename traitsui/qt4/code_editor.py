@@ -35,6 +35,8 @@ from pyface.key_pressed_event import KeyPressedEvent
 from constants import OKColor, ErrorColor
 from editor import Editor
 from helper import pixmap_cache
+from traitsui import profiling
+from traitsui.helper import common_length
 
 #-------------------------------------------------------------------------
 #  Constants:
@@ -45,6 +47,58 @@ MARK_MARKER = 0  # Marks a marked line
 SEARCH_MARKER = 1  # Marks a line matching the current search
 SELECTED_MARKER = 2  # Marks the currently selected line
 
+#-------------------------------------------------------------------------
+#  Updates a document by replacing only the lines that have changed:
+#-------------------------------------------------------------------------
+
+
+def update_document(document, old_text, new_text):
+    """ Changes the text of a plain text QTextDocument from *old_text* (its
+        current text) to *new_text*, by replacing only the span of lines that
+        differ. Unlike setPlainText, this keeps the layout and highlighting of
+        the unchanged lines. As with setPlainText, the change is not added to
+        the undo stack (which is cleared), so that undoing in the editor can
+        not revert changes made to the trait by the program.
+    """
+    old_lines = old_text.split('\n')
+    new_lines = new_text.split('\n')
+    start = common_length(old_lines, new_lines)
+    end = common_length(old_lines, new_lines,
+                        min(len(old_lines), len(new_lines)) - start, True)
+    old_end = len(old_lines) - end
+    lines = new_lines[start:len(new_lines) - end]
+
+    if end > 0:
+        # Replace whole lines, up to the start of the first unchanged line:
+        begin = document.findBlockByNumber(start).position()
+        finish = document.findBlockByNumber(old_end).position()
+        text = ''.join([line + '\n' for line in lines])
+    elif start > 0:
+        # Replace everything from the end of the last unchanged line:
+        begin = document.findBlockByNumber(start - 1).position() + \
+            document.findBlockByNumber(start - 1).length() - 1
+        finish = document.characterCount() - 1
+        text = ''.join(['\n' + line for line in lines])
+    else:
+        begin = 0
+        finish = document.characterCount() - 1
+        text = '\n'.join(lines)
+
+    undo_redo_enabled = document.isUndoRedoEnabled()
+    document.setUndoRedoEnabled(False)
+    try:
+        cursor = QtGui.QTextCursor(document)
+        cursor.beginEditBlock()
+        cursor.setPosition(begin)
+        cursor.setPosition(finish, QtGui.QTextCursor.KeepAnchor)
+        if text:
+            cursor.insertText(text)
+        else:
+            cursor.removeSelectedText()
+        cursor.endEditBlock()
+    finally:
+        document.setUndoRedoEnabled(undo_redo_enabled)
+
 
 class SourceEditor(Editor):
     """ Editor for source code which uses the advanced code widget.
@@ -125,11 +179,18 @@ class SourceEditor(Editor):
         # Set up listeners for the signals we care about
         code_editor = self._widget.code
 
+        if factory.update_delay > 0:
+            self._object_timer = self._create_timer(self.update_object)
+            self._editor_timer = self._create_timer(self._update_document)
+
         if self.readonly:
             code_editor.setReadOnly(True)
         else:
             if factory.auto_set:
-                code_editor.textChanged.connect(self.update_object)
+                if self._object_timer is not None:
+                    code_editor.textChanged.connect(self._text_changed)
+                else:
+                    code_editor.textChanged.connect(self.update_object)
             else:
                 code_editor.focus_lost.connect(self.update_object)
 
@@ -141,7 +202,7 @@ class SourceEditor(Editor):
         code_editor.line_number_widget.setVisible(factory.show_line_numbers)
 
         # Make sure the editor has been initialized:
-        self.update_editor()
+        self._update_document()
 
         # Set up any event listeners:
         self.sync_value(factory.mark_lines, 'mark_lines', 'from',
@@ -182,6 +243,14 @@ class SourceEditor(Editor):
         if not self.factory.auto_set:
             self._widget.code.focus_lost.disconnect(self.update_object)
 
+        if self._editor_timer is not None:
+            self._editor_timer.stop()
+        if self._object_timer is not None:
+            # Don't lose any pending user changes:
+            if self._object_timer.isActive():
+                self._object_timer.stop()
+                self.update_object()
+
         super(SourceEditor, self).dispose()
 
     #-------------------------------------------------------------------------
@@ -208,13 +277,32 @@ class SourceEditor(Editor):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
+        if self._editor_timer is not None:
+            if profiling.enabled and self._editor_timer.isActive():
+                profiling.editor_coalesced(self)
+            self._editor_timer.start()
+        else:
+            self._update_document()
+
+    #-------------------------------------------------------------------------
+    #  Updates the document to match the object trait:
+    #-------------------------------------------------------------------------
+
+    def _update_document(self):
+        """ Updates the document to match the object trait, replacing only
+            the lines that have changed.
+        """
         self._locked = True
         new_value = self.value
         if isinstance(new_value, SequenceTypes):
             new_value = '\n'.join([line.rstrip() for line in new_value])
         control = self._widget
-        if control.code.toPlainText() != new_value:
-            control.code.setPlainText(new_value)
+        old_value = control.code.toPlainText()
+        if old_value != new_value:
+            # The trait value replaces any user changes not yet applied:
+            if self._object_timer is not None:
+                self._object_timer.stop()
+            update_document(control.code.document(), old_value, new_value)
 
             if self.factory.selected_line:
                 # TODO: update the factory selected line
@@ -224,6 +312,29 @@ class SourceEditor(Editor):
 
         self._locked = False
 
+    #-------------------------------------------------------------------------
+    #  Handles the user changing the text when updates are delayed:
+    #-------------------------------------------------------------------------
+
+    def _text_changed(self):
+        """ Handles the user changing the text when updates are delayed.
+        """
+        if not self._locked:
+            self._object_timer.start()
+
+    #-------------------------------------------------------------------------
+    #  Creates a timer used to delay updates:
+    #-------------------------------------------------------------------------
+
+    def _create_timer(self, handler):
+        """ Creates a single shot timer used to delay updates.
+        """
+        timer = QtCore.QTimer(self.control)
+        timer.setSingleShot(True)
+        timer.setInterval(self.factory.update_delay)
+        timer.timeout.connect(handler)
+        return timer
+
     #-------------------------------------------------------------------------
     #  Handles an error that occurs while setting the object's trait value:
     #-------------------------------------------------------------------------
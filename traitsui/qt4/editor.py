@@ -25,6 +25,9 @@ from traits.api \
 from traitsui.api \
     import Editor as UIEditor
 
+from traitsui.helper \
+    import compiled
+
 from constants \
     import OKColor, ErrorColor
 
@@ -285,7 +288,7 @@ class Editor(UIEditor):
             if method_name.find('(') < 0:
                 method_name += '()'
             try:
-                eval(method_name, globals(), self._menu_context)
+                eval(compiled(method_name), globals(), self._menu_context)
             except:
                 from traitsui.api import raise_to_debug
                 raise_to_debug()
@@ -309,7 +312,8 @@ class Editor(UIEditor):
         if condition != '':
             value = True
             try:
-                if not eval(condition, globals(), self._menu_context):
+                if not eval(compiled(condition), globals(),
+                            self._menu_context):
                     value = False
             except:
                 from traitsui.api import raise_to_debug
@@ -330,7 +334,7 @@ class Editor(UIEditor):
 
             try:
                 if not eval(
-                        action.defined_when,
+                        compiled(action.defined_when),
                         globals(),
                         self._menu_context):
                     return False
@@ -341,7 +345,7 @@ class Editor(UIEditor):
         if action.visible_when != '':
             try:
                 if not eval(
-                        action.visible_when,
+                        compiled(action.visible_when),
                         globals(),
                         self._menu_context):
                     return False
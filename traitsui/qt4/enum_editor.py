@@ -18,6 +18,9 @@
 #  Imports:
 #-------------------------------------------------------------------------
 
+from bisect import bisect_left
+import heapq
+
 from pyface.qt import QtCore, QtGui
 
 from traits.api \
@@ -36,13 +39,19 @@ from constants \
     import OKColor, ErrorColor
 
 from traitsui.helper \
-    import enum_values_changed
+    import enum_values_changed, invalidate_enum_values
 from functools import reduce
 
 
 # default formatting function (would import from string, but not in Python 3)
 capitalize = lambda s: s.capitalize()
 
+# The number of names measured to size a large vocabulary combo box:
+SIZE_SAMPLE = 100
+
+# The maximum number of matches shown by the incremental search completer:
+MAX_COMPLETIONS = 500
+
 
 #-------------------------------------------------------------------------
 #  'BaseEditor' class:
@@ -139,8 +148,11 @@ class BaseEditor(Editor):
     def values_changed(self):
         """ Recomputes the cached data based on the underlying enumeration model.
         """
+        factory = self.factory
         self._names, self._mapping, self._inverse_mapping = \
-            enum_values_changed(self._value(), self.string_value)
+            enum_values_changed(self._value(), self.string_value,
+                                (self.__class__, factory.format_func,
+                                 factory.format_str))
 
     #-------------------------------------------------------------------------
     #  Handles the underlying object model's enumeration set being changed:
@@ -149,6 +161,8 @@ class BaseEditor(Editor):
     def _values_changed(self):
         """ Handles the underlying object model's enumeration set being changed.
         """
+        # The values may have been changed in place:
+        invalidate_enum_values(self._value())
         self.values_changed()
         self.rebuild_editor()
 
@@ -189,7 +203,10 @@ class SimpleEditor(BaseEditor):
         super(SimpleEditor, self).init(parent)
 
         self.control = control = self.create_combo_box()
-        control.addItems(self.names)
+        if self.factory.large_vocabulary:
+            self._init_large_vocabulary(control)
+        else:
+            control.addItems(self.names)
 
         control.currentIndexChanged[str].connect(self.update_object)
 
@@ -205,6 +222,65 @@ class SimpleEditor(BaseEditor):
         self._no_enum_update = 0
         self.set_tooltip()
 
+    #-------------------------------------------------------------------------
+    #  Sets up the combo box for a large vocabulary:
+    #-------------------------------------------------------------------------
+
+    def _init_large_vocabulary(self, control):
+        """ Sets up the combo box to show the names through a virtual list
+            model, with an incremental search completer, and to size itself
+            from a sample of the names rather than measuring all of them.
+        """
+        names = self.names
+        self._model = EnumListModel(names, control)
+        self._name_index = None
+        control.setModel(self._model)
+        control.view().setUniformItemSizes(True)
+        control.setSizeAdjustPolicy(
+            QtGui.QComboBox.AdjustToMinimumContentsLength)
+        control.setMinimumContentsLength(self._sampled_length(names))
+
+        control.setEditable(True)
+        control.setInsertPolicy(QtGui.QComboBox.NoInsert)
+        self._completion_model = EnumCompletionModel(names, control)
+        completer = QtGui.QCompleter(control)
+        completer.setModel(self._completion_model)
+        completer.setCompletionMode(
+            QtGui.QCompleter.UnfilteredPopupCompletion)
+        completer.activated[str].connect(self.update_object)
+        control.setCompleter(completer)
+        control.lineEdit().textEdited.connect(self._search)
+        if self.factory.evaluate is None:
+            control.lineEdit().editingFinished.connect(
+                self.update_autoset_text_object)
+
+    def _sampled_length(self, names):
+        """ Returns the minimum number of characters to show, measured from a
+            sample of evenly spaced names plus the longest names.
+        """
+        if len(names) == 0:
+            return 0
+
+        step = max(1, len(names) // SIZE_SAMPLE)
+        sample = names[::step] + heapq.nlargest(5, names, key=len)
+        metrics = self.control.fontMetrics()
+        width = max(metrics.width(name) for name in sample)
+        return (width // max(1, metrics.averageCharWidth())) + 1
+
+    def _search(self, text):
+        """ Updates the completer's matches as the user types.
+        """
+        self._completion_model.set_filter(unicode(text))
+        self.control.completer().complete()
+
+    def _index_of(self, name):
+        """ Returns the index of a name in the large vocabulary model.
+        """
+        if self._name_index is None:
+            self._name_index = dict(
+                (name, i) for i, name in enumerate(self.names))
+        return self._name_index[name]
+
     #-------------------------------------------------------------------------
     #  Returns the QComboBox used for the editor control:
     #-------------------------------------------------------------------------
@@ -231,6 +307,10 @@ class SimpleEditor(BaseEditor):
             springy,
             stretch)
 
+        if self.factory.large_vocabulary:
+            # Avoid measuring every name when the control is first shown:
+            return
+
         if ((direction == QtGui.QBoxLayout.LeftToRight and springy) or
                 (direction != QtGui.QBoxLayout.LeftToRight and resizable)):
             self.control.setSizeAdjustPolicy(
@@ -291,7 +371,14 @@ class SimpleEditor(BaseEditor):
         """
         if self._no_enum_update == 0:
             self._no_enum_update += 1
-            if self.factory.evaluate is None:
+            if self.factory.large_vocabulary:
+                try:
+                    index = self._index_of(self.inverse_mapping[self.value])
+                    self.control.setCurrentIndex(index)
+                except:
+                    self.control.setCurrentIndex(-1)
+                    self.control.setEditText('')
+            elif self.factory.evaluate is None:
                 try:
                     index = self.names.index(self.inverse_mapping[self.value])
                     self.control.setCurrentIndex(index)
@@ -333,12 +420,161 @@ class SimpleEditor(BaseEditor):
             object's **values** trait changes.
         """
         self.control.blockSignals(True)
-        self.control.clear()
-        self.control.addItems(self.names)
+        if self.factory.large_vocabulary:
+            # Only signal the rows which actually changed:
+            self._model.set_names(self.names)
+            self._completion_model.set_names(self.names)
+            self._name_index = None
+        else:
+            self.control.clear()
+            self.control.addItems(self.names)
         self.control.blockSignals(False)
 
         self.update_editor()
 
+#-------------------------------------------------------------------------
+#  'EnumListModel' class:
+#-------------------------------------------------------------------------
+
+
+class EnumListModel(QtCore.QAbstractListModel):
+    """ A list model which presents a list of enumeration names to a view
+        without creating an item for each of them.
+    """
+
+    def __init__(self, names, parent=None):
+        QtCore.QAbstractListModel.__init__(self, parent)
+        self._names = list(names)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of names.
+        """
+        if parent.isValid():
+            return 0
+        return len(self._names)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the name for a row.
+        """
+        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            return self._names[index.row()]
+        return None
+
+    def set_names(self, names):
+        """ Replaces the list of names, signalling the removal and insertion
+            of only the rows between the unchanged leading and trailing names.
+        """
+        old, new = self._names, list(names)
+        start, n = 0, min(len(old), len(new))
+        while start < n and old[start] == new[start]:
+            start += 1
+
+        old_end, new_end = len(old), len(new)
+        while (old_end > start and new_end > start and
+               old[old_end - 1] == new[new_end - 1]):
+            old_end -= 1
+            new_end -= 1
+
+        root = QtCore.QModelIndex()
+        if old_end > start:
+            self.beginRemoveRows(root, start, old_end - 1)
+            del old[start:old_end]
+            self.endRemoveRows()
+
+        if new_end > start:
+            self.beginInsertRows(root, start, new_end - 1)
+            old[start:start] = new[start:new_end]
+            self.endInsertRows()
+
+#-------------------------------------------------------------------------
+#  'EnumCompletionModel' class:
+#-------------------------------------------------------------------------
+
+
+class EnumCompletionModel(QtCore.QAbstractListModel):
+    """ A list model of the enumeration names matching a search string, used
+        by the completer of a large vocabulary combo box.
+
+        Names starting with the search string are found using a sorted index
+        and listed first, followed by names containing it. When the search
+        string is extended, only the previous matches are searched again.
+    """
+
+    def __init__(self, names, parent=None):
+        QtCore.QAbstractListModel.__init__(self, parent)
+        self.set_names(names)
+
+    def set_names(self, names):
+        """ Sets the names to search.
+        """
+        self.beginResetModel()
+        self._names = names
+        self._lower = None
+        self._sorted = None
+        self._text = None
+        self._candidates = None
+        self._matches = []
+        self.endResetModel()
+
+    def set_filter(self, text):
+        """ Sets the search string, updating the matching names.
+        """
+        text = text.lower()
+        self.beginResetModel()
+        if text == '':
+            self._text = self._candidates = None
+            self._matches = []
+        else:
+            self._matches = self._search(text)
+        self.endResetModel()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        """ Reimplemented to return the number of matches.
+        """
+        if parent.isValid():
+            return 0
+        return len(self._matches)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        """ Reimplemented to return the matching name for a row.
+        """
+        if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+            return self._names[self._matches[index.row()]]
+        return None
+
+    def _search(self, text):
+        """ Returns the indices of the names matching a search string.
+        """
+        if self._lower is None:
+            self._lower = [name.lower() for name in self._names]
+            self._sorted = sorted(
+                (name, i) for i, name in enumerate(self._lower))
+
+        # Names starting with the text:
+        sorted_names = self._sorted
+        prefixed = []
+        i = bisect_left(sorted_names, (text, -1))
+        while (i < len(sorted_names) and
+               sorted_names[i][0].startswith(text) and
+               len(prefixed) < MAX_COMPLETIONS):
+            prefixed.append(sorted_names[i][1])
+            i += 1
+
+        # Names containing the text, narrowing the previous candidates if the
+        # text extends the previous search string:
+        lower = self._lower
+        if self._text is not None and text.startswith(self._text):
+            candidates = self._candidates
+        else:
+            candidates = range(len(lower))
+        self._candidates = [j for j in candidates if text in lower[j]]
+        self._text = text
+
+        found = set(prefixed)
+        contained = [j for j in self._candidates if j not in found]
+
+        return (prefixed + contained)[:MAX_COMPLETIONS]
+
 #-------------------------------------------------------------------------
 #  'RadioEditor' class:
 #-------------------------------------------------------------------------
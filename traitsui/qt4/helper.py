@@ -19,6 +19,7 @@
 #-------------------------------------------------------------------------
 
 import os.path
+from collections import OrderedDict
 
 from pyface.qt import QtCore, QtGui
 from pyface.ui_traits import convert_image
@@ -73,6 +74,109 @@ def pixmap_cache(name, path=None):
             QtGui.QPixmapCache.insert(filename, pm)
     return pm
 
+#-------------------------------------------------------------------------
+#  'IconCache' class:
+#-------------------------------------------------------------------------
+
+
+class IconCache(object):
+    """ A bounded, least recently used registry of ready-made QIcons.
+
+        Icons are keyed by (resource name, search path, size, state), so the
+        same image requested by different editors is only located, loaded and
+        scaled once.
+    """
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._icons = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, name, path=None, size=None, state=None, factory=None):
+        """ Returns the cached QIcon for a key, creating it with 'factory' (a
+            callable returning a QIcon or QPixmap) if it is not in the cache.
+
+            If 'size' is a (width, height) tuple the icon's image is scaled
+            down to fit it once, when the icon is created. If 'state' is a
+            QIcon.Mode, the icon is rendered in that mode.
+        """
+        key = (name, path, size, state)
+        icons = self._icons
+        try:
+            icon = icons.pop(key)
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable search path, so the icon can't be cached:
+            self.misses += 1
+            return self._create(factory, size, state)
+        else:
+            icons[key] = icon
+            self.hits += 1
+            return icon
+
+        self.misses += 1
+        icons[key] = icon = self._create(factory, size, state)
+        while len(icons) > self.maxsize:
+            icons.popitem(last=False)
+            self.evictions += 1
+
+        return icon
+
+    def get_resource_icon(self, image_resource, size=None, state=None):
+        """ Returns the cached QIcon for a pyface ImageResource.
+        """
+        return self.get(image_resource.name,
+                        tuple(image_resource.search_path), size, state,
+                        image_resource.create_icon)
+
+    def clear(self):
+        """ Empties the cache and resets its statistics.
+        """
+        self._icons.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def statistics(self):
+        """ Returns a dictionary describing the cache usage.
+        """
+        requests = self.hits + self.misses
+        return {'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._icons),
+                'maxsize': self.maxsize,
+                'hit_rate': (float(self.hits) / requests) if requests else 0.0}
+
+    def _create(self, factory, size, state):
+        """ Creates a new icon, pre-scaling it if needed.
+        """
+        icon = factory()
+        if isinstance(icon, QtGui.QPixmap):
+            pixmap, icon = icon, None
+        else:
+            pixmap = None
+
+        if size is not None or state is not None:
+            if pixmap is None:
+                qsize = QtCore.QSize(*size) if size is not None else \
+                    icon.actualSize(QtCore.QSize(256, 256))
+                pixmap = icon.pixmap(qsize, state or QtGui.QIcon.Normal)
+            elif state is not None:
+                pixmap = QtGui.QIcon(pixmap).pixmap(pixmap.size(), state)
+            if size is not None and not pixmap.isNull() and (
+                    pixmap.width() > size[0] or pixmap.height() > size[1]):
+                pixmap = pixmap.scaled(size[0], size[1],
+                                       QtCore.Qt.KeepAspectRatio,
+                                       QtCore.Qt.SmoothTransformation)
+
+        if pixmap is not None:
+            icon = QtGui.QIcon(pixmap)
+
+        return icon
+
+#: The icon registry shared by all editors:
+icon_cache = IconCache()
+
 #-------------------------------------------------------------------------
 #  Positions a window on the screen with a specified width and height so that
 #  the window completely fits on the screen if possible:
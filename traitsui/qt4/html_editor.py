@@ -21,14 +21,20 @@
 #  Imports:
 #-------------------------------------------------------------------------
 
+import logging
+import threading
 import webbrowser
 
 from pyface.qt import QtCore, QtGui, QtWebKit
 
 from traits.api import Str
+from traits.trait_notifiers import ui_dispatch
+from traitsui import profiling
 
 from editor import Editor
 
+logger = logging.getLogger(__name__)
+
 #-------------------------------------------------------------------------
 #  'SimpleEditor' class:
 #-------------------------------------------------------------------------
@@ -66,9 +72,27 @@ class SimpleEditor(Editor):
             page.setLinkDelegationPolicy(QtWebKit.QWebPage.DelegateAllLinks)
             page.linkClicked.connect(self._link_clicked)
 
+        if self.factory.update_delay > 0:
+            self._timer = timer = QtCore.QTimer(self.control)
+            timer.setSingleShot(True)
+            timer.setInterval(self.factory.update_delay)
+            timer.timeout.connect(self._update_html)
+
         self.base_url = self.factory.base_url
         self.sync_value(self.factory.base_url_name, 'base_url', 'from')
 
+    #-------------------------------------------------------------------------
+    #  Disposes of the contents of an editor:
+    #-------------------------------------------------------------------------
+
+    def dispose(self):
+        """ Disposes of the contents of an editor.
+        """
+        if self._timer is not None:
+            self._timer.stop()
+
+        super(SimpleEditor, self).dispose()
+
     #-------------------------------------------------------------------------
     #  Updates the editor when the object trait changes external to the editor:
     #-------------------------------------------------------------------------
@@ -77,9 +101,78 @@ class SimpleEditor(Editor):
         """ Updates the editor when the object trait changes external to the
             editor.
         """
+        if self._timer is not None and self._html is not None:
+            if profiling.enabled and self._timer.isActive():
+                profiling.editor_coalesced(self)
+            self._timer.start()
+        else:
+            self._update_html()
+
+    #-------------------------------------------------------------------------
+    #  Updates the HTML displayed from the object trait:
+    #-------------------------------------------------------------------------
+
+    def _update_html(self):
+        """ Updates the HTML displayed from the object trait.
+        """
         text = self.str_value
-        if self.factory.format_text:
-            text = self.factory.parse_text(text)
+        if not self.factory.format_text:
+            self._set_html(text)
+        elif self.factory.format_in_background:
+            self._format_later(text)
+        else:
+            self._set_html(self.factory.parse_text(text))
+
+    #-------------------------------------------------------------------------
+    #  Formats text as HTML in a background thread:
+    #-------------------------------------------------------------------------
+
+    def _format_later(self, text):
+        """ Formats text as HTML in a background thread. Only one thread runs
+            at a time; text changed while it runs is formatted next.
+        """
+        self._pending_text = text
+        if not self._formatting:
+            self._formatting = True
+            thread = threading.Thread(target=self._format, args=(text,))
+            thread.daemon = True
+            thread.start()
+
+    def _format(self, text):
+        """ Formats text as HTML (in the background thread), and passes the
+            result to the UI thread.
+        """
+        try:
+            html = self.factory.parse_text(text)
+        except Exception:
+            logger.exception('Unable to format the text as HTML')
+            html = text
+        ui_dispatch(self._formatted, text, html)
+
+    def _formatted(self, text, html):
+        """ Handles text having been formatted as HTML.
+        """
+        self._formatting = False
+        if self.control is None:
+            return
+
+        if text == self._pending_text:
+            self._set_html(html)
+        else:
+            self._format_later(self._pending_text)
+
+    #-------------------------------------------------------------------------
+    #  Displays HTML, if it has changed:
+    #-------------------------------------------------------------------------
+
+    def _set_html(self, text):
+        """ Displays HTML, if it (or the base URL) has changed since it was
+            last displayed.
+        """
+        if text == self._html:
+            return
+
+        self._html = text
         if self.base_url:
             url = self.base_url
             if not url.endswith("/"):
@@ -91,6 +184,7 @@ class SimpleEditor(Editor):
     #-- Event Handlers -------------------------------------------------------
 
     def _base_url_changed(self):
+        self._html = None
         self.update_editor()
 
     def _link_clicked(self, url):
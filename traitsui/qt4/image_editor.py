@@ -24,7 +24,9 @@
 
 from __future__ import absolute_import
 
-from pyface.qt.QtGui import QFrame, QPainter, QPalette
+from pyface.qt.QtCore import Qt
+from pyface.qt.QtGui import (QColor, QFrame, QImage, QPainter, QPalette,
+                             QPixmap)
 
 from pyface.image_resource import ImageResource
 from pyface.ui_traits import convert_bitmap
@@ -36,6 +38,67 @@ from traitsui.editors.image_editor import ImageEditor
 
 from .editor import Editor
 
+#-------------------------------------------------------------------------
+#  Wraps a NumPy image array in a QImage:
+#-------------------------------------------------------------------------
+
+
+def array_to_qimage(array):
+    """ Returns a QImage sharing the buffer of a uint8 or uint16 NumPy array
+    of shape (height, width), (height, width, 3) or (height, width, 4), along
+    with the array it wraps.
+
+    The array is only copied if it is not C-contiguous, or if the Qt version
+    has no image format matching its type. The caller must keep a reference
+    to the returned array for as long as the image is used.
+
+    """
+    import numpy as np
+
+    if array.ndim == 2:
+        channels = 1
+    elif array.ndim == 3 and array.shape[2] in (3, 4):
+        channels = array.shape[2]
+    else:
+        raise ValueError('Image arrays must have shape (height, width), '
+                         '(height, width, 3) or (height, width, 4)')
+
+    if array.dtype == np.uint16:
+        if channels == 1:
+            format = getattr(QImage, 'Format_Grayscale16', None)
+        elif channels == 4:
+            format = getattr(QImage, 'Format_RGBA64', None)
+        else:
+            format = None
+        if format is None:
+            array = (array >> 8).astype(np.uint8)
+    elif array.dtype != np.uint8:
+        raise ValueError('Image arrays must have a uint8 or uint16 dtype')
+
+    color_table = None
+    if array.dtype == np.uint8:
+        if channels == 1:
+            format = getattr(QImage, 'Format_Grayscale8', None)
+            if format is None:
+                format = QImage.Format_Indexed8
+                color_table = [QColor(i, i, i).rgb() for i in range(256)]
+        elif channels == 3:
+            format = QImage.Format_RGB888
+        else:
+            format = getattr(QImage, 'Format_RGBA8888', None)
+            if format is None:
+                # ARGB32 is stored as BGRA on little-endian machines:
+                format = QImage.Format_ARGB32
+                array = array[..., [2, 1, 0, 3]]
+
+    array = np.ascontiguousarray(array)
+    height, width = array.shape[:2]
+    image = QImage(array.data, width, height, array.strides[0], format)
+    if color_table is not None:
+        image.setColorTable(color_table)
+
+    return image, array
+
 #-------------------------------------------------------------------------
 #  'QImageView' class:
 #-------------------------------------------------------------------------
@@ -61,6 +124,8 @@ class QImageView(QFrame):
         """
         super(QImageView, self).__init__(parent)
         self._pixmap = None
+        self._image = None
+        self._scaled = None
         self._scaled_contents = False
         self._allow_upscaling = False
         self._preserve_aspect_ratio = False
@@ -77,10 +142,11 @@ class QImageView(QFrame):
 
         """
         pixmap = self._pixmap
-        if pixmap is None:
+        image = self._image
+        if pixmap is None and image is None:
             return
 
-        pm_size = pixmap.size()
+        pm_size = (pixmap if pixmap is not None else image).size()
         pm_width = pm_size.width()
         pm_height = pm_size.height()
         if pm_width == 0 or pm_height == 0:
@@ -126,10 +192,27 @@ class QImageView(QFrame):
             paint_x = int(width / 2. - paint_width / 2.)
             paint_y = int(height / 2. - paint_height / 2.)
 
-        # Finally, draw the pixmap into the calculated rect.
+        # Finally, draw the image into the calculated rect. Scaled images are
+        # cached, so that only the first paint at a given size scales them.
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.drawPixmap(paint_x, paint_y, paint_width, paint_height, pixmap)
+        if paint_width == pm_width and paint_height == pm_height:
+            if pixmap is not None:
+                painter.drawPixmap(paint_x, paint_y, pixmap)
+            else:
+                painter.drawImage(paint_x, paint_y, image)
+            return
+
+        scaled = self._scaled
+        if scaled is None or scaled[0] != (paint_width, paint_height):
+            source = pixmap if pixmap is not None else image
+            scaled_source = source.scaled(paint_width, paint_height,
+                                          Qt.IgnoreAspectRatio,
+                                          Qt.SmoothTransformation)
+            if pixmap is None:
+                scaled_source = QPixmap.fromImage(scaled_source)
+            self._scaled = scaled = ((paint_width, paint_height),
+                                     scaled_source)
+        painter.drawPixmap(paint_x, paint_y, scaled[1])
 
     #--------------------------------------------------------------------------
     # Public API
@@ -139,9 +222,9 @@ class QImageView(QFrame):
         underlying QPixmap.
 
         """
-        pixmap = self._pixmap
-        if pixmap is not None:
-            return pixmap.size()
+        source = self._pixmap if self._pixmap is not None else self._image
+        if source is not None:
+            return source.size()
         return super(QImageView, self).sizeHint()
 
     def minimumSizeHint(self):
@@ -149,9 +232,9 @@ class QImageView(QFrame):
         underlying QPixmap.
 
         """
-        pixmap = self._pixmap
-        if pixmap is not None and not self._allow_clipping and not self._scaled_contents:
-            return pixmap.size()
+        source = self._pixmap if self._pixmap is not None else self._image
+        if source is not None and not self._allow_clipping and not self._scaled_contents:
+            return source.size()
         return super(QImageView, self).sizeHint()
 
     def pixmap(self):
@@ -170,6 +253,32 @@ class QImageView(QFrame):
 
         """
         self._pixmap = pixmap
+        self._image = None
+        self._scaled = None
+        self.update()
+
+    def image(self):
+        """ Returns the underlying image for the image view.
+
+        """
+        return self._image
+
+    def setImage(self, image):
+        """ Set the image to use in the widget.
+
+        Unlike a pixmap, the image is drawn directly, so an image wrapping
+        a memory buffer (such as a NumPy array) is never copied unless it
+        needs to be scaled.
+
+        Parameters
+        ----------
+        image : QImage
+            The QImage to use as the image in the widget.
+
+        """
+        self._image = image
+        self._pixmap = None
+        self._scaled = None
         self.update()
 
     def scaledContents(self):
@@ -279,7 +388,10 @@ class _ImageEditor(Editor):
             image = self.value
 
         self.control = QImageView()
-        self.control.setPixmap(convert_bitmap(image))
+        if _is_array(image):
+            self._set_array(image)
+        else:
+            self.control.setPixmap(convert_bitmap(image))
         self.control.setScaledContents(self.factory.scale)
         self.control.setAllowUpscaling(self.factory.allow_upscaling)
         self.control.setPreserveAspectRatio(self.factory.preserve_aspect_ratio)
@@ -299,7 +411,40 @@ class _ImageEditor(Editor):
             value = self.value
             if isinstance(value, ImageResource):
                 self.control.setPixmap(convert_bitmap(value))
+            elif _is_array(value):
+                self._set_array(value)
         self.control.setScaledContents(self.factory.scale)
         self.control.setAllowUpscaling(self.factory.allow_upscaling)
         self.control.setPreserveAspectRatio(self.factory.preserve_aspect_ratio)
         self.control.setAllowClipping(self.factory.allow_clipping)
+
+    #-------------------------------------------------------------------------
+    #  Displays a NumPy image array:
+    #-------------------------------------------------------------------------
+
+    def _set_array(self, array):
+        """ Displays a NumPy image array, only wrapping it in a new QImage if
+            it is a different array from the one currently displayed, or if
+            the image displayed is a converted copy of the array (which does
+            not show changes made to the array in place).
+        """
+        if (array is not self._array) or (self._array_data is not array):
+            self._image, self._array_data = array_to_qimage(array)
+            self._array = array
+        self.control.setImage(self._image)
+
+#-------------------------------------------------------------------------
+#  Returns whether a value is a NumPy array:
+#-------------------------------------------------------------------------
+
+
+def _is_array(value):
+    """ Returns whether a value is a NumPy array, without requiring NumPy to
+        be installed.
+    """
+    try:
+        from numpy import ndarray
+    except ImportError:
+        return False
+
+    return isinstance(value, ndarray)
@@ -108,23 +108,11 @@ class SimpleEditor(Editor):
             trait_handler = self.object.base_trait(self.name).handler
         self._trait_handler = trait_handler
 
-        # Create a scrolled window to hold all of the list item controls:
-        self.control = QtGui.QScrollArea()
-        self.control.setFrameShape(QtGui.QFrame.NoFrame)
-        self.control.setWidgetResizable(True)
+        self._create_control()
 
         #Create a mapper to identify which icon button requested a contextmenu
         self.mapper = QtCore.QSignalMapper(self.control)
 
-        # Create a widget with a grid layout as the container.
-        self._list_pane = QtGui.QWidget()
-        self._list_pane.setSizePolicy(QtGui.QSizePolicy.Expanding,
-                                      QtGui.QSizePolicy.Expanding)
-        layout = QtGui.QGridLayout(self._list_pane)
-        layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
-
         # Remember the editor to use for each individual list item:
         editor = self.factory.editor
         if editor is None:
@@ -310,6 +298,7 @@ class SimpleEditor(Editor):
         self._cur_control = sender = self.buttons[index]
 
         proxy = sender.proxy
+        index = proxy.index
         menu = MakeMenu(self.list_menu, self, True, sender).menu
         len_list = len(proxy.list)
         not_full = (len_list < self._trait_handler.maxlen)
@@ -425,6 +414,29 @@ class SimpleEditor(Editor):
 
     #-- Private Methods ------------------------------------------------------
 
+    def _create_control(self):
+        """ Creates the control and the pane holding the list item controls.
+        """
+        # Create a scrolled window to hold all of the list item controls:
+        self.control = QtGui.QScrollArea()
+        self.control.setFrameShape(QtGui.QFrame.NoFrame)
+        self.control.setWidgetResizable(True)
+
+        # Create a widget with a grid layout as the container.
+        self._list_pane = self._create_list_pane()
+
+    def _create_list_pane(self):
+        """ Creates a widget with a grid layout to hold the list item controls.
+        """
+        list_pane = QtGui.QWidget()
+        list_pane.setSizePolicy(QtGui.QSizePolicy.Expanding,
+                                QtGui.QSizePolicy.Expanding)
+        layout = QtGui.QGridLayout(list_pane)
+        layout.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignTop)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        return list_pane
+
     def _dispose_items(self):
         """ Disposes of each current list item.
         """
@@ -479,6 +491,252 @@ class CustomEditor(SimpleEditor):
     # Is the list editor is scrollable? This values overrides the default.
     scrollable = True
 
+#-------------------------------------------------------------------------
+#  'VirtualEditor' class:
+#-------------------------------------------------------------------------
+
+
+class VirtualEditor(CustomEditor):
+    """ Style of editor for long lists, which only creates item editors for
+    the visible rows and re-uses them as the list is scrolled.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Updates the editor when the object trait changes external to the editor:
+    #-------------------------------------------------------------------------
+
+    def update_editor(self):
+        """ Updates the editor when the object trait changes externally to the
+            editor.
+        """
+        trait_handler = self._trait_handler
+        self._resizable = ((trait_handler.minlen != trait_handler.maxlen) and
+                           self.mutable)
+
+        is_empty = (self._resizable and (len(self.value) == 0))
+        if is_empty or self._is_empty or (self._slots is None):
+            # Disconnect the editor from any control about to be destroyed:
+            self._dispose_items()
+            self._slots = []
+            self._is_empty = is_empty
+            self.mapper = QtCore.QSignalMapper(self.control)
+            if is_empty:
+                self.empty_list()
+            else:
+                self.buttons = []
+                self.mapper.mapped.connect(self.popup_menu)
+
+        self._update_rows()
+
+    #-------------------------------------------------------------------------
+    #  Updates the editor when an item in the object trait changes external to
+    #  the editor:
+    #-------------------------------------------------------------------------
+
+    def update_editor_item(self, event):
+        """ Updates the editor when an item in the object trait changes
+        externally to the editor.
+        """
+        if self._is_empty or (len(self.value) == 0):
+            self.update_editor()
+            return
+
+        # Inserting or removing items only shifts the items bound to the
+        # visible rows at or after the change:
+        self._update_rows(event.index)
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _create_control(self):
+        """ Creates the control and the pane holding the list item controls.
+        """
+        self.control = _VirtualListWidget(self)
+        layout = QtGui.QHBoxLayout(self.control)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        self._list_pane = self._create_list_pane()
+        self._list_pane.setSizePolicy(QtGui.QSizePolicy.Expanding,
+                                      QtGui.QSizePolicy.Ignored)
+        layout.addWidget(self._list_pane)
+
+        self._scroll_bar = QtGui.QScrollBar(QtCore.Qt.Vertical)
+        self._scroll_bar.valueChanged.connect(self._scrolled)
+        layout.addWidget(self._scroll_bar)
+
+    def _dispose_items(self):
+        """ Disposes of each current list item.
+        """
+        for button, proxy, editor in self._slots or []:
+            control = editor.control
+            if isinstance(control, QtGui.QWidget):
+                # Stop the layout clean up below disposing of it again:
+                control._editor = None
+            editor.dispose()
+            editor.control = None
+
+        super(VirtualEditor, self)._dispose_items()
+        self._slots = None
+
+    def _visible_rows(self):
+        """ Returns the number of rows that fit in the list pane.
+        """
+        row_height = self._row_height
+        height = self._list_pane.height()
+        if (not row_height) or (not self.control.isVisible()):
+            return self.factory.rows
+
+        return max(1, height // row_height)
+
+    def _update_rows(self, start=0):
+        """ Updates the scroll bar and the visible rows, re-binding the item
+            editors from the list index *start* onwards.
+        """
+        if self._is_empty:
+            self._scroll_bar.setRange(0, 0)
+            return
+
+        columns = self.factory.columns
+        rows = self._visible_rows()
+        total_rows = (len(self.value) + columns - 1) // columns
+        scroll_bar = self._scroll_bar
+        scroll_bar.blockSignals(True)
+        scroll_bar.setRange(0, max(0, total_rows - rows))
+        scroll_bar.setPageStep(rows)
+        scroll_bar.blockSignals(False)
+        self._first_row = scroll_bar.value()
+
+        self._bind_slots(rows * columns, start)
+
+    def _bind_slots(self, count, start=0):
+        """ Binds the first *count* slots to the items in the visible rows,
+            creating any slots that are needed and hiding the others.
+        """
+        value = self.value
+        slots = self._slots
+        first = self._first_row * self.factory.columns
+        needed = min(count, len(value) - first)
+        for slot in xrange(needed):
+            index = first + slot
+            if slot >= len(slots):
+                slots.append(self._create_slot(slot, index, value[index]))
+                continue
+
+            button, proxy, editor = slots[slot]
+            if index >= start or proxy.index != index:
+                proxy._zzz_inited = False
+                proxy.index = index
+                proxy.value = value[index]
+                proxy._zzz_inited = True
+            self._set_slot_visible(slots[slot], True)
+
+        for slot in slots[max(needed, 0):]:
+            self._set_slot_visible(slot, False)
+
+    def _create_slot(self, slot, index, value):
+        """ Creates the icon button (if any) and item editor for a slot.
+        """
+        list_pane = self._list_pane
+        layout = list_pane.layout()
+        row, column = divmod(slot, self.factory.columns)
+
+        # Account for the fact that we have <columns> number of pairs
+        column = column * 2
+
+        button = None
+        if self._resizable:
+            button = IconButton('list_editor.png', self.mapper.map)
+            self.buttons.append(button)
+            self.mapper.setMapping(button, slot)
+            layout.addWidget(button, row, column + 1)
+
+        proxy = ListItemProxy(self.object, self.name, index,
+                              self._trait_handler.item_trait, value)
+        if button is not None:
+            button.proxy = proxy
+        editor = self._editor(self.ui, proxy, 'value', self.description,
+                              list_pane).set(object_name='')
+        editor.prepare(list_pane)
+        control = editor.control
+        if not isinstance(control, QtGui.QWidget):
+            # Wrap layouts in a widget, so the slot can be hidden:
+            widget = QtGui.QWidget()
+            widget.setLayout(control)
+            control = widget
+        control.proxy = proxy
+        layout.addWidget(control, row, column)
+
+        if not self._row_height:
+            self._row_height = max(control.sizeHint().height(),
+                                   button.sizeHint().height()
+                                   if button is not None else 0, 1)
+
+        return (button, proxy, editor)
+
+    def _set_slot_visible(self, slot, visible):
+        """ Shows or hides the controls of a slot.
+        """
+        button, proxy, editor = slot
+        if button is not None:
+            button.setVisible(visible)
+        control = editor.control
+        if not isinstance(control, QtGui.QWidget):
+            control = control.parentWidget()
+        if control is not None:
+            control.setVisible(visible)
+
+    def _scrolled(self, value):
+        """ Handles the user scrolling the list.
+        """
+        self._first_row = value
+        self._bind_slots(self._visible_rows() * self.factory.columns)
+
+    def _resized(self):
+        """ Handles the editor being resized.
+        """
+        if self._slots is not None:
+            self._update_rows()
+
+#-------------------------------------------------------------------------
+#  '_VirtualListWidget' class:
+#-------------------------------------------------------------------------
+
+
+class _VirtualListWidget(QtGui.QWidget):
+    """ The control used by the VirtualEditor, which updates the visible rows
+    when it is resized and scrolls the list with the mouse wheel.
+    """
+
+    def __init__(self, editor):
+        QtGui.QWidget.__init__(self)
+        self._editor = editor
+
+    def sizeHint(self):
+        """ Reimplemented to show the number of rows set by the factory.
+        """
+        hint = QtGui.QWidget.sizeHint(self)
+        editor = self._editor
+        if editor._row_height:
+            hint.setHeight(editor._row_height * editor.factory.rows)
+        return hint
+
+    def resizeEvent(self, event):
+        """ Reimplemented to update the visible rows.
+        """
+        QtGui.QWidget.resizeEvent(self, event)
+        self._editor._resized()
+
+    def showEvent(self, event):
+        """ Reimplemented to update the visible rows.
+        """
+        QtGui.QWidget.showEvent(self, event)
+        self._editor._resized()
+
+    def wheelEvent(self, event):
+        """ Reimplemented to scroll the list.
+        """
+        QtGui.QApplication.sendEvent(self._editor._scroll_bar, event)
+
 #-------------------------------------------------------------------------
 #  'TextEditor' class:
 #-------------------------------------------------------------------------
@@ -509,6 +767,10 @@ class ReadonlyEditor(CustomEditor):
 class NotebookEditor(Editor):
     """ An editor for lists that displays the list as a "notebook" of tabbed
     pages.
+
+    The UI for each page is only created when its tab first becomes current;
+    until then the tab holds an empty placeholder widget. Pages are reused by
+    object identity when the list is replaced.
     """
 
     # The "Close Tab" button.
@@ -542,7 +804,10 @@ class NotebookEditor(Editor):
         """ Finishes initializing the editor by creating the underlying toolkit
             widget.
         """
+        # List of [page, ui, view_object, monitoring, object] entries, where
+        # ui is None until the page has been shown:
         self._uis = []
+        self._pages = {}
 
         # Create a tab widget to hold each separate object's view:
         self.control = QtGui.QTabWidget()
@@ -596,19 +861,44 @@ class NotebookEditor(Editor):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
-        # Destroy the views on each current notebook page:
-        self.close_all()
+        # Index the current pages by object identity so they can be reused:
+        old_uis = {}
+        for entry in self._uis:
+            old_uis.setdefault(id(entry[4]), []).append(entry)
+
+        # Reuse or create a tab page for each object in the trait's value:
+        blocked = self.control.blockSignals(True)
+        try:
+            self._uis = []
+            for object in self.value:
+                entries = old_uis.get(id(object))
+                if entries:
+                    entry = entries.pop(0)
+                else:
+                    entry = self._create_page(object)
 
-        # Create a tab page for each object in the trait's value:
-        for object in self.value:
-            ui, view_object, monitoring = self._create_page(object)
+                # Remember the page for later deletion processing:
+                self._uis.append(entry)
 
-            # Remember the page for later deletion processing:
-            self._uis.append([ui.control, ui, view_object, monitoring])
+            # Destroy the pages of objects no longer in the list:
+            for entries in old_uis.values():
+                for entry in entries:
+                    self._close_page(entry)
+
+            # Put the tabs in the same order as the list:
+            tab_bar = self.control.tabBar()
+            for i, entry in enumerate(self._uis):
+                index = self.control.indexOf(entry[0])
+                if index not in (-1, i):
+                    tab_bar.moveTab(index, i)
+        finally:
+            self.control.blockSignals(blocked)
 
         if self.selected:
             self._selected_changed(self.selected)
 
+        self._build_page(self.control.currentWidget())
+
     #-------------------------------------------------------------------------
     #  Handles some subset of the trait's list being updated:
     #-------------------------------------------------------------------------
@@ -619,39 +909,25 @@ class NotebookEditor(Editor):
         index = event.index
 
         # Delete the page corresponding to each removed item:
-        page_name = self.factory.page_name[1:]
-
         for i in event.removed:
-            page, ui, view_object, monitoring = self._uis[index]
-            if monitoring:
-                view_object.on_trait_change(self.update_page_name, page_name,
-                                            remove=True)
-            ui.dispose()
-            self.control.removeTab(self.control.indexOf(page))
-
-            if self.factory.show_notebook_menu:
-                for name, tmp in self._pagewidgets.items():
-                    if tmp is page:
-                        del self._pagewidgets[name]
-                self._context_menu.removeAction(self._action_dict[name])
-                del self._action_dict[name]
-
+            self._close_page(self._uis[index])
             del self._uis[index]
 
         # Add a page for each added object:
         first_page = None
         for object in event.added:
-            ui, view_object, monitoring = self._create_page(object)
-            self._uis[index:index] = [
-                [ui.control, ui, view_object, monitoring]]
+            entry = self._create_page(object)
+            self._uis[index:index] = [entry]
             index += 1
 
             if first_page is None:
-                first_page = ui.control
+                first_page = entry[0]
 
         if first_page is not None:
             self.control.setCurrentWidget(first_page)
 
+        self._build_page(self.control.currentWidget())
+
     #-------------------------------------------------------------------------
     #  Closes the currently selected tab:
     #-------------------------------------------------------------------------
@@ -661,9 +937,9 @@ class NotebookEditor(Editor):
         """
         widget = self.control.currentWidget()
         for i in xrange(len(self._uis)):
-            page, ui, _, _ = self._uis[i]
+            page, ui, _, _, _ = self._uis[i]
             if page is widget:
-                if force or ui.handler.close(ui.info, True):
+                if force or ui is None or ui.handler.close(ui.info, True):
                     del self.value[i]
                 break
 
@@ -693,11 +969,12 @@ class NotebookEditor(Editor):
         """
         page_name = self.factory.page_name[1:]
 
-        for _, ui, view_object, monitoring in self._uis:
+        for _, ui, view_object, monitoring, _ in self._uis:
             if monitoring:
                 view_object.on_trait_change(self.update_page_name, page_name,
                                             remove=True)
-            ui.dispose()
+            if ui is not None:
+                ui.dispose()
 
         # Reset the list of ui's and dictionary of page name counts:
         self._uis = []
@@ -726,8 +1003,8 @@ class NotebookEditor(Editor):
         """ Handles the trait defining a particular page's name being changed.
         """
         for i, value in enumerate(self._uis):
-            page, ui, _, _ = value
-            if object is ui.info.object:
+            page, _, view_object, _, _ = value
+            if object is view_object:
                 name = None
                 handler = getattr(
                     self.ui.handler, '%s_%s_page_name' %
@@ -751,15 +1028,18 @@ class NotebookEditor(Editor):
     #-------------------------------------------------------------------------
 
     def _create_page(self, object):
-        # Create the view for the object:
+        """ Creates a placeholder page for a specified object and adds it to
+            the tab widget. Returns the page's entry for the list of pages.
+        """
         view_object = object
         factory = self.factory
         if factory.factory is not None:
             view_object = factory.factory(object)
-        ui = view_object.edit_traits(parent=self.control,
-                                     view=factory.view,
-                                     kind=factory.ui_kind).set(
-            parent=self.ui)
+
+        # The page's UI is only created when the page is first shown:
+        page = QtGui.QWidget()
+        layout = QtGui.QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
 
         # Get the name of the page being added to the notebook:
         name = ''
@@ -794,17 +1074,15 @@ class NotebookEditor(Editor):
             if count > 1:
                 name += (' %d' % count)
 
-        # Return the control for the ui, and whether or not its name is being
-        # monitored:
         image = None
         method = getattr(self.ui.handler, prefix + 'image', None)
         if method is not None:
             image = method(self.ui.info, object)
 
         if image is None:
-            self.control.addTab(ui.control, name)
+            self.control.addTab(page, name)
         else:
-            self.control.addTab(ui.control, image, name)
+            self.control.addTab(page, image, name)
 
         if self.factory.show_notebook_menu:
             newaction = self._context_menu.addAction(name)
@@ -815,25 +1093,63 @@ class NotebookEditor(Editor):
                 lambda e, name=name: self._menu_action(
                     e, name=name))
             self._action_dict[name] = newaction
-            self._pagewidgets[name] = ui.control
+            self._pagewidgets[name] = page
+
+        # Return the page, and whether or not its name is being monitored:
+        return [page, None, view_object, monitoring, object]
+
+    def _build_page(self, widget):
+        """ Creates the UI of a page the first time it is shown.
+        """
+        for entry in self._uis:
+            if entry[0] is widget:
+                if entry[1] is None:
+                    factory = self.factory
+                    ui = entry[2].edit_traits(parent=widget,
+                                              view=factory.view,
+                                              kind=factory.ui_kind).set(
+                        parent=self.ui)
+                    widget.layout().addWidget(ui.control)
+                    entry[1] = ui
+                break
+
+    def _close_page(self, entry):
+        """ Disposes of a page and removes it from the tab widget.
+        """
+        page, ui, view_object, monitoring, _ = entry
+        if monitoring:
+            view_object.on_trait_change(self.update_page_name,
+                                        self.factory.page_name[1:],
+                                        remove=True)
+        if ui is not None:
+            ui.dispose()
+        self.control.removeTab(self.control.indexOf(page))
+
+        if self.factory.show_notebook_menu:
+            for name, tmp in list(self._pagewidgets.items()):
+                if tmp is page:
+                    del self._pagewidgets[name]
+                    self._context_menu.removeAction(self._action_dict[name])
+                    del self._action_dict[name]
 
-        return (ui, view_object, monitoring)
+        page.deleteLater()
 
     def _tab_activated(self, idx):
         """ Handles a notebook tab being "activated" (i.e. clicked on) by the
             user.
         """
         widget = self.control.widget(idx)
-        for page, ui, _, _ in self._uis:
+        self._build_page(widget)
+        for page, _, view_object, _, _ in self._uis:
             if page is widget:
-                self.selected = ui.info.object
+                self.selected = view_object
                 break
 
     def _selected_changed(self, selected):
         """ Handles the **selected** trait being changed.
         """
-        for page, ui, _, _ in self._uis:
-            if ui.info and selected is ui.info.object:
+        for page, _, view_object, _, _ in self._uis:
+            if selected is view_object:
                 self.control.setCurrentWidget(page)
                 break
             deletable = self.factory.deletable
@@ -96,6 +96,10 @@ class _ListStrEditor(Editor):
     # The current search string:
     search = Str
 
+    # Is the adapter a plain ListStrAdapter, so that the list items can be
+    # displayed directly without going through it?
+    plain = Bool(False)
+
     #-------------------------------------------------------------------------
     #  Editor interface:
     #-------------------------------------------------------------------------
@@ -165,7 +169,8 @@ class _ListStrEditor(Editor):
         # Make sure we listen for 'items' changes as well as complete list
         # replacements:
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', dispatch='ui')
+            self.update_editor_item, self.extended_name + '_items',
+            dispatch='ui')
 
         # Create the mapping from user supplied images to QIcons:
         for image_resource in factory.images:
@@ -182,7 +187,8 @@ class _ListStrEditor(Editor):
         """ Disposes of the contents of an editor.
         """
         self.context_object.on_trait_change(
-            self.update_editor, self.extended_name + '_items', remove=True)
+            self.update_editor_item, self.extended_name + '_items',
+            remove=True)
 
         self.on_trait_change(
             self.refresh_editor, 'adapter.+update', remove=True)
@@ -193,6 +199,7 @@ class _ListStrEditor(Editor):
         """ Updates the editor when the object trait changes externally to the
             editor.
         """
+        self._index_map = None
         if not self._no_update:
             self.model.beginResetModel()
             self.model.endResetModel()
@@ -202,6 +209,41 @@ class _ListStrEditor(Editor):
             else:
                 self._selected_changed(self.selected)
 
+    def update_editor_item(self, event):
+        """ Updates the editor when items in the object trait are changed
+            externally to the editor, only signalling the rows affected.
+        """
+        self._update_index_map(event)
+        if self._no_update:
+            return
+
+        model = self.model
+        index = event.index
+        n_removed = len(event.removed)
+        n_added = len(event.added)
+        if n_removed == n_added:
+            if n_added > 0:
+                model.dataChanged.emit(model.index(index),
+                                       model.index(index + n_added - 1))
+            return
+
+        # The list has already been changed, so the rows are removed and
+        # inserted after the fact:
+        parent = QtCore.QModelIndex()
+        if n_removed > 0:
+            model.beginRemoveRows(parent, index, index + n_removed - 1)
+            model.endRemoveRows()
+        if n_added > 0:
+            model.beginInsertRows(parent, index, index + n_added - 1)
+            model.endInsertRows()
+
+        # The selection model moves the selection with the rows, so just
+        # resynchronize the selection traits with it:
+        if self.factory.multi_select:
+            self._on_rows_selection(None, None)
+        else:
+            self._on_row_selection(None, None)
+
     #-------------------------------------------------------------------------
     #  ListStrEditor interface:
     #-------------------------------------------------------------------------
@@ -209,6 +251,7 @@ class _ListStrEditor(Editor):
     def refresh_editor(self):
         """ Requests that the underlying list widget to redraw itself.
         """
+        self._adapter_changed(self.adapter)
         self.list_view.viewport().update()
 
     def callx(self, func, *args, **kw):
@@ -244,6 +287,32 @@ class _ListStrEditor(Editor):
 
         return self.images.get(image)
 
+    def index_of(self, item):
+        """ Returns the index of the first occurrence of *item* in the list,
+            using a map from items to indices which is maintained as the list
+            changes. Raises ValueError if the item is not in the list.
+        """
+        index_map = self._index_map
+        if index_map is None:
+            index_map = {}
+            try:
+                for index in xrange(len(self.value) - 1, -1, -1):
+                    index_map[self.value[index]] = index
+            except TypeError:
+                # Unhashable items, so fall back to searching the list:
+                index_map = False
+            self._index_map = index_map
+
+        if index_map is False:
+            return self.value.index(item)
+
+        try:
+            return index_map[item]
+        except KeyError:
+            raise ValueError('%r is not in list' % (item,))
+        except TypeError:
+            return self.value.index(item)
+
     def is_auto_add(self, index):
         """ Returns whether or not the index is the special 'auto add' item at
             the end of the list.
@@ -255,6 +324,27 @@ class _ListStrEditor(Editor):
     #  Private interface:
     #-------------------------------------------------------------------------
 
+    def _update_index_map(self, event):
+        """ Updates the map from items to indices for a list items event.
+        """
+        index_map = self._index_map
+        if not index_map:
+            self._index_map = None
+            return
+
+        # Items appended to the end of the list can be added to the map, but
+        # any other change shifts the indices of the following items:
+        values = self.value
+        if (len(event.removed) == 0 and
+                event.index + len(event.added) == len(values)):
+            try:
+                for index, item in enumerate(event.added, event.index):
+                    index_map.setdefault(item, index)
+            except TypeError:
+                self._index_map = False
+        else:
+            self._index_map = None
+
     def _add_image(self, image_resource):
         """ Adds a new image to the image map.
         """
@@ -272,12 +362,26 @@ class _ListStrEditor(Editor):
 
     #-- Trait Event Handlers -------------------------------------------------
 
+    def _adapter_changed(self, adapter):
+        """ Handles the adapter being changed, deciding whether the list model
+            can display the list items directly.
+        """
+        self.plain = (type(adapter) is ListStrAdapter and
+                      len(adapter.adapters) == 0 and
+                      adapter.image is None and
+                      adapter.text_color is None and
+                      adapter.even_text_color is None and
+                      adapter.odd_text_color is None and
+                      adapter.bg_color is None and
+                      adapter.even_bg_color is None and
+                      adapter.odd_bg_color is None)
+
     def _selected_changed(self, selected):
         """ Handles the editor's 'selected' trait being changed.
         """
         if not self._no_update:
             try:
-                selected_index = self.value.index(selected)
+                selected_index = self.index_of(selected)
             except ValueError:
                 pass
             else:
@@ -302,7 +406,7 @@ class _ListStrEditor(Editor):
             indices = []
             for item in selected:
                 try:
-                    indices.append(self.value.index(item))
+                    indices.append(self.index_of(item))
                 except ValueError:
                     pass
             self._multi_selected_indices_changed(indices)
@@ -312,8 +416,8 @@ class _ListStrEditor(Editor):
         """
         if not self._no_update:
             try:
-                added = [self.value.index(item) for item in event.added]
-                removed = [self.value.index(item) for item in event.removed]
+                added = [self.index_of(item) for item in event.added]
+                removed = [self.index_of(item) for item in event.removed]
             except ValueError:
                 pass
             else:
@@ -24,6 +24,7 @@
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui import profiling
 from traitsui.ui_traits import SequenceTypes
 
 #-------------------------------------------------------------------------
@@ -62,10 +63,21 @@ class ListStrModel(QtCore.QAbstractListModel):
     def data(self, mi, role):
         """ Reimplemented to return the data.
         """
+        if profiling.enabled:
+            profiling.cell_data(self, role)
         editor = self._editor
         adapter = editor.adapter
         index = mi.row()
 
+        if editor.plain and not editor.is_auto_add(index):
+            # Fast path for a plain adapter, which has no colors or images:
+            if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
+                text = unicode(getattr(editor.object, editor.name)[index])
+                if role == QtCore.Qt.DisplayRole and text == '':
+                    text = ' '
+                return text
+            return None
+
         if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
             if editor.is_auto_add(index):
                 text = adapter.get_default_text(editor.object, editor.name,
@@ -143,6 +155,18 @@ class ListStrModel(QtCore.QAbstractListModel):
 
         flags = QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled
 
+        if editor.plain and not editor.is_auto_add(index):
+            # A plain adapter allows dragging all items, and editing them
+            # according to its 'can_edit' trait:
+            factory = editor.factory
+            if factory.editable:
+                if 'edit' in factory.operations and editor.adapter.can_edit:
+                    flags |= QtCore.Qt.ItemIsEditable
+                if 'move' in factory.operations:
+                    flags |= (QtCore.Qt.ItemIsDragEnabled |
+                              QtCore.Qt.ItemIsDropEnabled)
+            return flags
+
         if (editor.factory.editable and 'edit' in editor.factory.operations and
                 editor.adapter.get_can_edit(editor.object, editor.name, index)):
             flags |= QtCore.Qt.ItemIsEditable
@@ -26,7 +26,7 @@ from traitsui.editors.set_editor \
     import ToolkitEditorFactory
 
 from traitsui.helper \
-    import enum_values_changed
+    import enum_values_changed, invalidate_enum_values
 
 from editor \
     import Editor
@@ -205,8 +205,11 @@ class SimpleEditor(Editor):
     def values_changed(self):
         """ Recomputes the cached data based on the underlying enumeration model.
         """
+        factory = self.factory
         self._names, self._mapping, self._inverse_mapping = \
-            enum_values_changed(self._value(), self.string_value)
+            enum_values_changed(self._value(), self.string_value,
+                                (self.__class__, factory.format_func,
+                                 factory.format_str))
 
     #-------------------------------------------------------------------------
     #  Handles the underlying object model's enumeration set being changed:
@@ -215,6 +218,8 @@ class SimpleEditor(Editor):
     def _values_changed(self):
         """ Handles the underlying object model's enumeration set being changed.
         """
+        # The values may have been changed in place:
+        invalidate_enum_values(self._value())
         self.values_changed()
         self.update_editor()
 
@@ -33,6 +33,7 @@ from traitsui.editors.table_editor import BaseTableEditor, \
 from traitsui.ui_traits import SequenceTypes
 
 from .editor import Editor
+from .helper import icon_cache
 from .table_model import TableModel, SortFilterTableModel
 
 
@@ -129,9 +130,6 @@ class TableEditor(Editor, BaseTableEditor):
     # Dictionary mapping image names to QIcons
     images = Any({})
 
-    # Dictionary mapping ImageResource objects to QIcons
-    image_resources = Any({})
-
     # An image being converted:
     image = Image
 
@@ -337,6 +335,7 @@ class TableEditor(Editor, BaseTableEditor):
             # invalidate the model, but do not reset it. Resetting the model
             # may cause problems if the selection sync'ed traits are being used
             # externally to manage the selections
+            self.source_model.flush_cell_states()
             self.model.invalidate()
 
             self.table_view.resizeColumnsToContents()
@@ -370,6 +369,7 @@ class TableEditor(Editor, BaseTableEditor):
     def refresh_editor(self):
         """Requests that the underlying table widget to redraw itself."""
 
+        self.source_model.flush_cell_states()
         self.table_view.viewport().update()
 
     #-------------------------------------------------------------------------
@@ -542,9 +542,7 @@ class TableEditor(Editor, BaseTableEditor):
     def _add_image(self, image_resource):
         """ Adds a new image to the image map.
         """
-        image = image_resource.create_icon()
-
-        self.image_resources[image_resource] = image
+        image = icon_cache.get_resource_icon(image_resource)
         self.images[image_resource.name] = image
 
         return image
@@ -557,10 +555,7 @@ class TableEditor(Editor, BaseTableEditor):
             image = self.image
 
         if isinstance(image, ImageResource):
-            result = self.image_resources.get(image)
-            if result is not None:
-                return result
-            return self._add_image(image)
+            return icon_cache.get_resource_icon(image)
 
         return self.images.get(image)
 
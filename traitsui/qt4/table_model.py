@@ -18,6 +18,7 @@
 
 from pyface.qt import QtCore, QtGui
 
+from traitsui import profiling
 from traitsui.ui_traits import SequenceTypes
 
 from .clipboard import PyMimeData
@@ -43,6 +44,22 @@ v_alignment_map = {
 # MIME type for internal table drag/drop operations
 mime_type = 'traits-ui-table-editor'
 
+# The column styles (see TableColumn.is_constant_style) the value of each
+# style role depends on:
+style_roles = {
+    QtCore.Qt.FontRole: ('text_font',),
+    QtCore.Qt.TextAlignmentRole: ('horizontal_alignment',
+                                  'vertical_alignment'),
+    QtCore.Qt.BackgroundRole: ('cell_color',),
+    QtCore.Qt.ForegroundRole: ('text_color',),
+}
+
+# Marks the style roles whose value depends on the object in a style cache:
+variable_style = object()
+
+# The maximum number of cells whose states are cached by a model:
+cell_states_cache_size = 100000
+
 
 def as_qcolor(color):
     """ Convert a color specification (maybe a tuple) into a QColor.
@@ -67,6 +84,15 @@ class TableModel(QtCore.QAbstractTableModel):
 
         self._editor = editor
 
+        # The (editable, checkable) states of the cells whose states depend on
+        # their object, keyed by (row, column):
+        self._cell_states = {}
+
+        # The cached states are discarded whenever the rows change:
+        for signal in (self.modelReset, self.layoutChanged, self.rowsInserted,
+                       self.rowsRemoved, self.rowsMoved, self.dataChanged):
+            signal.connect(self.flush_cell_states)
+
     #-------------------------------------------------------------------------
     #  QAbstractTableModel interface:
     #-------------------------------------------------------------------------
@@ -83,10 +109,32 @@ class TableModel(QtCore.QAbstractTableModel):
 
     def data(self, mi, role):
         """Reimplemented to return the data."""
+        if profiling.enabled:
+            profiling.cell_data(self, role)
 
-        obj = self._editor.items()[mi.row()]
         column = self._editor.columns[mi.column()]
 
+        if role in style_roles:
+            # The styles which are the same for every object of a column are
+            # only converted once:
+            cache = column.get_style_cache()
+            value = cache.get(role, variable_style)
+            if value is not variable_style:
+                return value
+
+            value = self._style_data(
+                column, self._editor.items()[mi.row()], role)
+            if role not in cache:
+                for name in style_roles[role]:
+                    if not column.is_constant_style(name):
+                        cache[role] = variable_style
+                        break
+                else:
+                    cache[role] = value
+            return value
+
+        obj = self._editor.items()[mi.row()]
+
         if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
             text = column.get_value(obj)
             if text is not None:
@@ -102,7 +150,22 @@ class TableModel(QtCore.QAbstractTableModel):
             if tooltip:
                 return tooltip
 
-        elif role == QtCore.Qt.FontRole:
+        elif role == QtCore.Qt.UserRole:
+            return obj
+
+        elif role == QtCore.Qt.CheckStateRole:
+            if column.get_type(obj) == "bool" and column.show_checkbox:
+                if column.get_raw_value(obj):
+                    return QtCore.Qt.Checked
+                else:
+                    return QtCore.Qt.Unchecked
+
+        return None
+
+    def _style_data(self, column, obj, role):
+        """ Returns the data of a style role.
+        """
+        if role == QtCore.Qt.FontRole:
             font = column.get_text_font(obj)
             if font is not None:
                 return QtGui.QFont(font)
@@ -130,16 +193,6 @@ class TableModel(QtCore.QAbstractTableModel):
                 q_color = as_qcolor(color)
                 return QtGui.QBrush(q_color)
 
-        elif role == QtCore.Qt.UserRole:
-            return obj
-
-        elif role == QtCore.Qt.CheckStateRole:
-            if column.get_type(obj) == "bool" and column.show_checkbox:
-                if column.get_raw_value(obj):
-                    return QtCore.Qt.Checked
-                else:
-                    return QtCore.Qt.Unchecked
-
         return None
 
     def flags(self, mi):
@@ -156,21 +209,58 @@ class TableModel(QtCore.QAbstractTableModel):
         flags = QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEnabled | \
             QtCore.Qt.ItemIsDragEnabled
 
-        obj = editor.items()[mi.row()]
-        column = editor.columns[mi.column()]
-
         if editor.factory:
-            if editor.factory.editable and column.is_editable(obj):
+            editable, checkable = self._get_cell_states(mi.row(), mi.column())
+            if editor.factory.editable and editable:
                 flags |= QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsDropEnabled
 
             if editor.factory.reorderable:
                 flags |= QtCore.Qt.ItemIsDropEnabled
 
-            if column.get_type(obj) == "bool" and column.show_checkbox:
+            if checkable:
                 flags |= QtCore.Qt.ItemIsUserCheckable
 
         return flags
 
+    def flush_cell_states(self, *args):
+        """ Discards the cached states of the cells, which must be called
+            when the objects displayed change.
+        """
+        self._cell_states.clear()
+
+    def _get_cell_states(self, row, column_index):
+        """ Returns whether a cell is editable and whether it is checkable.
+            Columns whose states are the same for every object only compute
+            them once, while other cells cache them until the rows change.
+            The table editor always listens to the traits of the objects and
+            refreshes (discarding the cached states) when any of them change,
+            so only states computed from data which is not a trait of the
+            objects need the editor to be refreshed explicitly.
+        """
+        column = self._editor.columns[column_index]
+        cache = column.get_style_cache()
+        states = cache.get('cell_states', variable_style)
+        if states is not variable_style:
+            return states
+
+        key = (row, column_index)
+        states = self._cell_states.get(key)
+        if states is None:
+            obj = self._editor.items()[row]
+            states = (column.is_editable(obj),
+                      column.get_type(obj) == "bool" and column.show_checkbox)
+            if 'cell_states' not in cache and (
+                    column.is_constant_style('editable') and
+                    column.is_constant_style('type')):
+                cache['cell_states'] = states
+            else:
+                cache['cell_states'] = variable_style
+                if len(self._cell_states) >= cell_states_cache_size:
+                    self._cell_states.clear()
+                self._cell_states[key] = states
+
+        return states
+
     def headerData(self, section, orientation, role):
         """Reimplemented to return the header data."""
 
@@ -36,6 +36,7 @@ from traits.api import (Any, Bool, Callable, Event, HasStrictTraits, Instance,
 
 from traitsui.tabular_adapter import TabularAdapter
 from .editor import Editor
+from .helper import icon_cache
 from .tabular_model import TabularModel
 
 
@@ -118,9 +119,6 @@ class TabularEditor(Editor):
     # Dictionary mapping image names to QIcons
     images = Any({})
 
-    # Dictionary mapping ImageResource objects to QIcons
-    image_resources = Any({})
-
     # An image being converted:
     image = Image
 
@@ -218,9 +216,9 @@ class TabularEditor(Editor):
                              dispatch='ui')
 
         # Rebuild the editor columns and headers whenever the adapter's
-        # 'columns' changes:
-        self.on_trait_change(self.update_editor, 'adapter.columns',
-                             dispatch='ui')
+        # 'columns' changes (or its rows change):
+        self.on_trait_change(self.update_editor,
+                             'adapter.[columns,rows_changed]', dispatch='ui')
 
     def dispose(self):
         """ Disposes of the contents of an editor.
@@ -234,10 +232,11 @@ class TabularEditor(Editor):
 
         self.on_trait_change(self.refresh_editor, 'adapter.+update',
                              remove=True)
-        self.on_trait_change(self.update_editor, 'adapter.columns',
-                             remove=True)
+        self.on_trait_change(self.update_editor,
+                             'adapter.[columns,rows_changed]', remove=True)
 
         self.adapter.cleanup()
+        self.model.flush_fetched_text()
 
         super(TabularEditor, self).dispose()
 
@@ -260,6 +259,8 @@ class TabularEditor(Editor):
     def refresh_editor(self):
         """ Requests the table view to redraw itself.
         """
+        self.model.flush_cell_states()
+        self.model.refresh_fetched_text()
         self.control.viewport().update()
 
     def callx(self, func, *args, **kw):
@@ -311,9 +312,7 @@ class TabularEditor(Editor):
     def _add_image(self, image_resource):
         """ Adds a new image to the image map.
         """
-        image = image_resource.create_icon()
-
-        self.image_resources[image_resource] = image
+        image = icon_cache.get_resource_icon(image_resource)
         self.images[image_resource.name] = image
 
         return image
@@ -326,10 +325,7 @@ class TabularEditor(Editor):
             image = self.image
 
         if isinstance(image, ImageResource):
-            result = self.image_resources.get(image)
-            if result is not None:
-                return result
-            return self._add_image(image)
+            return icon_cache.get_resource_icon(image)
 
         return self.images.get(image)
 
@@ -22,12 +22,19 @@
 #  Imports:
 #-------------------------------------------------------------------------
 
+import logging
+import threading
+
 from pyface.qt import QtCore, QtGui
 
+from traitsui import profiling
 from traitsui.ui_traits import SequenceTypes
 
 from .clipboard import PyMimeData
 
+# Logger for the module:
+logger = logging.getLogger(__name__)
+
 #-------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------
@@ -43,6 +50,22 @@ alignment_map = {
 # MIME type for internal table drag/drop operations
 tabular_mime_type = 'traits-ui-tabular-editor'
 
+# The adapter style (see TabularAdapter.is_constant_style) defining each style
+# role:
+style_roles = {
+    QtCore.Qt.FontRole: 'font',
+    QtCore.Qt.TextAlignmentRole: 'alignment',
+    QtCore.Qt.BackgroundRole: 'bg_color',
+    QtCore.Qt.ForegroundRole: 'text_color',
+}
+
+# Marks the style roles whose value depends on the item in a style cache:
+variable_style = object()
+
+# The maximum number of cells whose states (or text fetched in the background)
+# are cached by a model:
+cell_states_cache_size = 100000
+
 #-------------------------------------------------------------------------
 #  'TabularModel' class:
 #-------------------------------------------------------------------------
@@ -51,6 +74,9 @@ tabular_mime_type = 'traits-ui-tabular-editor'
 class TabularModel(QtCore.QAbstractTableModel):
     """ The model for tabular data."""
 
+    # Emitted by a worker thread with the text it fetched for a block of rows:
+    _block_fetched = QtCore.Signal(object)
+
     def __init__(self, editor, parent=None):
         """ Initialise the object.
         """
@@ -58,6 +84,41 @@ class TabularModel(QtCore.QAbstractTableModel):
 
         self._editor = editor
 
+        # The (editable, draggable) states of the cells, keyed by column if the
+        # adapter's flags are uniform, or by (row, column) otherwise (in which
+        # case they are only cached if the editor is updated when the items
+        # change):
+        self._cell_states = {}
+
+        # The cached states are discarded whenever the rows change:
+        for signal in (self.modelReset, self.layoutChanged, self.rowsInserted,
+                       self.rowsRemoved, self.rowsMoved, self.dataChanged):
+            signal.connect(self.flush_cell_states)
+
+        # The text of the cells fetched in the background (if the adapter's
+        # 'fetch_in_background' is set), keyed by (row, column), and the text
+        # fetched before the last refresh, displayed until it is fetched
+        # again:
+        self._fetched = {}
+        self._stale = {}
+
+        # The blocks of rows waiting to be fetched (the most recently
+        # requested last), and the (generation, block) pairs being fetched:
+        self._pending = []
+        self._fetching = set()
+
+        # Incremented whenever the fetched text becomes obsolete, so that the
+        # blocks being fetched at the time are discarded:
+        self._generation = 0
+
+        # The copies of the adapter not used by any worker thread:
+        self._adapter_copies = []
+
+        self._block_fetched.connect(self._store_block)
+        for signal in (self.modelReset, self.layoutChanged, self.rowsInserted,
+                       self.rowsRemoved, self.rowsMoved):
+            signal.connect(self.flush_fetched_text)
+
     #-------------------------------------------------------------------------
     #  QAbstractItemModel interface:
     #-------------------------------------------------------------------------
@@ -65,11 +126,32 @@ class TabularModel(QtCore.QAbstractTableModel):
     def data(self, mi, role):
         """ Reimplemented to return the data.
         """
+        if profiling.enabled:
+            profiling.cell_data(self, role)
         editor = self._editor
         adapter = editor.adapter
         obj, name = editor.object, editor.name
         row, column = mi.row(), mi.column()
 
+        if role in style_roles:
+            # The styles which are the same for every item are only converted
+            # once:
+            cache = adapter.get_style_cache()
+            value = cache.get(role, variable_style)
+            if value is not variable_style:
+                return value
+
+            value = self._style_data(adapter, obj, name, row, column, role)
+            if role not in cache:
+                if adapter.is_constant_style(style_roles[role]):
+                    cache[role] = value
+                else:
+                    cache[role] = variable_style
+            return value
+
+        if role == QtCore.Qt.DisplayRole and adapter.fetch_in_background:
+            return self._fetched_text(row, column)
+
         if role == QtCore.Qt.DisplayRole or role == QtCore.Qt.EditRole:
             return adapter.get_text(obj, name, row, column)
 
@@ -85,7 +167,12 @@ class TabularModel(QtCore.QAbstractTableModel):
             if tooltip:
                 return tooltip
 
-        elif role == QtCore.Qt.FontRole:
+        return None
+
+    def _style_data(self, adapter, obj, name, row, column, role):
+        """ Returns the data of a style role.
+        """
+        if role == QtCore.Qt.FontRole:
             font = adapter.get_font(obj, name, row, column)
             if font is not None:
                 return QtGui.QFont(font)
@@ -126,6 +213,8 @@ class TabularModel(QtCore.QAbstractTableModel):
         row, column = mi.row(), mi.column()
 
         editor.adapter.set_text(obj, name, row, column, value)
+        self._fetched.pop((row, column), None)
+        self._stale.pop((row, column), None)
         self.dataChanged.emit(mi, mi)
         return True
 
@@ -143,21 +232,11 @@ class TabularModel(QtCore.QAbstractTableModel):
         if editor.factory.selectable:
             flags |= QtCore.Qt.ItemIsSelectable
 
-        # If the adapter defines get_can_edit_cell(), use it to determine
-        # editability over the row-wise get_can_edit().
-        if (editor.factory.editable and 'edit' in editor.factory.operations and
-                hasattr(editor.adapter, 'get_can_edit_cell')):
-            if editor.adapter.get_can_edit_cell(editor.object, editor.name,
-                                                row, column):
-                flags |= QtCore.Qt.ItemIsEditable
-        elif (editor.factory.editable and 'edit' in editor.factory.operations and
-                editor.adapter.get_can_edit(editor.object, editor.name, row)):
+        editable, draggable = self._get_cell_states(row, column)
+        if editable:
             flags |= QtCore.Qt.ItemIsEditable
 
-        if editor.adapter.get_drag(
-                editor.object,
-                editor.name,
-                row) is not None:
+        if draggable:
             flags |= QtCore.Qt.ItemIsDragEnabled
 
         if editor.factory.editable:
@@ -165,6 +244,181 @@ class TabularModel(QtCore.QAbstractTableModel):
 
         return flags
 
+    def flush_cell_states(self, *args):
+        """ Discards the cached states of the cells, which must be called
+            when the items displayed change.
+        """
+        self._cell_states.clear()
+
+    def _get_cell_states(self, row, column):
+        """ Returns whether a cell is editable and whether it is draggable,
+            computing them once per column if the adapter's flags are uniform.
+            Otherwise the states depend on the items, so they are only cached
+            if the editor's factory has 'auto_update' set, which refreshes the
+            editor (discarding them) when the items change.
+        """
+        editor = self._editor
+        adapter = editor.adapter
+        factory = editor.factory
+        uniform_flags = adapter.uniform_flags
+        key = column if uniform_flags else (row, column)
+        states = self._cell_states.get(key)
+        if states is None:
+            obj, name = editor.object, editor.name
+            editable = False
+            if factory.editable and 'edit' in factory.operations:
+                # If the adapter defines get_can_edit_cell(), use it to
+                # determine editability over the row-wise get_can_edit().
+                if hasattr(adapter, 'get_can_edit_cell'):
+                    editable = adapter.get_can_edit_cell(obj, name, row,
+                                                         column)
+                else:
+                    editable = adapter.get_can_edit(obj, name, row)
+            draggable = adapter.get_drag(obj, name, row) is not None
+
+            states = (bool(editable), draggable)
+            if uniform_flags or factory.auto_update:
+                if len(self._cell_states) >= cell_states_cache_size:
+                    self._cell_states.clear()
+                self._cell_states[key] = states
+
+        return states
+
+    def flush_fetched_text(self, *args):
+        """ Discards the text fetched in the background and the pending
+            requests, which must be called when the rows displayed change.
+        """
+        self._fetched.clear()
+        self._stale.clear()
+        del self._pending[:]
+        del self._adapter_copies[:]
+        self._generation += 1
+
+    def refresh_fetched_text(self):
+        """ Fetches the text of the cells again when they are next displayed,
+            displaying the text fetched before until then.
+        """
+        if self._fetched:
+            self._stale.update(self._fetched)
+            self._fetched.clear()
+        del self._pending[:]
+        del self._adapter_copies[:]
+        self._generation += 1
+
+    def _fetched_text(self, row, column):
+        """ Returns the text of a cell if it has been fetched, or else
+            requests the block of rows containing it and returns a
+            placeholder.
+        """
+        key = (row, column)
+        try:
+            return self._fetched[key]
+        except KeyError:
+            pass
+
+        adapter = self._editor.adapter
+        block = row // max(adapter.fetch_block_size, 1)
+        if ((self._generation, block) not in self._fetching and
+                block not in self._pending):
+            self._pending.append(block)
+            self._start_fetches()
+
+        return self._stale.get(key, adapter.fetch_placeholder)
+
+    def _start_fetches(self):
+        """ Starts fetching the most recently requested visible blocks of
+            rows, up to the adapter's maximum number of fetches.
+        """
+        editor = self._editor
+        adapter = editor.adapter
+        self._cancel_hidden_blocks()
+
+        size = max(adapter.fetch_block_size, 1)
+        n_rows = self.rowCount(None)
+        n_columns = self.columnCount(None)
+        pending = self._pending
+        while pending and len(self._fetching) < max(adapter.max_fetches, 1):
+            block = pending.pop()
+            first = block * size
+            last = min(first + size, n_rows) - 1
+            if last < first:
+                continue
+
+            key = (self._generation, block)
+            self._fetching.add(key)
+            copies = self._adapter_copies
+            copy = copies.pop() if copies else adapter.copy_for_thread()
+            thread = threading.Thread(
+                target=self._fetch_block,
+                args=(key, copy, editor.object, editor.name, first, last,
+                      n_columns))
+            thread.daemon = True
+            thread.start()
+
+    def _cancel_hidden_blocks(self):
+        """ Forgets the pending requests for the blocks of rows which have
+            been scrolled out of view.
+        """
+        view = self._editor.control
+        if (view is None) or (not self._pending):
+            return
+
+        first = view.rowAt(0)
+        if first < 0:
+            return
+        last = view.rowAt(view.viewport().height() - 1)
+        if last < 0:
+            last = self.rowCount(None) - 1
+
+        size = max(self._editor.adapter.fetch_block_size, 1)
+        first, last = first // size, last // size
+        self._pending = [block for block in self._pending
+                         if first <= block <= last]
+
+    def _fetch_block(self, key, adapter, obj, name, first, last, n_columns):
+        """ Fetches the text of a block of rows, in a worker thread.
+        """
+        texts = {}
+        try:
+            for row in xrange(first, last + 1):
+                if key[0] != self._generation:
+                    # The text is obsolete:
+                    texts = None
+                    break
+
+                for column in xrange(n_columns):
+                    try:
+                        text = adapter.get_text(obj, name, row, column)
+                    except Exception:
+                        logger.exception('Error fetching the text of row %d, '
+                                         'column %d', row, column)
+                        text = ''
+                    texts[(row, column)] = text
+        finally:
+            try:
+                self._block_fetched.emit((key, adapter, first, last, texts))
+            except RuntimeError:
+                # The model has been deleted.
+                pass
+
+    def _store_block(self, result):
+        """ Stores the text fetched for a block of rows and updates the
+            view, then starts fetching the next pending block.
+        """
+        key, adapter, first, last, texts = result
+        self._fetching.discard(key)
+        if key[0] == self._generation:
+            self._adapter_copies.append(adapter)
+            if texts:
+                if len(self._fetched) >= cell_states_cache_size:
+                    self._fetched.clear()
+                self._fetched.update(texts)
+                self.dataChanged.emit(
+                    self.index(first, 0),
+                    self.index(last, self.columnCount(None) - 1))
+
+        self._start_fetches()
+
     def headerData(self, section, orientation, role):
         """ Reimplemented to return the header data.
         """
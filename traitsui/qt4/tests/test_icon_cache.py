@@ -0,0 +1,94 @@
+import unittest
+
+from traitsui.tests._tools import skip_if_not_qt4
+
+
+@skip_if_not_qt4
+class TestIconCache(unittest.TestCase):
+
+    def setUp(self):
+        from pyface.qt import QtGui
+        from traitsui.qt4.helper import IconCache
+
+        self.QIcon = QtGui.QIcon
+        self.cache = IconCache(maxsize=2)
+        self.created = []
+
+    def _factory(self):
+        icon = self.QIcon()
+        self.created.append(icon)
+        return icon
+
+    def test_hit_returns_same_icon(self):
+        first = self.cache.get('a', ('path',), factory=self._factory)
+        second = self.cache.get('a', ('path',), factory=self._factory)
+
+        self.assertIs(first, second)
+        self.assertEqual(len(self.created), 1)
+        stats = self.cache.statistics()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_key_includes_path_and_state(self):
+        self.cache.get('a', ('path1',), factory=self._factory)
+        self.cache.get('a', ('path2',), factory=self._factory)
+
+        self.assertEqual(len(self.created), 2)
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.get('a', factory=self._factory)
+        self.cache.get('b', factory=self._factory)
+        # Touch 'a' so that 'b' becomes the least recently used entry:
+        self.cache.get('a', factory=self._factory)
+        self.cache.get('c', factory=self._factory)
+
+        stats = self.cache.statistics()
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['evictions'], 1)
+
+        self.cache.get('a', factory=self._factory)
+        self.assertEqual(len(self.created), 3)
+        self.cache.get('b', factory=self._factory)
+        self.assertEqual(len(self.created), 4)
+
+    def test_unhashable_path_is_not_cached(self):
+        self.cache.get('a', [['path']], factory=self._factory)
+        self.cache.get('a', [['path']], factory=self._factory)
+
+        self.assertEqual(len(self.created), 2)
+        self.assertEqual(self.cache.statistics()['size'], 0)
+
+
+
+@skip_if_not_qt4
+class TestTreeEditorIcons(unittest.TestCase):
+
+    def test_cache_keys_do_not_hold_tree_nodes(self):
+        from traits.api import HasTraits, Instance, List, Str
+        from traitsui.api import Item, TreeEditor, TreeNode, View
+        from traitsui.qt4.helper import icon_cache
+
+        class Folder(HasTraits):
+            name = Str
+            children = List
+
+        node = TreeNode(node_for=[Folder], children='children', label='name',
+                        icon_group='folder', icon_open='folder',
+                        icon_item='folder')
+        view = View(Item('root', editor=TreeEditor(nodes=[node]),
+                         show_label=False))
+
+        class Model(HasTraits):
+            root = Instance(Folder)
+
+        model = Model(root=Folder(name='root', children=[Folder()]))
+        ui = model.edit_traits(view=view)
+        ui.dispose()
+
+        for key in icon_cache._icons:
+            self.assertNotIn(node, key[1] or ())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,17 +24,20 @@ import logging
 from pyface.qt import QtCore, QtGui
 
 from pyface.api import ImageResource
+from pyface.resource_manager import resource_manager
 from pyface.ui_traits import convert_image
 from pyface.timer.api import do_later
 from traits.api import Any, Event
 from traitsui.api import TreeNode, ObjectTreeNode, MultiTreeNode
+from traitsui.conditions import ConditionCache
+from traitsui.helper import compiled
 from traitsui.undo import ListUndoItem
 from traitsui.tree_node import ITreeNodeAdapterBridge
 from traitsui.menu import Menu, Action, Separator
 
 from clipboard import clipboard, PyMimeData
 from editor import Editor
-from helper import pixmap_cache
+from helper import icon_cache, pixmap_cache
 
 logger = logging.getLogger(__name__)
 
@@ -185,8 +188,13 @@ class SimpleEditor(Editor):
             # Otherwise, just create the tree control:
             self.control = self._tree = _TreeWidget(self)
 
-        # Set up the mapping between objects and tree id's:
+        # Set up the mapping between (object, children name) and tree id's,
+        # and between objects and the children names they are shown with:
         self._map = {}
+        self._names = {}
+
+        # Set up the registry of objects being listened to:
+        self._listeners = {}
 
         # Initialize the 'undo state' stack:
         self._undoable = []
@@ -261,6 +269,9 @@ class SimpleEditor(Editor):
             self._tree.blockSignals(True)
 
             self._delete_node(self._tree.invisibleRootItem())
+            self._remove_all_listeners()
+            if self._conditions is not None:
+                self._conditions.reset()
 
             self._tree = None
 
@@ -276,7 +287,7 @@ class SimpleEditor(Editor):
         if levels > 0:
             expanded, node, object = self._get_node_data(nid)
             if self._has_children(node, object):
-                self._expand_node(nid)
+                self._expand_node(nid, expand)
                 if expand:
                     nid.setExpanded(True)
                 for cnid in self._nodes_for(nid):
@@ -307,6 +318,8 @@ class SimpleEditor(Editor):
 
         tree.clear()
         self._map = {}
+        self._names = {}
+        self._remove_all_listeners()
 
         object, node = self._node_for(self.value)
         if node is not None:
@@ -315,11 +328,12 @@ class SimpleEditor(Editor):
             else:
                 nid = self._create_item(tree, node, object)
 
-            self._map[id(object)] = [(node.get_children_id(object), nid)]
-            self._add_listeners(node, object)
             self._set_node_data(nid, (False, node, object))
+            self._map_node(nid)
+            nid._listening = False
+            self._attach_listeners(nid, False)
             if self.factory.hide_root or self._has_children(node, object):
-                self._expand_node(nid)
+                self._expand_node(nid, True)
                 if not self.factory.hide_root:
                     nid.setExpanded(True)
                     tree.setCurrentItem(nid)
@@ -407,8 +421,11 @@ class SimpleEditor(Editor):
         """ Create  a new TreeWidgetItem as per word_wrap policy.
 
         Index is the index of the new node in the parent:
-            None implies append the child to the end. """
-        if index is None:
+            None implies append the child to the end. If nid is None the item
+            is created without a parent. """
+        if nid is None:
+            cnid = QtGui.QTreeWidgetItem()
+        elif index is None:
             cnid = QtGui.QTreeWidgetItem(nid)
         else:
             cnid = QtGui.QTreeWidgetItem()
@@ -455,40 +472,230 @@ class SimpleEditor(Editor):
         """ Inserts a new node before a specified index into the children of the
             specified node.
         """
+        return self._insert_nodes(nid, index, [(object, node)])[0]
+
+    #-------------------------------------------------------------------------
+    #  Inserts a batch of new nodes into the specified node:
+    #-------------------------------------------------------------------------
 
-        cnid = self._create_item(nid, node, object, index)
+    def _insert_nodes(self, nid, index, children, shown=None):
+        """ Inserts new nodes for a list of child objects (or (object, node)
+            tuples) before a specified index into the children of the
+            specified node, or appends them if index is None.
 
-        has_children = self._has_children(node, object)
-        self._set_node_data(cnid, (False, node, object))
-        self._map.setdefault(id(object), []).append(
-            (node.get_children_id(object), cnid))
-        self._add_listeners(node, object)
+            The new items are built without a parent and added to the tree in
+            a single operation with updates disabled. Listeners on the new
+            objects are only added once the nodes are shown, which is assumed
+            to be the case if 'shown' is True, or if the specified node's
+            children are currently visible when 'shown' is None.
+        """
+        cnids = []
+        auto_open = []
+        for child in children:
+            child, child_node = self._node_for(child)
+            if child_node is None:
+                continue
 
-        # Automatically expand the new node (if requested):
-        if has_children:
-            if node.can_auto_open(object):
+            cnid = self._create_item(None, child_node, child)
+            self._set_node_data(cnid, (False, child_node, child))
+            self._map_node(cnid)
+            cnid._listening = False
+
+            if self._has_children(child_node, child):
+                if child_node.can_auto_open(child):
+                    auto_open.append(cnid)
+                else:
+                    # Qt only draws the control that expands the tree if there
+                    # is a child.  As the tree is being populated lazily we
+                    # create a dummy that will be removed when the node is
+                    # expanded for the first time.
+                    cnid._dummy = QtGui.QTreeWidgetItem(cnid)
+
+            cnids.append(cnid)
+
+        if len(cnids) == 0:
+            return cnids
+
+        if shown is None:
+            shown = self._children_shown(nid)
+
+        tree = self._tree
+        updates_enabled = tree.updatesEnabled()
+        tree.setUpdatesEnabled(False)
+        try:
+            if index is None:
+                nid.addChildren(cnids)
+            else:
+                nid.insertChildren(index, cnids)
+
+            if shown:
+                for cnid in cnids:
+                    self._attach_listeners(cnid, False)
+
+            # Automatically expand the new nodes (if requested):
+            for cnid in auto_open:
                 cnid.setExpanded(True)
+        finally:
+            tree.setUpdatesEnabled(updates_enabled)
+
+        return cnids
+
+    #-------------------------------------------------------------------------
+    #  Adds/Removes the listeners for a node which is being shown/hidden:
+    #-------------------------------------------------------------------------
+
+    def _attach_listeners(self, nid, refresh=True):
+        """ Adds the event listeners for the object of a node when the node is
+            shown. If 'refresh' is True, the node's label, icon and children
+            are also brought up to date, since changes made while the node was
+            hidden were not tracked.
+
+            Listeners are shared by all the nodes of an object, and are
+            registered with the object only once.
+        """
+        if getattr(nid, '_listening', True):
+            return
+
+        nid._listening = True
+        expanded, node, object = self._get_node_data(nid)
+        key = (id(object), id(node))
+        info = self._listeners.get(key)
+        if info is None:
+            self._listeners[key] = [object, node, 1]
+            self._add_listeners(node, object)
+        else:
+            info[2] += 1
+
+        if refresh:
+            blk = self._tree.blockSignals(True)
+            try:
+                self._set_label(nid, node.get_label(object), 0)
+                self._set_column_labels(nid, node.get_column_labels(object))
+                self._update_icon(nid)
+            finally:
+                self._tree.blockSignals(blk)
+
+            if expanded:
+                self._resync_children(nid)
             else:
-                # Qt only draws the control that expands the tree if there is a
-                # child.  As the tree is being populated lazily we create a
-                # dummy that will be removed when the node is expanded for the
-                # first time.
-                cnid._dummy = QtGui.QTreeWidgetItem(cnid)
+                self._update_dummy(nid, self._has_children(node, object))
 
-        # Return the newly created node:
-        return cnid
+    def _detach_listeners(self, nid):
+        """ Removes the event listeners for the object of a node when the node
+            is hidden or deleted, once no other node of the object is shown.
+        """
+        if not getattr(nid, '_listening', False):
+            return
+
+        nid._listening = False
+        expanded, node, object = self._get_node_data(nid)
+        key = (id(object), id(node))
+        info = self._listeners[key]
+        info[2] -= 1
+        if info[2] == 0:
+            del self._listeners[key]
+            self._remove_listeners(node, object)
+
+    def _remove_all_listeners(self):
+        """ Removes all event listeners registered by the editor.
+        """
+        for object, node, count in self._listeners.values():
+            self._remove_listeners(node, object)
+        self._listeners = {}
 
     #-------------------------------------------------------------------------
-    #  Deletes a specified tree node and all its children:
+    #  Shows/Hides the visible descendants of an expanded/collapsed node:
     #-------------------------------------------------------------------------
 
-    def _delete_node(self, nid):
-        """ Deletes a specified tree node and all its children.
+    def _show_children(self, nid):
+        """ Adds the listeners for the children of a node which has become
+            visible, and for their visible descendants.
         """
+        for cnid in self._nodes_for(nid):
+            self._attach_listeners(cnid)
+            if cnid.isExpanded():
+                self._show_children(cnid)
 
+    def _hide_children(self, nid):
+        """ Removes the listeners for the children of a node which has been
+            hidden, and for their previously visible descendants.
+        """
         for cnid in self._nodes_for(nid):
-            self._delete_node(cnid)
+            self._detach_listeners(cnid)
+            if cnid.isExpanded():
+                self._hide_children(cnid)
+
+    #-------------------------------------------------------------------------
+    #  Brings the children of a populated node up to date:
+    #-------------------------------------------------------------------------
+
+    def _resync_children(self, nid):
+        """ Rebuilds the children of a populated node if its object's children
+            changed while the node was hidden.
+        """
+        expanded, node, object = self._get_node_data(nid)
+        children = [self._node_for(child)[0]
+                    for child in node.get_children(object)]
+        cnids = self._nodes_for(nid)
+        if len(children) == len(cnids):
+            for child, cnid in zip(children, cnids):
+                if self._get_node_data(cnid)[2] is not child:
+                    break
+            else:
+                return
+
+        self._delete_children(nid)
+        self._insert_nodes(nid, None, children)
+
+    #-------------------------------------------------------------------------
+    #  Returns whether a node is visible:
+    #-------------------------------------------------------------------------
+
+    def _is_shown(self, nid):
+        """ Returns whether a node is visible, i.e. whether all of its
+            ancestors are expanded.
+        """
+        pnid = nid.parent()
+        while pnid is not None:
+            if not pnid.isExpanded():
+                return False
+            pnid = pnid.parent()
+
+        return True
+
+    def _children_shown(self, nid, expanding=False):
+        """ Returns whether the children of a node are visible. If 'expanding'
+            is True the node is assumed to be about to be expanded.
+        """
+        if nid is self._tree.invisibleRootItem():
+            return True
+
+        return (expanding or nid.isExpanded()) and self._is_shown(nid)
+
+    #-------------------------------------------------------------------------
+    #  Adds or removes the dummy child of an unexpanded node:
+    #-------------------------------------------------------------------------
 
+    def _update_dummy(self, nid, has_children):
+        """ Makes sure that an unexpanded node has a dummy child if and only
+            if its object has children.
+        """
+        dummy = getattr(nid, '_dummy', None)
+        if dummy is None and has_children:
+            # if model now has children add dummy child
+            nid._dummy = QtGui.QTreeWidgetItem(nid)
+        elif dummy is not None and not has_children:
+            # if model no longer has children remove dummy child
+            nid.removeChild(dummy)
+            del nid._dummy
+
+    #-------------------------------------------------------------------------
+    #  Deletes a specified tree node and all its children:
+    #-------------------------------------------------------------------------
+
+    def _delete_node(self, nid):
+        """ Deletes a specified tree node and all its children.
+        """
         # See if it is a dummy.
         pnid = nid.parent()
         if pnid is not None and getattr(pnid, '_dummy', None) is nid:
@@ -496,41 +703,126 @@ class SimpleEditor(Editor):
             del pnid._dummy
             return
 
-        try:
-            expanded, node, object = self._get_node_data(nid)
-        except AttributeError:
-            # The node has already been deleted.
-            pass
-        else:
-            id_object = id(object)
-            object_info = self._map[id_object]
-            for i, info in enumerate(object_info):
-                # QTreeWidgetItem does not have an equal operator, so use id()
-                if id(nid) == id(info[1]):
-                    del object_info[i]
-                    break
+        self._forget_node(nid)
 
-            if len(object_info) == 0:
-                self._remove_listeners(node, object)
-                del self._map[id_object]
-
-        if pnid is None:
+        if nid is self._tree.invisibleRootItem():
+            nid.takeChildren()
+        elif pnid is None:
             self._tree.takeTopLevelItem(self._tree.indexOfTopLevelItem(nid))
         else:
             pnid.removeChild(nid)
 
+    #-------------------------------------------------------------------------
+    #  Deletes a range of the children of a specified tree node:
+    #-------------------------------------------------------------------------
+
+    def _delete_children(self, nid, start=0, end=None):
+        """ Deletes the children of a specified tree node in the range
+            [start:end], and all their children.
+        """
+        count = nid.childCount()
+        if end is None or end > count:
+            end = count
+        if start >= end:
+            return
+
+        for i in range(start, end):
+            self._forget_node(nid.child(i))
+
+        dummy = getattr(nid, '_dummy', None)
+        if dummy is not None and start <= nid.indexOfChild(dummy) < end:
+            del nid._dummy
+
+        if start == 0 and end == count:
+            nid.takeChildren()
+        else:
+            for i in range(start, end):
+                nid.takeChild(start)
+
+    #-------------------------------------------------------------------------
+    #  Releases the resources associated with a node and its children:
+    #-------------------------------------------------------------------------
+
+    def _forget_node(self, nid):
+        """ Removes a node which is about to be deleted, and all its children,
+            from the editor's maps, and removes their listeners.
+        """
+        for i in range(nid.childCount()):
+            self._forget_node(nid.child(i))
+
+        try:
+            self._get_node_data(nid)
+        except AttributeError:
+            # The node is a dummy or has already been deleted.
+            return
+
+        self._unmap_node(nid)
+        self._detach_listeners(nid)
+
         # If the deleted node had an active editor panel showing, remove it:
         # Note: QTreeWidgetItem does not have an equal operator, so use id()
         if (self._editor is not None) and (
                 id(nid) == id(self._editor._editor_nid)):
             self._clear_editor()
 
+    #-------------------------------------------------------------------------
+    #  Adds/Removes a node to/from the map of objects to node ids:
+    #-------------------------------------------------------------------------
+
+    def _map_node(self, nid):
+        """ Adds a node to the maps of objects to node ids.
+        """
+        expanded, node, object = self._get_node_data(nid)
+        name = node.get_children_id(object)
+        names = self._names.setdefault(id(object), [])
+        if name not in names:
+            names.append(name)
+        self._map.setdefault((id(object), name), []).append(nid)
+
+    def _unmap_node(self, nid):
+        """ Removes a node from the maps of objects to node ids.
+        """
+        expanded, node, object = self._get_node_data(nid)
+        name = node.get_children_id(object)
+        key = (id(object), name)
+        nids = self._map.get(key, [])
+        for i, nid2 in enumerate(nids):
+            if nid2 is nid:
+                del nids[i]
+                break
+
+        if len(nids) == 0:
+            self._map.pop(key, None)
+            names = self._names.get(id(object), [])
+            if name in names:
+                names.remove(name)
+            if len(names) == 0:
+                self._names.pop(id(object), None)
+
+    def _nids_for(self, object, name=None):
+        """ Returns the node ids of a specified object for a children name, or
+            for all names if 'name' is None.
+        """
+        if name is None:
+            nids = []
+            for name in self._names.get(id(object), []):
+                nids.extend(self._map[(id(object), name)])
+        else:
+            nids = self._map.get((id(object), name), [])
+
+        # Guard against stale entries for an object whose id has been reused:
+        if len(nids) > 0 and self._get_node_data(nids[0])[2] is not object:
+            return []
+
+        return nids
+
     #-------------------------------------------------------------------------
     #  Expands the contents of a specified node (if required):
     #-------------------------------------------------------------------------
 
-    def _expand_node(self, nid):
-        """ Expands the contents of a specified node (if required).
+    def _expand_node(self, nid, expanding=False):
+        """ Expands the contents of a specified node (if required). If
+            'expanding' is True the node is about to be expanded in the tree.
         """
         expanded, node, object = self._get_node_data(nid)
 
@@ -542,10 +834,8 @@ class SimpleEditor(Editor):
                 nid.removeChild(dummy)
                 del nid._dummy
 
-            for child in node.get_children(object):
-                child, child_node = self._node_for(child)
-                if child_node is not None:
-                    self._append_node(nid, child_node, child)
+            self._insert_nodes(nid, None, node.get_children(object),
+                               self._children_shown(nid, expanding))
 
             # Indicate the item is now populated:
             self._set_node_data(nid, (True, node, object))
@@ -571,14 +861,14 @@ class SimpleEditor(Editor):
             if pnid is None:
                 return (None, None, None)
 
-        for i in range(pnid.childCount()):
-            if pnid.child(i) is nid:
-                _, pnode, pobject = self._get_node_data(pnid)
-                return (pnode, pobject, i)
-        else:
+        i = pnid.indexOfChild(nid)
+        if i < 0:
             # doesn't match any node, so return None
             return (None, None, None)
 
+        _, pnode, pobject = self._get_node_data(pnid)
+        return (pnode, pobject, i)
+
     #-------------------------------------------------------------------------
     #  Returns whether a specified object has any children:
     #-------------------------------------------------------------------------
@@ -604,34 +894,40 @@ class SimpleEditor(Editor):
         if not self.factory.show_icons:
             return QtGui.QIcon()
 
+        size = tuple(self.factory.icon_size)
         icon_name = node.get_icon(object, is_expanded)
         if isinstance(icon_name, basestring):
             if icon_name.startswith('@'):
-                image_resource = convert_image(icon_name, 4)
-                return image_resource.create_icon()
+                return icon_cache.get(
+                    icon_name, None, size,
+                    factory=lambda: convert_image(icon_name, 4).create_icon())
             elif icon_name in self.STD_ICON_MAP:
                 icon = self.STD_ICON_MAP[icon_name]
                 return self._tree.style().standardIcon(icon)
 
+            # The node itself is searched as the directories of the modules
+            # of its classes. They are resolved here so that the shared cache
+            # does not keep the node (and its editor's factory) alive:
             path = node.get_icon_path(object)
             if isinstance(path, basestring):
-                path = [path, node]
-            else:
-                path = path + [node]
+                path = (path,)
+            path = tuple(path) + tuple(
+                resource_manager._get_resource_path(node))
 
-            image_resource = ImageResource(icon_name, path)
+            return icon_cache.get(
+                icon_name, path, size,
+                factory=lambda: pixmap_cache(
+                    ImageResource(icon_name, list(path)).absolute_path))
 
         elif isinstance(icon_name, ImageResource):
-            image_resource = icon_name
+            return icon_cache.get(
+                icon_name.name, tuple(icon_name.search_path), size,
+                factory=lambda: pixmap_cache(icon_name.absolute_path))
 
-        else:
-            raise ValueError(
-                "Icon value must be a string or IImageResource instance: " +
-                "given {!r}".format(icon_name)
-            )
-
-        file_name = image_resource.absolute_path
-        return QtGui.QIcon(pixmap_cache(file_name))
+        raise ValueError(
+            "Icon value must be a string or IImageResource instance: " +
+            "given {!r}".format(icon_name)
+        )
 
     #-------------------------------------------------------------------------
     #  Adds the event listeners for a specified object:
@@ -663,7 +959,7 @@ class SimpleEditor(Editor):
 
         node.when_label_changed(object, self._label_updated, True)
         node.when_column_labels_change(
-            object, self._column_labels_updated, False)
+            object, self._column_labels_updated, True)
 
     #-------------------------------------------------------------------------
     #  Returns the tree node data for a specified object in the form
@@ -674,12 +970,9 @@ class SimpleEditor(Editor):
         """ Returns the tree node data for a specified object in the form
             ( expanded, node, nid ).
         """
-        info = self._map[id(object)]
-        for name2, nid in info:
-            if name == name2:
-                break
-        else:
-            nid = info[0][1]
+        nid = self._get_object_nid(object, name)
+        if nid is None:
+            raise KeyError(object)
 
         expanded, node, ignore = self._get_node_data(nid)
 
@@ -690,10 +983,9 @@ class SimpleEditor(Editor):
             form: [ ( expanded, node, nid ), ... ].
         """
         result = []
-        for name2, nid in self._map[id(object)]:
-            if name == name2:
-                expanded, node, ignore = self._get_node_data(nid)
-                result.append((expanded, node, nid))
+        for nid in self._nids_for(object, name):
+            expanded, node, ignore = self._get_node_data(nid)
+            result.append((expanded, node, nid))
 
         return result
 
@@ -871,14 +1163,13 @@ class SimpleEditor(Editor):
     def _get_object_nid(self, object, name=''):
         """ Gets the ID associated with a specified object (if any).
         """
-        info = self._map.get(id(object))
-        if info is None:
-            return None
-        for name2, nid in info:
-            if name == name2:
-                return nid
-        else:
-            return info[0][1]
+        nids = self._nids_for(object, name)
+        if len(nids) == 0:
+            nids = self._nids_for(object)
+            if len(nids) == 0:
+                return None
+
+        return nids[0]
 
     #-------------------------------------------------------------------------
     #  Clears the current editor pane (if any):
@@ -971,6 +1262,11 @@ class SimpleEditor(Editor):
         # yet):
         self._expand_node(nid)
 
+        # Listen to the children, and any of their expanded descendants,
+        # which are now visible:
+        if self._is_shown(nid):
+            self._show_children(nid)
+
         self._update_icon(nid)
 
     #-------------------------------------------------------------------------
@@ -980,6 +1276,9 @@ class SimpleEditor(Editor):
     def _on_item_collapsed(self, nid):
         """ Handles a tree node being collapsed.
         """
+        # Stop listening to the children which are no longer visible:
+        self._hide_children(nid)
+
         self._update_icon(nid)
 
     #-------------------------------------------------------------------------
@@ -1139,6 +1438,12 @@ class SimpleEditor(Editor):
                          'info': self.ui.info,
                          'handler': self.ui.handler}
 
+        # The menu conditions are only evaluated again if the traits they read
+        # have changed since the menu was last displayed for the same object:
+        if self._conditions is None:
+            self._conditions = ConditionCache(globals())
+        self._conditions.set_context(self._context)
+
         # Try to get the parent node of the node clicked on:
         pnid = nid.parent()
         if pnid is None or pnid is self._tree.invisibleRootItem():
@@ -1322,11 +1627,11 @@ class SimpleEditor(Editor):
         """ Returns whether the action should be defined in the user interface.
         """
         if action.defined_when != '':
-            if not eval(action.defined_when, globals(), self._context):
+            if not self._conditions.evaluate(action.defined_when):
                 return False
 
         if action.visible_when != '':
-            if not eval(action.visible_when, globals(), self._context):
+            if not self._conditions.evaluate(action.visible_when):
                 return False
 
         return True
@@ -1361,7 +1666,7 @@ class SimpleEditor(Editor):
             if method_name.find('(') < 0:
                 method_name += '()'
             try:
-                eval(method_name, globals(),
+                eval(compiled(method_name), globals(),
                      {'object': object,
                       'editor': self,
                       'node': node,
@@ -1395,7 +1700,7 @@ class SimpleEditor(Editor):
         if condition != '':
             value = True
             try:
-                if not eval(condition, globals(), self._context):
+                if not self._conditions.evaluate(condition):
                     value = False
             except Exception as e:
                 logger.warning(
@@ -1529,23 +1834,12 @@ class SimpleEditor(Editor):
             # expanded:
             if expanded:
                 # Delete all current child nodes:
-                for cnid in self._nodes_for(nid):
-                    self._delete_node(cnid)
+                self._delete_children(nid)
 
                 # Add all of the children back in as new nodes:
-                for child in children:
-                    child, child_node = self._node_for(child)
-                    if child_node is not None:
-                        self._append_node(nid, child_node, child)
+                self._insert_nodes(nid, None, children)
             else:
-                dummy = getattr(nid, '_dummy', None)
-                if dummy is None and len(children) > 0:
-                    # if model now has children add dummy child
-                    nid._dummy = QtGui.QTreeWidgetItem(nid)
-                elif dummy is not None and len(children) == 0:
-                    # if model no longer has children remove dummy child
-                    nid.removeChild(dummy)
-                    del nid._dummy
+                self._update_dummy(nid, len(children) > 0)
 
             # Try to expand the node (if requested):
             if node.can_auto_open(object):
@@ -1581,29 +1875,14 @@ class SimpleEditor(Editor):
             # expanded:
             if expanded:
                 # Remove all of the children that were deleted:
-                for cnid in self._nodes_for(nid)[start: end]:
-                    self._delete_node(cnid)
+                self._delete_children(nid, start, end)
 
                 remaining = len(children) - len(event.removed)
-                child_index = 0
                 # Add all of the children that were added:
-                for child in event.added:
-                    child, child_node = self._node_for(child)
-                    if child_node is not None:
-                        insert_index = (start + child_index) if \
-                            (start <= remaining) else None
-                        self._insert_node(nid, insert_index, child_node,
-                                          child)
-                        child_index += 1
+                insert_index = start if (start <= remaining) else None
+                self._insert_nodes(nid, insert_index, event.added)
             else:
-                dummy = getattr(nid, '_dummy', None)
-                if dummy is None and len(children) > 0:
-                    # if model now has children add dummy child
-                    nid._dummy = QtGui.QTreeWidgetItem(nid)
-                elif dummy is not None and len(children) == 0:
-                    # if model no longer has children remove dummy child
-                    nid.removeChild(dummy)
-                    del nid._dummy
+                self._update_dummy(nid, len(children) > 0)
 
             # Try to expand the node (if requested):
             if node.can_auto_open(object):
@@ -1619,17 +1898,10 @@ class SimpleEditor(Editor):
         # Prevent the itemChanged() signal from being emitted.
         blk = self._tree.blockSignals(True)
         try:
-            # Have to use a list rather than a set because nids for PyQt
-            # on Python 3 (QTreeWidgetItem instances) aren't hashable.
-            # This means potentially quadratic behaviour, but the number of
-            # nodes for a particular object shouldn't be high
-            nids = []
-            for name2, nid in self._map[id(object)]:
-                if nid not in nids:
-                    nids.append(nid)
-                    node = self._get_node_data(nid)[1]
-                    self._set_label(nid, node.get_label(object), 0)
-                    self._update_icon(nid)
+            for nid in self._nids_for(object):
+                node = self._get_node_data(nid)[1]
+                self._set_label(nid, node.get_label(object), 0)
+                self._update_icon(nid)
         finally:
             self._tree.blockSignals(blk)
 
@@ -1639,14 +1911,11 @@ class SimpleEditor(Editor):
         # Prevent the itemChanged() signal from being emitted.
         blk = self._tree.blockSignals(True)
 
-        nids = {}
-        for name2, nid in self._map[id(object)]:
-            if nid not in nids:
-                nids[nid] = None
-                node = self._get_node_data(nid)[1]
-                # Just do all of them at once. The number of columns should be
-                # small.
-                self._set_column_labels(nid, node.get_column_labels(object))
+        for nid in self._nids_for(object):
+            node = self._get_node_data(nid)[1]
+            # Just do all of them at once. The number of columns should be
+            # small.
+            self._set_column_labels(nid, node.get_column_labels(object))
 
         self._tree.blockSignals(blk)
 
@@ -19,6 +19,9 @@ from pyface.qt import QtCore, QtGui
 from traitsui.menu \
     import ApplyButton, RevertButton, OKButton, CancelButton, HelpButton
 
+from traitsui.undo \
+    import ContextJournal
+
 from ui_base \
     import BaseDialog
 
@@ -59,6 +62,9 @@ class _ModalDialog(BaseDialog):
     """Modal dialog box for Traits-based user interfaces.
     """
 
+    # The journal of changes made to the context, if the view uses one.
+    _journal = None
+
     def init(self, ui, parent, style):
         """Initialise the object.
         """
@@ -82,8 +88,12 @@ class _ModalDialog(BaseDialog):
             # Create the 'context' copies we will need while editing:
             context = ui.context
             ui._context = context
-            ui.context = self._copy_context(context)
-            ui._revert = self._copy_context(context)
+            if view.journal:
+                self._journal = ContextJournal(context)
+                ui.context = self._journal.working
+            else:
+                ui.context = self._copy_context(context)
+                ui._revert = self._copy_context(context)
 
         self.set_icon(view.icon)
 
@@ -169,6 +179,10 @@ class _ModalDialog(BaseDialog):
         """
         super(_ModalDialog, self).close(rc)
 
+        if self._journal is not None:
+            self._journal.dispose()
+            self._journal = None
+
         self.apply = self.revert = self.help = None
 
     def _copy_context(self, context):
@@ -193,16 +207,34 @@ class _ModalDialog(BaseDialog):
                 to_context[name] = None
 
         if to_context is self.ui._context:
-            on_apply = self.ui.view.on_apply
-            if on_apply is not None:
-                on_apply()
+            self._context_applied()
+
+    def _apply_journal(self, revert=False):
+        """Applies (or reverts) the journaled changes to the original context.
+        """
+        if revert:
+            self._journal.revert()
+        else:
+            self._journal.apply()
+
+        self._context_applied()
+
+    def _context_applied(self):
+        """Notifies the view that changes to the original context have been
+        applied or reverted.
+        """
+        on_apply = self.ui.view.on_apply
+        if on_apply is not None:
+            on_apply()
 
     def _on_finished(self, result):
         """Handles the user finishing with the dialog.
         """
         accept = bool(result)
 
-        if accept:
+        if self._journal is not None:
+            self._apply_journal(revert=not accept)
+        elif accept:
             self._apply_context(self.ui.context, self.ui._context)
         else:
             self._apply_context(self.ui._revert, self.ui._context)
@@ -213,7 +245,10 @@ class _ModalDialog(BaseDialog):
         """Handles a request to apply changes.
         """
         ui = self.ui
-        self._apply_context(ui.context, ui._context)
+        if self._journal is not None:
+            self._apply_journal()
+        else:
+            self._apply_context(ui.context, ui._context)
         self.revert.setEnabled(True)
         ui.handler.apply(ui.info)
         ui.modified = False
@@ -227,8 +262,11 @@ class _ModalDialog(BaseDialog):
         """Handles a request to revert changes.
         """
         ui = self.ui
-        self._apply_context(ui._revert, ui.context)
-        self._apply_context(ui._revert, ui._context)
+        if self._journal is not None:
+            self._apply_journal(revert=True)
+        else:
+            self._apply_context(ui._revert, ui.context)
+            self._apply_context(ui._revert, ui._context)
         self.revert.setEnabled(False)
         ui.handler.revert(ui.info)
         ui.modified = False
@@ -30,6 +30,9 @@ from traitsui.api \
 from traitsui.undo \
     import UndoHistory
 
+from traitsui import profiling
+from traitsui.helper import compiled
+
 from traitsui.help_template \
     import help_template
 
@@ -695,6 +698,8 @@ class _GroupPanel(object):
         """Adds a list of Item objects, creating a layout if needed.  Return
            the outermost layout.
         """
+        start = profiling.start()
+
         # Get local references to various objects we need:
         ui = self.ui
         info = ui.info
@@ -830,7 +835,7 @@ class _GroupPanel(object):
                 continue
 
             # Otherwise, it must be a trait Item:
-            object = eval(item.object_, globals(), ui.context)
+            object = eval(compiled(item.object_), globals(), ui.context)
             trait = object.base_trait(name)
             desc = trait.desc or ''
 
@@ -976,6 +981,9 @@ class _GroupPanel(object):
             if item.enabled_when != '':
                 ui.add_enabled(item.enabled_when, editor)
 
+        if start is not None:
+            profiling.items_added(self, start)
+
         return outer
 
     def _set_item_size_policy(self, editor, item, label, stretch):
@@ -42,11 +42,13 @@ from traits.api import (
     Instance,
     Int,
     Property,
-    Str)
+    Str,
+    on_trait_change)
 
 from traits.trait_base import user_name_for, xgetattr
 
 from .editor_factory import EditorFactory
+from .helper import compiled, is_overridden
 from .menu import Menu
 from .ui_traits import Image, AView, EditorStyle
 from .view import View
@@ -63,6 +65,21 @@ logger = logging.getLogger(__name__)
 # Flag used to indicate user has not specified a column label
 UndefinedLabel = '???'
 
+# The getter methods and traits the value of each style of a column depends
+# on:
+StyleDependencies = {
+    'text_color': (('get_text_color',), ('text_color',)),
+    'text_font': (('get_text_font',), ('text_font',)),
+    'cell_color': (('get_cell_color', 'is_editable'),
+                   ('cell_color', 'read_only_cell_color', 'editable')),
+    'horizontal_alignment': (('get_horizontal_alignment',),
+                             ('horizontal_alignment',)),
+    'vertical_alignment': (('get_vertical_alignment',),
+                           ('vertical_alignment',)),
+    'editable': (('is_editable',), ('editable',)),
+    'type': (('get_type',), ('type',)),
+}
+
 #-------------------------------------------------------------------------
 #  'TableColumn' class:
 #-------------------------------------------------------------------------
@@ -165,6 +182,10 @@ class TableColumn(HasPrivateTraits):
     # Optional maximum value a numeric cell value can have:
     maximum = Float(trait_value=True)
 
+    # The values derived by the toolkit from the styles which are the same for
+    # every object (emptied whenever a style changes):
+    _style_cache = Any
+
     #-------------------------------------------------------------------------
     #  Returns the actual object being edited:
     #-------------------------------------------------------------------------
@@ -400,6 +421,43 @@ class TableColumn(HasPrivateTraits):
         return ((self.key(object1) > self.key(object2)) -
                 (self.key(object1) < self.key(object2)))
 
+    #-------------------------------------------------------------------------
+    #  Returns whether a style of the column is the same for every object:
+    #-------------------------------------------------------------------------
+
+    def is_constant_style(self, name):
+        """ Returns whether the *name* style of the column ('text_color',
+            'text_font', 'cell_color', 'horizontal_alignment',
+            'vertical_alignment', 'editable' or 'type') is the same for every
+            object, because neither the methods nor the traits defining it are
+            overridden.
+        """
+        getters, trait_names = StyleDependencies[name]
+        for getter in getters:
+            if is_overridden(self, getter, TableColumn):
+                return False
+
+        for trait_name in trait_names:
+            if self.trait(trait_name).type == 'property':
+                return False
+
+        return True
+
+    #-------------------------------------------------------------------------
+    #  Returns the cache of the values derived from the constant styles:
+    #-------------------------------------------------------------------------
+
+    def get_style_cache(self):
+        """ Returns a dictionary in which toolkits can cache the values they
+            derive from the styles of the column which are the same for every
+            object (such as brushes and fonts). The dictionary is emptied
+            whenever a style of the column changes.
+        """
+        if self._style_cache is None:
+            self._style_cache = {}
+
+        return self._style_cache
+
     #-------------------------------------------------------------------------
     #  Returns the string representation of the table column:
     #-------------------------------------------------------------------------
@@ -409,6 +467,17 @@ class TableColumn(HasPrivateTraits):
         """
         return self.get_label()
 
+    #-- Trait Event Handlers -------------------------------------------------
+
+    @on_trait_change('text_color, text_font, cell_color, read_only_cell_color, '
+                     'horizontal_alignment, vertical_alignment, editable, '
+                     'type, show_checkbox')
+    def _style_changed(self):
+        """ Discards the values derived from the styles of the column.
+        """
+        if self._style_cache:
+            self._style_cache.clear()
+
 #-------------------------------------------------------------------------
 #  'ObjectColumn' class:
 #-------------------------------------------------------------------------
@@ -623,7 +692,8 @@ class ExpressionColumn(ObjectColumn):
         """ Gets the unformatted value of the column for a specified object.
         """
         try:
-            return eval(self.expression_, self.globals, {'object': object})
+            return eval(compiled(self.expression_), self.globals,
+                        {'object': object})
         except Exception:
             logger.exception('Error evaluating table column expression: %s' %
                              self.expression)
@@ -40,6 +40,7 @@ from traits.api import (
 from .editor_factory import EditorFactory
 from .editors.api import EnumEditor
 from .group import Group
+from .helper import compiled
 from .include import Include
 from .item import Item
 from .menu import Action
@@ -230,7 +231,7 @@ class EvalTableFilter(TableFilter):
         if self._traits is None:
             self._traits = object.trait_names()
         try:
-            return eval(self.expression_, globals(),
+            return eval(compiled(self.expression_), globals(),
                         object.get(*self._traits))
         except:
             return False
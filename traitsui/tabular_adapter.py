@@ -45,6 +45,8 @@ from traits.api import (
     on_trait_change,
     provides)
 
+from .helper import is_overridden
+
 #-------------------------------------------------------------------------
 #  'ITabularAdapter' interface:
 #-------------------------------------------------------------------------
@@ -159,6 +161,29 @@ class TabularAdapter(HasPrivateTraits):
     # Can the text value of each item be edited:
     can_edit = Bool(True)
 
+    # Are whether an item can be edited and whether it can be dragged the same
+    # for every row of a column? If so, the editor only computes them once per
+    # column, and keeps them until the editor is refreshed (which happens when
+    # a trait of the adapter with 'update' metadata changes). Otherwise they
+    # are only kept between refreshes if the editor's 'auto_update' is set:
+    uniform_flags = Bool(False, update=True)
+
+    # Is computing the text of an item slow (for example, because it queries
+    # a remote service)? If so, the editor fetches the text of the visible
+    # rows in background threads, using copies of the adapter (see
+    # *copy_for_thread*), and displays *fetch_placeholder* until it is
+    # available (Qt only):
+    fetch_in_background = Bool(False, update=True)
+
+    # The text displayed for items whose text is being fetched:
+    fetch_placeholder = Str('...', update=True)
+
+    # The number of rows whose text is fetched together:
+    fetch_block_size = Int(50)
+
+    # The maximum number of blocks of rows being fetched at the same time:
+    max_fetches = Int(4)
+
     # The value to be dragged for a specified row item:
     drag = Property
 
@@ -230,6 +255,14 @@ class TabularAdapter(HasPrivateTraits):
     # Event fired when the cache is flushed:
     cache_flushed = Event(update=True)
 
+    # Event fired when the rows change without the edited trait changing (for
+    # example, when the data source displayed by the adapter is sorted):
+    rows_changed = Event
+
+    # The values derived by the toolkit from the styles which are the same for
+    # every item (emptied whenever a style changes):
+    _style_cache = Any
+
     # The mapping from column indices to column identifiers (defined by the
     # *columns* trait):
     column_map = Property(depends_on='columns')
@@ -609,6 +642,71 @@ class TabularAdapter(HasPrivateTraits):
 
         return None
 
+    #-- Background fetching --------------------------------------------------
+
+    def copy_for_thread(self):
+        """ Returns a copy of the adapter (and of its delegated adapters)
+            which can compute the text of items in another thread while the
+            adapter itself is used by the user interface. The copy shares the
+            values of the traits of the adapter, so anything it uses to
+            compute the text (such as a database connection) must be usable
+            from several threads.
+        """
+        adapter = _thread_copy(self)
+        adapter.adapters = [_thread_copy(delegate)
+                            for delegate in self.adapters]
+        return adapter
+
+    #-- Constant styles ------------------------------------------------------
+
+    def is_constant_style(self, name):
+        """ Returns whether the *name* style ('font', 'alignment',
+            'text_color' or 'bg_color') is the same for every item of every
+            column, because the adapter defines it with a single trait (and
+            neither overrides the method returning it nor uses other
+            adapters).
+        """
+        if self.adapters or is_overridden(self, 'get_' + name,
+                                          TabularAdapter):
+            return False
+
+        # Traits defining the style for specific columns or item classes:
+        suffix = '_' + name
+        defaults = ('odd' + suffix, 'even' + suffix, 'default' + suffix)
+        for trait_name in self.trait_names():
+            if trait_name.endswith(suffix) and trait_name not in defaults:
+                return False
+
+        if self.trait(name).type == 'property':
+            # The default text and background colors are constant unless
+            # odd and even rows have different ones:
+            return ((name in ('text_color', 'bg_color')) and
+                    (not is_overridden(self, '_get_' + name,
+                                       TabularAdapter)) and
+                    (getattr(self, defaults[0]) is None) and
+                    (getattr(self, defaults[1]) is None))
+
+        return True
+
+    def get_style_cache(self):
+        """ Returns a dictionary in which toolkits can cache the values they
+            derive from the styles which are the same for every item (such as
+            brushes and fonts). The dictionary is emptied whenever a style of
+            the adapter changes.
+        """
+        if self._style_cache is None:
+            self._style_cache = {}
+
+        return self._style_cache
+
+    @on_trait_change('columns, font, alignment, text_color, bg_color, '
+                     '+update, trait_added')
+    def _flush_style_cache(self):
+        """ Flushes the style cache when a trait defining a style changes.
+        """
+        if self._style_cache:
+            self._style_cache.clear()
+
     @on_trait_change('columns,adapters.+update')
     def _flush_cache(self):
         """ Flushes the cache when the columns or any trait on any adapter
@@ -616,3 +714,21 @@ class TabularAdapter(HasPrivateTraits):
         """
         self.cache = {}
         self.cache_flushed = True
+
+#-------------------------------------------------------------------------
+#  Helper functions:
+#-------------------------------------------------------------------------
+
+
+# The traits of an adapter which are set for each item, and so are not copied
+# by copy_for_thread:
+_item_traits = ('object', 'item', 'value', 'cache', '_style_cache')
+
+
+def _thread_copy(adapter):
+    """ Returns a shallow copy of an adapter, with its own item state.
+    """
+    names = [name for name in adapter.copyable_trait_names()
+             if (name not in _item_traits) and
+             (adapter.trait(name).type != 'property')]
+    return adapter.clone_traits(names, copy='shallow')
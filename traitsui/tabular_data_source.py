@@ -0,0 +1,481 @@
+#------------------------------------------------------------------------------
+#
+#  Copyright (c) 2017, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+#  Thanks for using Enthought open source!
+#
+#------------------------------------------------------------------------------
+
+""" Defines the protocol of the data sources a TabularEditor can page
+    through, instead of editing a list held by a trait, and the adapter
+    displaying them.
+
+    A data source only provides its number of rows and the values of ranges
+    of rows, so very large result sets (for example, the rows of a database
+    table) can be displayed without creating a Python object per row::
+
+        class Results(HasTraits):
+            rows = Instance(ITabularDataSource)
+
+            traits_view = View(
+                Item('rows', editor=TabularEditor(
+                    adapter=DataSourceAdapter(columns=['id', 'name']))))
+
+        source = SQLiteDataSource(database='results.db', table='results')
+        Results(rows=source).configure_traits()
+
+    The adapter caches a bounded number of blocks of rows, so only the rows
+    being displayed are fetched.
+"""
+
+#-------------------------------------------------------------------------
+#  Imports:
+#-------------------------------------------------------------------------
+
+from __future__ import absolute_import
+
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from traits.api import (
+    Any, Bool, Event, HasPrivateTraits, Int, Interface, List, Str,
+    on_trait_change, provides)
+
+from .tabular_adapter import TabularAdapter
+
+#-------------------------------------------------------------------------
+#  'ITabularDataSource' interface:
+#-------------------------------------------------------------------------
+
+
+class ITabularDataSource(Interface):
+    """ The protocol of the sources of rows displayed by a
+        DataSourceAdapter.
+    """
+
+    # The names of the columns of the rows:
+    columns = List(Str)
+
+    # Can the rows be sorted by the data source (see *sort*)?
+    can_sort = Bool
+
+    # Can the rows be filtered by the data source (see *filter*)?
+    can_filter = Bool
+
+    # Event fired when the rows change (for example, when they are sorted):
+    rows_changed = Event
+
+    def row_count(self):
+        """ Returns the number of rows.
+        """
+
+    def fetch(self, start, stop):
+        """ Returns the values of the rows from *start* up to (but not
+            including) *stop*, as a list containing a sequence of values for
+            each column. The sequences are shorter than requested if there
+            are fewer rows.
+        """
+
+    def sort(self, column, ascending=True):
+        """ Sorts the rows by the values of the *column* column.
+        """
+
+    def filter(self, expression):
+        """ Only keeps the rows matching *expression*, whose syntax depends
+            on the data source (an empty expression keeps every row).
+        """
+
+#-------------------------------------------------------------------------
+#  'TabularDataSource' class:
+#-------------------------------------------------------------------------
+
+
+@provides(ITabularDataSource)
+class TabularDataSource(HasPrivateTraits):
+    """ The base class of data sources, which neither sort nor filter their
+        rows.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The names of the columns of the rows:
+    columns = List(Str)
+
+    # Can the rows be sorted by the data source (see *sort*)?
+    can_sort = Bool(False)
+
+    # Can the rows be filtered by the data source (see *filter*)?
+    can_filter = Bool(False)
+
+    # Event fired when the rows change (for example, when they are sorted):
+    rows_changed = Event
+
+    #-------------------------------------------------------------------------
+    #  ITabularDataSource interface:
+    #-------------------------------------------------------------------------
+
+    def row_count(self):
+        """ Returns the number of rows.
+        """
+        raise NotImplementedError
+
+    def fetch(self, start, stop):
+        """ Returns the values of the rows from *start* up to (but not
+            including) *stop*, as a list containing a sequence of values for
+            each column.
+        """
+        raise NotImplementedError
+
+    def sort(self, column, ascending=True):
+        """ Sorts the rows by the values of the *column* column.
+        """
+        raise NotImplementedError
+
+    def filter(self, expression):
+        """ Only keeps the rows matching *expression*.
+        """
+        raise NotImplementedError
+
+#-------------------------------------------------------------------------
+#  'SQLiteDataSource' class:
+#-------------------------------------------------------------------------
+
+
+class SQLiteDataSource(TabularDataSource):
+    """ A data source displaying the rows of an SQLite table (or view),
+        which is sorted and filtered by the database.
+
+        When the rows are sorted or filtered, the rowids of the rows displayed
+        are listed once, in order, in a temporary table, so that each block
+        of rows is then looked up by position instead of sorting the table
+        again.
+
+        Filter expressions are SQL 'WHERE' clauses, so they must not come
+        from untrusted input.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The database file to connect to, if no *connection* is specified:
+    database = Str(':memory:')
+
+    # The connection to the database. It is shared by the threads fetching
+    # rows in the background, so it must have been created with
+    # 'check_same_thread=False':
+    connection = Any
+
+    # The name of the table (or view):
+    table = Str
+
+    # The column the rows are sorted by (if any):
+    sort_column = Str
+
+    # Are the rows sorted in ascending order?
+    ascending = Bool(True)
+
+    # The SQL condition the rows displayed match (if any):
+    expression = Str
+
+    can_sort = True
+
+    can_filter = True
+
+    #-- Private Traits -------------------------------------------------------
+
+    # The number of rows (None if it must be counted again):
+    _count = Any
+
+    # The lock serializing the queries:
+    _lock = Any
+
+    # The name of the temporary table listing the rowids of the rows in the
+    # order they are displayed, if they are sorted or filtered:
+    _order_table = Any
+
+    # Does the table have no rowids (in which case the rows are sorted and
+    # filtered by every query)?
+    _no_rowids = Bool(False)
+
+    #-------------------------------------------------------------------------
+    #  HasTraits interface:
+    #-------------------------------------------------------------------------
+
+    def __init__(self, **traits):
+        super(SQLiteDataSource, self).__init__(**traits)
+        self._lock = threading.Lock()
+
+    #-------------------------------------------------------------------------
+    #  ITabularDataSource interface:
+    #-------------------------------------------------------------------------
+
+    def row_count(self):
+        """ Returns the number of rows, which is only counted again after
+            the rows are sorted or filtered.
+        """
+        if self._count is None:
+            order = self._order()
+            if order is not None:
+                sql = 'SELECT COUNT(*) FROM %s' % order
+            else:
+                sql = 'SELECT COUNT(*) FROM %s%s' % (_quoted(self.table),
+                                                     self._where())
+            self._count = self._query(sql)[0][0]
+
+        return self._count
+
+    def fetch(self, start, stop):
+        """ Returns the values of the rows from *start* up to (but not
+            including) *stop*, as a list containing a tuple of values for
+            each column.
+        """
+        columns = self.columns
+        names = ', '.join('t.' + _quoted(column) for column in columns)
+        order = self._order()
+        if order is not None:
+            # The rows are looked up by their position in the sorted (or
+            # filtered) order, instead of sorting the table again:
+            sql = ('SELECT %s FROM %s AS o JOIN %s AS t ON t.rowid = o.id '
+                   'WHERE o.rowid > ? AND o.rowid <= ? ORDER BY o.rowid' % (
+                       names, order, _quoted(self.table)))
+            parameters = (start, stop)
+        else:
+            sql = 'SELECT %s FROM %s AS t%s%s LIMIT ? OFFSET ?' % (
+                names, _quoted(self.table), self._where(), self._order_by())
+            parameters = (max(stop - start, 0), start)
+
+        rows = self._query(sql, parameters)
+        if not rows:
+            return [() for column in columns]
+
+        return list(zip(*rows))
+
+    def sort(self, column, ascending=True):
+        """ Sorts the rows by the values of the *column* column.
+        """
+        if column not in self.columns:
+            raise ValueError('%r is not a column of %r' % (column, self.table))
+        self.trait_setq(sort_column=column, ascending=ascending)
+        self._query_changed('sort_column', column)
+
+    def filter(self, expression):
+        """ Only keeps the rows matching the SQL condition *expression*.
+        """
+        self.expression = expression
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _query(self, sql, parameters=()):
+        """ Returns the rows resulting from an SQL query.
+        """
+        with self._lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def _where(self):
+        """ Returns the WHERE clause of the queries (if any).
+        """
+        if self.expression:
+            return ' WHERE %s' % self.expression
+
+        return ''
+
+    def _order_by(self):
+        """ Returns the ORDER BY clause of the queries (if any).
+        """
+        if self.sort_column:
+            return ' ORDER BY %s %s, t.rowid' % (
+                _quoted(self.sort_column), 'ASC' if self.ascending else 'DESC')
+
+        return ''
+
+    def _order(self):
+        """ Returns the name of the temporary table listing the rowids of the
+            rows in the order they are displayed (creating it if needed), or
+            None if the rows are neither sorted nor filtered, or if the table
+            has no rowids (such as a view).
+        """
+        if (self._order_table is None) and (not self._no_rowids) and (
+                self.sort_column or self.expression):
+            name = 'temp.traitsui_rows_%d' % id(self)
+            select = 'SELECT t.rowid AS id FROM %s AS t%s%s' % (
+                _quoted(self.table), self._where(), self._order_by())
+            try:
+                with self._lock:
+                    self.connection.execute('DROP TABLE IF EXISTS %s' % name)
+                    self.connection.execute(
+                        'CREATE TABLE %s AS %s' % (name, select))
+            except sqlite3.OperationalError:
+                self._no_rowids = True
+            else:
+                self._order_table = name
+
+        return self._order_table
+
+    #-- Trait Default Values -------------------------------------------------
+
+    def _connection_default(self):
+        return sqlite3.connect(self.database, check_same_thread=False)
+
+    def _columns_default(self):
+        return [row[1] for row in self._query(
+            'PRAGMA table_info(%s)' % _quoted(self.table))]
+
+    #-- Trait Event Handlers -------------------------------------------------
+
+    @on_trait_change('table, sort_column, ascending, expression')
+    def _query_changed(self, name, new):
+        if name == 'table':
+            self._no_rowids = False
+        self._order_table = self._count = None
+        self.rows_changed = True
+
+#-------------------------------------------------------------------------
+#  'DataRow' class:
+#-------------------------------------------------------------------------
+
+
+class DataRow(object):
+    """ A row of a data source, as displayed by a DataSourceAdapter. Its
+        values can be read by column index, or as attributes named after the
+        columns.
+    """
+
+    __slots__ = ('_columns', '_block', '_offset')
+
+    def __init__(self, columns, block, offset):
+        self._columns = columns
+        self._block = block
+        self._offset = offset
+
+    def __getitem__(self, index):
+        return self._block[index][self._offset]
+
+    def __getattr__(self, name):
+        try:
+            index = self._columns.index(name)
+        except ValueError:
+            raise AttributeError(name)
+
+        return self._block[index][self._offset]
+
+#-------------------------------------------------------------------------
+#  'DataSourceAdapter' class:
+#-------------------------------------------------------------------------
+
+
+class DataSourceAdapter(TabularAdapter):
+    """ A tabular adapter displaying the rows of the data source (see
+        ITabularDataSource) held by the edited trait, which it fetches one
+        block at a time.
+
+        Its *columns* are either names of columns of the data source, in the
+        same order, or (label, column name) pairs.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The number of rows fetched from the data source at once:
+    block_size = Int(256)
+
+    # The maximum number of blocks of rows kept in memory:
+    max_blocks = Int(64)
+
+    #-- Private Traits -------------------------------------------------------
+
+    # The data source being displayed:
+    _source = Any
+
+    # The blocks of rows fetched, keyed by block index, the least recently
+    # used first (copies of the adapter have their own):
+    _blocks = Any(transient=True)
+
+    #-------------------------------------------------------------------------
+    #  TabularAdapter interface:
+    #-------------------------------------------------------------------------
+
+    def len(self, object, trait):
+        """ Returns the number of rows of the data source.
+        """
+        source = self._source_for(object, trait)
+        if source is None:
+            return 0
+
+        return source.row_count()
+
+    def get_item(self, object, trait, row):
+        """ Returns the *row* row of the data source, fetching the block
+            containing it if it is not cached.
+        """
+        source = self._source_for(object, trait)
+        if source is None:
+            return None
+
+        size = max(self.block_size, 1)
+        index, offset = divmod(row, size)
+        blocks = self._blocks
+        block = blocks.pop(index, None)
+        if block is None:
+            if len(blocks) >= max(self.max_blocks, 1):
+                blocks.popitem(last=False)
+            block = source.fetch(index * size, (index + 1) * size)
+        blocks[index] = block
+
+        if (not block) or (offset >= len(block[0])):
+            return None
+
+        return DataRow(source.columns, block, offset)
+
+    def flush_blocks(self):
+        """ Discards the cached blocks of rows, so that they are fetched
+            again.
+        """
+        self._blocks = OrderedDict()
+
+    #-- Private Methods ------------------------------------------------------
+
+    def _source_for(self, object, trait):
+        """ Returns the data source held by *object.trait*, discarding the
+            cached rows if it is not the one displayed so far.
+        """
+        source = None if object is None else getattr(object, trait, None)
+        if source is not self._source:
+            old = self._source
+            if old is not None:
+                old.on_trait_change(self._rows_changed, 'rows_changed',
+                                    remove=True)
+            if source is not None:
+                source.on_trait_change(self._rows_changed, 'rows_changed')
+            self._source = source
+            self.flush_blocks()
+        elif self._blocks is None:
+            self.flush_blocks()
+
+        return source
+
+    def _rows_changed(self):
+        """ Handles the rows of the data source changing.
+        """
+        self.flush_blocks()
+        self.rows_changed = True
+
+#-------------------------------------------------------------------------
+#  Helper functions:
+#-------------------------------------------------------------------------
+
+
+def _quoted(name):
+    """ Returns an SQL identifier quoted.
+    """
+    return '"%s"' % name.replace('"', '""')
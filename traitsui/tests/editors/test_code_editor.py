@@ -91,5 +91,61 @@ def test_code_editor_readonly():
         ui.control.close()
 
 
+@skip_if_not_qt4
+def test_code_editor_updates_changed_lines():
+    """ External changes only replace the lines that differ
+    """
+    from pyface import qt
+    from traitsui.qt4.code_editor import update_document
+
+    lines = ['line %d' % i for i in range(10)]
+    old_text = '\n'.join(lines)
+    new_texts = [
+        '\n'.join(lines[:5] + ['changed'] + lines[6:]),
+        '\n'.join(lines + ['appended']),
+        '\n'.join(lines[:7]),
+        '\n'.join(['prepended'] + lines),
+        '\n'.join(lines[3:]),
+        'replaced',
+        '',
+    ]
+    for new_text in new_texts:
+        document = qt.QtGui.QTextDocument()
+        document.setPlainText(old_text)
+        document.findBlockByNumber(0).setUserState(1)
+        update_document(document, old_text, new_text)
+        nose.tools.assert_equal(document.toPlainText(), new_text)
+
+    # Unchanged lines keep their state
+    document = qt.QtGui.QTextDocument()
+    document.setPlainText(old_text)
+    document.findBlockByNumber(0).setUserState(1)
+    document.findBlockByNumber(9).setUserState(9)
+    update_document(document, old_text, new_texts[0])
+    nose.tools.assert_equal(document.findBlockByNumber(0).userState(), 1)
+    nose.tools.assert_equal(document.findBlockByNumber(9).userState(), 9)
+
+
+@skip_if_not_qt4
+def test_code_editor_updates_are_not_undoable():
+    """ External changes can not be undone in the editor
+    """
+    from pyface import qt
+    from traitsui.qt4.code_editor import update_document
+
+    document = qt.QtGui.QTextDocument()
+    document.setPlainText('first\nsecond')
+    cursor = qt.QtGui.QTextCursor(document)
+    cursor.insertText('user ')
+    nose.tools.assert_true(document.isUndoAvailable())
+
+    update_document(document, 'user first\nsecond', 'user first\nthird')
+    nose.tools.assert_false(document.isUndoAvailable())
+    nose.tools.assert_true(document.isUndoRedoEnabled())
+
+    document.undo()
+    nose.tools.assert_equal(document.toPlainText(), 'user first\nthird')
+
+
 if __name__ == '__main__':
     nose.main()
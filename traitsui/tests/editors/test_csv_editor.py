@@ -18,7 +18,8 @@ from __future__ import print_function
 import nose
 
 from traits.has_traits import HasTraits
-from traits.trait_types import Float, List, Instance
+from traits.trait_errors import TraitError
+from traits.trait_types import Float, Int, List, Instance, Range
 from traitsui.handler import ModelView
 from traitsui.view import View
 from traitsui.item import Item
@@ -97,6 +98,65 @@ def test_csv_editor_external_append():
         press_ok_button(ui)
 
 
+def test_list_str_evaluator_matches_eval_list_str():
+    # The incremental conversion gives the same results as converting
+    # every item
+    evaluate = csv_list_editor._ListStrEvaluator(item_eval=float,
+                                                 strip=False)
+    texts = ['', '1', '1, 2, 3', '1, 2.5, 3', '1, 2.5, 3,', '0, 1, 2.5, 3',
+             '0, 1, 2.5', ', '.join(str(x) for x in range(100)),
+             ', '.join(str(x) for x in range(100) if x != 50),
+             ' 1 ,2 , 3e5, -.5, +4, nan, inf ']
+    for text in texts:
+        nose.tools.assert_equal(
+            repr(evaluate(text)),
+            repr(csv_list_editor._eval_list_str(text, item_eval=float)))
+
+
+def test_list_str_evaluator_reevaluates_edited_items():
+    calls = []
+
+    def item_eval(x):
+        calls.append(x)
+        return int(x)
+
+    evaluate = csv_list_editor._ListStrEvaluator(item_eval=item_eval)
+    text = ', '.join(str(x) for x in range(1000))
+    nose.tools.assert_equal(evaluate(text), range(1000))
+
+    del calls[:]
+    nose.tools.assert_equal(evaluate(text), range(1000))
+    nose.tools.assert_equal(calls, [])
+
+    nose.tools.assert_equal(evaluate(text.replace('500', '5000')),
+                            range(500) + [5000] + range(501, 1000))
+    nose.tools.assert_equal(calls, ['5000'])
+
+
+def test_list_str_evaluator_rejects_invalid_items():
+    evaluate = csv_list_editor._ListStrEvaluator(item_eval=int, strip=False)
+    nose.tools.assert_equal(evaluate('1, 2, 3'), [1, 2, 3])
+    for text in ['1, 2.5, 3', '1, 2, 3x', '1, , 3', '1, 2 3', '1, -']:
+        nose.tools.assert_raises(ValueError, evaluate, text)
+
+    nose.tools.assert_equal(evaluate(' 1 , -2, +3 '), [1, -2, 3])
+
+
+class ListOfDynamicRanges(HasTraits):
+    high = Int(10)
+    data = List(Range(low=0, high='high'))
+
+
+def test_dynamic_range_items_are_validated_against_current_bounds():
+    obj = ListOfDynamicRanges()
+    evaluate, _ = CSVListEditor()._funcs(obj, 'data')
+    nose.tools.assert_equal(evaluate('1, 5, 8'), [1, 5, 8])
+
+    obj.high = 6
+    nose.tools.assert_raises(TraitError, evaluate, '1, 5, 8')
+    nose.tools.assert_equal(evaluate('1, 5, 6'), [1, 5, 6])
+
+
 if __name__ == '__main__':
     # Executing the file opens the dialog for manual testing
     list_of_floats = ListOfFloats(data=[1, 2, 3])
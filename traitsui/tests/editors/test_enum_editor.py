@@ -0,0 +1,110 @@
+"""
+Test case for the large vocabulary mode of the Qt EnumEditor.
+"""
+
+import unittest
+
+from traits.api import Enum, HasTraits, List, Str
+from traitsui.api import EnumEditor, Item, View
+
+from traitsui.tests._tools import (
+    skip_if_not_qt4, store_exceptions_on_all_threads)
+
+
+class Instrument(HasTraits):
+
+    symbols = List(Str)
+
+    symbol = Str
+
+    traits_view = View(
+        Item('symbol',
+             editor=EnumEditor(name='symbols', large_vocabulary=True)),
+    )
+
+
+@skip_if_not_qt4
+class TestEnumListModel(unittest.TestCase):
+
+    def setUp(self):
+        from traitsui.qt4.enum_editor import EnumListModel
+
+        self.model = EnumListModel(['a', 'b', 'c', 'd'])
+        self.events = []
+        self.model.rowsRemoved.connect(
+            lambda parent, first, last: self.events.append(
+                ('removed', first, last)))
+        self.model.rowsInserted.connect(
+            lambda parent, first, last: self.events.append(
+                ('inserted', first, last)))
+
+    def _names(self):
+        return [self.model.data(self.model.index(i))
+                for i in range(self.model.rowCount())]
+
+    def test_insertion_only_signals_new_rows(self):
+        self.model.set_names(['a', 'b', 'x', 'y', 'c', 'd'])
+
+        self.assertEqual(self._names(), ['a', 'b', 'x', 'y', 'c', 'd'])
+        self.assertEqual(self.events, [('inserted', 2, 3)])
+
+    def test_replacement_only_signals_changed_rows(self):
+        self.model.set_names(['a', 'x', 'd'])
+
+        self.assertEqual(self._names(), ['a', 'x', 'd'])
+        self.assertEqual(self.events, [('removed', 1, 2), ('inserted', 1, 1)])
+
+
+@skip_if_not_qt4
+class TestEnumCompletionModel(unittest.TestCase):
+
+    def setUp(self):
+        from traitsui.qt4.enum_editor import EnumCompletionModel
+
+        self.model = EnumCompletionModel(
+            ['EURUSD', 'USDJPY', 'GBPUSD', 'USDCHF', 'AUDNZD'])
+
+    def _matches(self):
+        return [self.model.data(self.model.index(i))
+                for i in range(self.model.rowCount())]
+
+    def test_prefix_matches_come_first(self):
+        self.model.set_filter('usd')
+
+        self.assertEqual(
+            self._matches(), ['USDCHF', 'USDJPY', 'EURUSD', 'GBPUSD'])
+
+    def test_extended_search_narrows_matches(self):
+        self.model.set_filter('us')
+        self.model.set_filter('usdj')
+
+        self.assertEqual(self._matches(), ['USDJPY'])
+
+        self.model.set_filter('nz')
+        self.assertEqual(self._matches(), ['AUDNZD'])
+
+
+@skip_if_not_qt4
+class TestLargeVocabularyEnumEditor(unittest.TestCase):
+
+    def test_value_and_values_changes(self):
+        with store_exceptions_on_all_threads():
+            symbols = ['S%05d' % i for i in range(10000)]
+            instrument = Instrument(symbols=symbols, symbol='S00042')
+            ui = instrument.edit_traits()
+            editor = ui.get_editors('symbol')[0]
+
+            self.assertEqual(editor.control.count(), 10000)
+            self.assertEqual(editor.control.currentText(), 'S00042')
+
+            instrument.symbols.append('S99999')
+            self.assertEqual(editor.control.count(), 10001)
+
+            instrument.symbol = 'S99999'
+            self.assertEqual(editor.control.currentIndex(), 10000)
+
+            ui.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
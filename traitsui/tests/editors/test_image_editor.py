@@ -0,0 +1,80 @@
+"""
+Test cases for the Qt ImageEditor.
+"""
+
+import unittest
+
+import numpy as np
+
+from traits.api import Array, HasTraits
+from traitsui.api import ImageEditor, Item, View
+
+from traitsui.tests._tools import (
+    skip_if_not_qt4, store_exceptions_on_all_threads)
+
+
+class Camera(HasTraits):
+
+    frame = Array
+
+    traits_view = View(
+        Item('frame', editor=ImageEditor(scale=True,
+                                         preserve_aspect_ratio=True)),
+    )
+
+
+@skip_if_not_qt4
+class TestArrayImages(unittest.TestCase):
+
+    def test_uint8_array_is_not_copied(self):
+        from traitsui.qt4.image_editor import array_to_qimage
+
+        array = np.zeros((4, 6, 3), dtype=np.uint8)
+        image, data = array_to_qimage(array)
+
+        self.assertIs(data, array)
+        self.assertEqual((image.width(), image.height()), (6, 4))
+
+    def test_invalid_arrays(self):
+        from traitsui.qt4.image_editor import array_to_qimage
+
+        with self.assertRaises(ValueError):
+            array_to_qimage(np.zeros((4, 6, 2), dtype=np.uint8))
+        with self.assertRaises(ValueError):
+            array_to_qimage(np.zeros((4, 6), dtype=np.float64))
+
+    def test_editor_updates_with_new_frames(self):
+        with store_exceptions_on_all_threads():
+            camera = Camera(frame=np.zeros((4, 6), dtype=np.uint8))
+            ui = camera.edit_traits()
+            editor = ui.get_editors('frame')[0]
+            image = editor.control.image()
+            self.assertEqual(image.width(), 6)
+
+            camera.frame = np.zeros((8, 10, 4), dtype=np.uint16)
+            self.assertIsNot(editor.control.image(), image)
+            self.assertEqual(editor.control.image().width(), 10)
+
+            ui.dispose()
+
+    def test_converted_arrays_are_updated_in_place(self):
+        from pyface.qt.QtGui import QColor
+
+        with store_exceptions_on_all_threads():
+            # RGB uint16 arrays are always converted to a uint8 copy:
+            camera = Camera(frame=np.zeros((4, 6, 3), dtype=np.uint16))
+            ui = camera.edit_traits()
+            editor = ui.get_editors('frame')[0]
+            pixel = editor.control.image().pixel(0, 0)
+            self.assertEqual(QColor(pixel).red(), 0)
+
+            camera.frame[...] = 0xffff
+            editor.update_editor()
+            pixel = editor.control.image().pixel(0, 0)
+            self.assertEqual(QColor(pixel).red(), 255)
+
+            ui.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
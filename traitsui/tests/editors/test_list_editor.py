@@ -0,0 +1,144 @@
+"""
+Test cases for the notebook and virtual styles of ListEditor.
+"""
+
+import unittest
+
+from traits.api import HasTraits, Instance, Int, List, Str
+from traitsui.api import Item, ListEditor, View
+
+from traitsui.tests._tools import (
+    skip_if_not_qt4, store_exceptions_on_all_threads)
+
+
+class Document(HasTraits):
+
+    name = Str
+
+    traits_view = View(Item('name'))
+
+
+class Workspace(HasTraits):
+
+    documents = List(Instance(Document))
+
+    traits_view = View(
+        Item('documents',
+             style='custom',
+             editor=ListEditor(use_notebook=True, page_name='.name'),
+             show_label=False),
+    )
+
+
+class Numbers(HasTraits):
+
+    values = List(Int)
+
+    traits_view = View(
+        Item('values',
+             style='custom',
+             editor=ListEditor(virtual=True, rows=5),
+             show_label=False),
+    )
+
+
+@skip_if_not_qt4
+class TestNotebookEditor(unittest.TestCase):
+
+    def setUp(self):
+        self.documents = [Document(name='doc %d' % i) for i in range(3)]
+        self.workspace = Workspace(documents=self.documents)
+
+    def _built(self, editor):
+        return [entry[1] is not None for entry in editor._uis]
+
+    def test_pages_are_built_when_shown(self):
+        with store_exceptions_on_all_threads():
+            ui = self.workspace.edit_traits()
+            editor = ui.get_editors('documents')[0]
+
+            self.assertEqual(editor.control.count(), 3)
+            self.assertEqual(self._built(editor), [True, False, False])
+
+            editor.control.setCurrentIndex(2)
+            self.assertEqual(self._built(editor), [True, False, True])
+            self.assertIs(editor.selected, self.documents[2])
+
+            ui.dispose()
+
+    def test_pages_are_reused_on_list_replacement(self):
+        with store_exceptions_on_all_threads():
+            ui = self.workspace.edit_traits()
+            editor = ui.get_editors('documents')[0]
+            page = editor._uis[0][0]
+
+            new_document = Document(name='new')
+            self.workspace.documents = [
+                new_document, self.documents[2], self.documents[0]]
+
+            self.assertEqual(editor.control.count(), 3)
+            self.assertIs(editor._uis[2][0], page)
+            self.assertEqual(
+                [editor.control.tabText(i) for i in range(3)],
+                ['new', 'doc 2', 'doc 0'])
+
+            ui.dispose()
+
+
+@skip_if_not_qt4
+class TestVirtualEditor(unittest.TestCase):
+
+    def _values(self, editor):
+        return [proxy.value for button, proxy, item_editor in editor._slots
+                if button.isVisibleTo(editor.control)]
+
+    def test_only_visible_items_have_editors(self):
+        with store_exceptions_on_all_threads():
+            numbers = Numbers(values=range(1000))
+            ui = numbers.edit_traits()
+            editor = ui.get_editors('values')[0]
+
+            # The number of rows shown depends on the window's size, but
+            # should be close to the 5 requested:
+            count = len(editor._slots)
+            self.assertLess(count, 20)
+            self.assertEqual(self._values(editor)[:3], [0, 1, 2])
+
+            editor._scroll_bar.setValue(10)
+            self.assertEqual(len(editor._slots), count)
+            self.assertEqual(self._values(editor)[:3], [10, 11, 12])
+
+            ui.dispose()
+
+    def test_list_events_rebind_visible_items(self):
+        with store_exceptions_on_all_threads():
+            numbers = Numbers(values=range(1000))
+            ui = numbers.edit_traits()
+            editor = ui.get_editors('values')[0]
+
+            numbers.values.insert(2, -1)
+            self.assertEqual(self._values(editor)[:4], [0, 1, -1, 2])
+
+            del numbers.values[0:998]
+            self.assertEqual(self._values(editor), [997, 998, 999])
+
+            numbers.values = []
+            self.assertEqual(editor._slots, [])
+
+            ui.dispose()
+
+    def test_editing_an_item_updates_the_list(self):
+        with store_exceptions_on_all_threads():
+            numbers = Numbers(values=range(10))
+            ui = numbers.edit_traits()
+            editor = ui.get_editors('values')[0]
+
+            editor._scroll_bar.setValue(3)
+            editor._slots[0][1].value = 42
+            self.assertEqual(numbers.values[3], 42)
+
+            ui.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -18,8 +18,12 @@ Test case for ListStrEditor and ListStrAdapter
 
 from traits.has_traits import HasTraits
 from traits.trait_types import List, Str
+from traitsui.api import Item, ListStrEditor, View
 from traitsui.list_str_adapter import ListStrAdapter
 
+from traitsui.tests._tools import (
+    skip_if_not_qt4, store_exceptions_on_all_threads)
+
 
 class TraitObject(HasTraits):
     list_str = List(Str)
@@ -35,3 +39,46 @@ def test_list_str_adapter_length():
 
     assert adapter.len(object, "list_str") == 1
     assert adapter.len(None, "list_str") == 0
+
+
+class TagList(HasTraits):
+    tags = List(Str)
+    selected = Str
+
+
+tag_view = View(
+    Item('tags',
+         show_label=False,
+         editor=ListStrEditor(selected='selected')),
+)
+
+
+@skip_if_not_qt4
+def test_list_str_editor_items_events():
+    """Test that list item changes update the model incrementally"""
+    object = TagList(tags=['a', 'b', 'c'], selected='b')
+
+    from pyface.qt import QtCore
+
+    with store_exceptions_on_all_threads():
+        ui = object.edit_traits(view=tag_view)
+        editor = ui.get_editors('tags')[0]
+        model = editor.model
+        resets = []
+        model.modelReset.connect(lambda: resets.append(True))
+
+        assert editor.plain
+        assert editor.index_of('c') == 2
+
+        object.tags.insert(0, 'z')
+        object.tags.append('d')
+        del object.tags[1]
+
+        assert resets == []
+        assert model.rowCount(None) == 4
+        assert model.data(model.index(0), QtCore.Qt.DisplayRole) == 'z'
+        assert editor.index_of('d') == 3
+        assert editor.selected_index == 1
+        assert object.selected == 'b'
+
+        ui.dispose()
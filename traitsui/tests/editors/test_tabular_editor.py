@@ -17,7 +17,7 @@ from traits.testing.api import UnittestTools
 
 from traitsui.api import Item, TabularEditor, View
 from traitsui.tabular_adapter import TabularAdapter
-from traitsui.tests._tools import skip_if_null
+from traitsui.tests._tools import skip_if_not_qt4, skip_if_null
 
 
 class Person(HasTraits):
@@ -34,6 +34,12 @@ class ReportAdapter(TabularAdapter):
     ]
 
 
+class AgeLimitAdapter(ReportAdapter):
+
+    def get_can_edit(self, object, trait, row):
+        return getattr(object, trait)[row].age < 60
+
+
 class Report(HasTraits):
     people = List(Person)
 
@@ -101,6 +107,98 @@ class TestTabularEditor(UnittestTools, unittest.TestCase):
             with self.assertTraitChanges(editor, 'update', count=1):
                 report.update = True
 
+    @skip_if_not_qt4
+    def test_cell_flags_are_flushed_on_refresh(self):
+        from pyface.qt import QtCore
+
+        with self.report_and_editor() as (report, editor):
+            model = editor.model
+            index = model.index(1, 1)
+            self.assertTrue(model.flags(index) & QtCore.Qt.ItemIsEditable)
+
+            editor.adapter.can_edit = False
+            report.refresh = True
+            self.assertFalse(model.flags(index) & QtCore.Qt.ItemIsEditable)
+
+            editor.adapter.can_edit = True
+            report.people.append(Person(name='Karen', age=35))
+            self.assertTrue(model.flags(index) & QtCore.Qt.ItemIsEditable)
+
+    @skip_if_not_qt4
+    def test_uniform_cell_flags(self):
+        from pyface.qt import QtCore
+
+        with self.report_and_editor() as (report, editor):
+            model = editor.model
+            editor.adapter.uniform_flags = True
+            self.assertTrue(model.flags(model.index(0, 0)) &
+                            QtCore.Qt.ItemIsDragEnabled)
+            self.assertEqual(model._cell_states, {0: (True, True)})
+            self.assertTrue(model.flags(model.index(1, 0)) &
+                            QtCore.Qt.ItemIsEditable)
+            self.assertEqual(model._cell_states, {0: (True, True)})
+
+    @skip_if_not_qt4
+    def test_item_cell_flags_are_not_cached_without_auto_update(self):
+        from pyface.qt import QtCore
+
+        report = Report(people=[Person(name='Theresa', age=60),
+                                Person(name='Arlene', age=46)])
+        view = View(Item('people', editor=TabularEditor(
+            adapter=AgeLimitAdapter())))
+        ui = report.edit_traits(view=view)
+        try:
+            editor, = ui.get_editors('people')
+            model = editor.model
+            index = model.index(1, 0)
+            self.assertTrue(model.flags(index) & QtCore.Qt.ItemIsEditable)
+            self.assertEqual(model._cell_states, {})
+
+            report.people[1].age = 70
+            self.assertFalse(model.flags(index) & QtCore.Qt.ItemIsEditable)
+        finally:
+            ui.dispose()
+
+    def test_adapter_copy_for_thread(self):
+        report = Report(people=[Person(name='Theresa', age=60),
+                                Person(name='Arlene', age=46)])
+        adapter = ReportAdapter(odd_bg_color='red')
+        self.assertEqual(adapter.get_text(report, 'people', 0, 0), 'Theresa')
+
+        copy = adapter.copy_for_thread()
+        self.assertIsNone(copy.item)
+        self.assertEqual(copy.odd_bg_color, adapter.odd_bg_color)
+        self.assertEqual(copy.get_text(report, 'people', 1, 1), '46')
+        self.assertIs(adapter.item, report.people[0])
+
+    @skip_if_not_qt4
+    def test_text_fetched_in_background(self):
+        from pyface.qt import QtCore, QtGui
+        with self.report_and_editor() as (report, editor):
+            model = editor.model
+            editor.adapter.fetch_in_background = True
+            index = model.index(1, 0)
+            self.assertEqual(model.data(index, QtCore.Qt.DisplayRole), '...')
+            self.assertEqual(model.data(index, QtCore.Qt.EditRole), 'Arlene')
+
+            app = QtGui.QApplication.instance()
+            for i in range(500):
+                if not model._fetching:
+                    break
+                app.processEvents(QtCore.QEventLoop.AllEvents, 10)
+            self.assertEqual(model.data(index, QtCore.Qt.DisplayRole),
+                             'Arlene')
+
+            # Text fetched before a refresh is displayed until it is fetched
+            # again:
+            report.people[1].name = 'Arlette'
+            report.refresh = True
+            self.assertEqual(model.data(index, QtCore.Qt.DisplayRole),
+                             'Arlene')
+
+            report.people.append(Person(name='Karen', age=35))
+            self.assertEqual(model.data(index, QtCore.Qt.DisplayRole), '...')
+
     @contextlib.contextmanager
     def report_and_editor(self):
         """
@@ -81,3 +81,76 @@ def test_tree_editor_listeners_with_shown_root():
 @skip_if_null
 def test_tree_editor_listeners_with_hidden_root():
     _test_tree_editor_releases_listeners(hide_root=True)
+
+
+def _count_list_notifiers(bogus):
+    """ Returns the number of listeners to a Bogus object's children list. """
+    notifiers_list = bogus.trait('bogus_list')._notifiers(False)
+    return 0 if notifiers_list is None else len(notifiers_list)
+
+
+@skip_if_not_qt4
+def test_tree_editor_listens_only_to_visible_nodes():
+    """ The Qt TreeEditor should only listen to nodes which are shown, and stop
+    listening to them when their parent is collapsed.
+    """
+
+    with store_exceptions_on_all_threads():
+        grandchild = Bogus()
+        child = Bogus(bogus_list=[grandchild])
+        bogus = Bogus(bogus_list=[child])
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=False)
+        ui = tree_editor_view.edit_traits()
+        editor = ui.get_editors('bogus')[0]
+
+        # The root is expanded, so its child is shown but not the grandchild:
+        nose.tools.assert_equal(1, _count_list_notifiers(child))
+        nose.tools.assert_equal(0, _count_list_notifiers(grandchild))
+
+        # Collapsing the root hides the child:
+        nid = editor._get_object_nid(bogus, 'bogus_list')
+        nid.setExpanded(False)
+        nose.tools.assert_equal(0, _count_list_notifiers(child))
+
+        # Changes made while the child is hidden are picked up when shown:
+        child.bogus_list.append(Bogus())
+        nid.setExpanded(True)
+        nose.tools.assert_equal(1, _count_list_notifiers(child))
+
+        ui.dispose()
+        nose.tools.assert_equal(0, _count_list_notifiers(bogus))
+
+
+@skip_if_not_qt4
+def test_tree_editor_children_track_list_mutations():
+    """ The Qt TreeEditor's nodes should stay in step with the children list
+    when it is mutated.
+    """
+
+    with store_exceptions_on_all_threads():
+        children = [Bogus() for i in range(10)]
+        bogus = Bogus(bogus_list=children)
+        tree_editor_view = BogusTreeView(bogus=bogus, hide_root=False)
+        ui = tree_editor_view.edit_traits()
+        editor = ui.get_editors('bogus')[0]
+        nid = editor._get_object_nid(bogus, 'bogus_list')
+
+        del bogus.bogus_list[2:5]
+        bogus.bogus_list.insert(3, Bogus())
+        bogus.bogus_list[0] = Bogus()
+        bogus.bogus_list.append(Bogus())
+
+        nose.tools.assert_equal(len(bogus.bogus_list), nid.childCount())
+        for i, child in enumerate(bogus.bogus_list):
+            cnid = editor._get_object_nid(child, 'bogus_list')
+            nose.tools.assert_is(child, editor.get_object(nid.child(i)))
+            nose.tools.assert_equal(
+                (editor._get_node_data(nid)[1], bogus, i),
+                editor._node_index(cnid))
+
+        # Removed children are no longer known to the editor:
+        for child in children[2:5]:
+            nose.tools.assert_equal(
+                None, editor._get_object_nid(child, 'bogus_list'))
+
+        ui.dispose()
@@ -0,0 +1,234 @@
+"""
+Test cases for the dependency tracking of 'when' conditions.
+"""
+
+import unittest
+
+from traits import trait_notifiers
+from traits.api import Bool, HasTraits, Int, List, Property, This
+
+from traitsui.api import Handler, View
+from traitsui.conditions import (
+    ConditionCache, ConditionContext, parse_condition)
+from traitsui.ui import UI
+
+
+class Model(HasTraits):
+
+    count = Int
+
+    flag = Bool
+
+    child = This
+
+    items = List(Int)
+
+    total = Property(depends_on='items[]')
+
+    untracked = Property
+
+    def _get_total(self):
+        return sum(self.items)
+
+    def _get_untracked(self):
+        return self.count
+
+    def is_positive(self):
+        return self.count > 0
+
+
+class Target(HasTraits):
+    """ Stands in for an editor whose state is set by conditions.
+    """
+
+    visible = Bool(True)
+
+    enabled = Bool(True)
+
+    checked = Bool(False)
+
+    evaluations = Int
+
+
+class TestParseCondition(unittest.TestCase):
+
+    def test_parsed_once(self):
+        self.assertIs(parse_condition('object.count > 0'),
+                      parse_condition('object.count > 0'))
+
+    def test_names(self):
+        condition = parse_condition(' len(object.items) > count and flag')
+        self.assertEqual(condition.names, frozenset([
+            ('len',), ('object', 'items'), ('count',), ('flag',)]))
+
+    def test_method_calls_are_unknown(self):
+        self.assertIsNone(parse_condition('object.is_positive()').names)
+        self.assertIsNone(parse_condition('[x for x in items]').names)
+
+    def test_attribute_chains_are_unknown(self):
+        self.assertIsNone(parse_condition('object.child.flag').names)
+        self.assertIsNone(parse_condition('(object or handler).flag').names)
+
+    def test_attributes_of_object_traits_are_unknown(self):
+        model = Model(child=Model())
+        context = {'object': model}
+        self.assertIsNone(
+            parse_condition('child.flag').traits(context, model))
+        self.assertEqual(
+            parse_condition('child is not None').traits(context, model),
+            [(model, 'child')])
+
+    def test_traits(self):
+        model = Model()
+        context = {'object': model}
+        condition = parse_condition('object.count > 0 and not flag and True')
+        self.assertEqual(
+            sorted(condition.traits(context, model)),
+            [(model, 'count'), (model, 'flag')])
+
+    def test_untracked_traits_are_unknown(self):
+        model = Model()
+        context = {'object': model}
+        self.assertEqual(
+            parse_condition('object.total').traits(context, model),
+            [(model, 'total')])
+        self.assertIsNone(
+            parse_condition('object.untracked').traits(context, model))
+        self.assertIsNone(
+            parse_condition('object.missing').traits(context, model))
+
+
+class TestConditionContext(unittest.TestCase):
+
+    def test_traits_are_read_lazily(self):
+        model = Model(count=3)
+        context = ConditionContext({'object': model, 'count': 7}, model)
+
+        self.assertEqual(eval('flag', {}, context), False)
+        self.assertEqual(eval('count', {}, context), 7)
+        self.assertEqual(eval('object.count', {}, context), 3)
+        self.assertNotIn('flag', context)
+        with self.assertRaises(NameError):
+            eval('is_positive', {}, context)
+
+
+class TestConditionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.model = Model()
+        self.cache = ConditionCache()
+        self.cache.set_context({'object': self.model})
+
+    def tearDown(self):
+        self.cache.reset()
+
+    def test_values_are_kept_until_a_dependency_changes(self):
+        cache = self.cache
+        self.assertFalse(cache.evaluate('object.count > 0'))
+
+        self.model.flag = True
+        cache.set_context({'object': self.model})
+        self.assertFalse(cache.evaluate('object.count > 0'))
+        self.assertTrue(cache.evaluate('object.flag'))
+
+        self.model.count = 1
+        self.assertTrue(cache.evaluate('object.count > 0'))
+
+    def test_list_items_changes(self):
+        cache = self.cache
+        self.assertFalse(cache.evaluate('len(object.items) > 0'))
+        self.model.items.append(1)
+        self.assertTrue(cache.evaluate('len(object.items) > 0'))
+
+    def test_unknown_dependencies_are_evaluated_again(self):
+        cache = self.cache
+        self.assertFalse(cache.evaluate('object.is_positive()'))
+        self.model.count = 1
+        self.assertFalse(cache.evaluate('object.is_positive()'))
+        cache.set_context({'object': self.model})
+        self.assertTrue(cache.evaluate('object.is_positive()'))
+
+    def test_attribute_chains_are_evaluated_again(self):
+        cache = self.cache
+        self.model.child = Model()
+        self.assertFalse(cache.evaluate('object.child.flag'))
+        self.model.child.flag = True
+        cache.set_context({'object': self.model})
+        self.assertTrue(cache.evaluate('object.child.flag'))
+
+    def test_new_context(self):
+        cache = self.cache
+        self.assertFalse(cache.evaluate('object.count > 0'))
+        cache.set_context({'object': Model(count=1)})
+        self.assertTrue(cache.evaluate('object.count > 0'))
+
+        self.model.count = 2
+        self.assertEqual(self.model._trait('count', 0)._notifiers(1), [])
+
+
+class TestUIConditions(unittest.TestCase):
+
+    def setUp(self):
+        # Dispatch 'ui' notifications synchronously, without a toolkit:
+        self.ui_handler = trait_notifiers.ui_handler
+        trait_notifiers.set_ui_handler(lambda handler, *args: handler(*args))
+
+        self.model = Model()
+        self.ui = UI(view=View(), context={'object': self.model},
+                     handler=Handler())
+        self.counted = Target()
+        self.counted.on_trait_change(self._count, 'enabled')
+        self.ui.add_enabled('count > 0', self.counted)
+
+    def tearDown(self):
+        trait_notifiers.set_ui_handler(self.ui_handler)
+
+    def _count(self):
+        self.counted.evaluations += 1
+
+    def test_only_dependent_conditions_are_evaluated(self):
+        ui = self.ui
+        flagged = Target()
+        ui.add_visible('object.flag', flagged)
+        totalled = Target()
+        ui.add_checked('total > 2', totalled)
+        ui._watch_conditions()
+        ui._do_evaluate_when(at_init=True)
+
+        self.assertFalse(self.counted.enabled)
+        self.assertFalse(flagged.visible)
+        self.assertFalse(totalled.checked)
+
+        self.model.flag = True
+        self.assertTrue(flagged.visible)
+        self.assertFalse(self.counted.enabled)
+
+        self.model.count = 1
+        self.assertTrue(self.counted.enabled)
+
+        self.model.items = [1]
+        self.assertFalse(totalled.checked)
+        self.model.items.append(2)
+        self.assertTrue(totalled.checked)
+
+        ui._unwatch_conditions()
+        self.model.count = 0
+        self.assertTrue(self.counted.enabled)
+
+    def test_unknown_dependencies(self):
+        ui = self.ui
+        target = Target()
+        ui.add_enabled('object.is_positive()', target)
+        ui._watch_conditions()
+        ui._do_evaluate_when(at_init=True)
+        self.assertFalse(target.enabled)
+
+        self.model.count = 1
+        self.assertTrue(target.enabled)
+        self.assertTrue(self.counted.enabled)
+
+        ui._unwatch_conditions()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Test cases for the detection of column styles which are the same for every
+row.
+"""
+
+import unittest
+
+from traits.api import Color, Font, Property
+
+from traitsui.table_column import NumericColumn, ObjectColumn
+from traitsui.tabular_adapter import AnITabularAdapter, TabularAdapter
+
+
+class RedColumn(ObjectColumn):
+
+    def get_text_color(self, object):
+        return 'red' if object else 'black'
+
+
+class PropertyColumn(ObjectColumn):
+
+    text_font = Property
+
+    def _get_text_font(self):
+        return 'Courier 10'
+
+
+class ItemAdapter(TabularAdapter):
+
+    columns = [('Name', 'name')]
+
+    name_font = Font('Courier 10')
+
+    text_color = Color('blue')
+
+
+class TestTableColumnStyles(unittest.TestCase):
+
+    def test_default_styles_are_constant(self):
+        column = ObjectColumn(name='value')
+        for name in ['text_color', 'text_font', 'cell_color',
+                     'horizontal_alignment', 'vertical_alignment',
+                     'editable', 'type']:
+            self.assertTrue(column.is_constant_style(name))
+
+    def test_overridden_getters(self):
+        column = RedColumn(name='value')
+        self.assertFalse(column.is_constant_style('text_color'))
+        self.assertTrue(column.is_constant_style('cell_color'))
+
+        column = NumericColumn(name='value')
+        self.assertFalse(column.is_constant_style('cell_color'))
+        self.assertFalse(column.is_constant_style('editable'))
+        self.assertFalse(column.is_constant_style('type'))
+        self.assertFalse(column.is_constant_style('horizontal_alignment'))
+
+    def test_property_styles(self):
+        column = PropertyColumn(name='value')
+        self.assertFalse(column.is_constant_style('text_font'))
+        self.assertTrue(column.is_constant_style('text_color'))
+
+    def test_cache_is_emptied_when_a_style_changes(self):
+        column = ObjectColumn(name='value')
+        cache = column.get_style_cache()
+        cache['font'] = 'Courier 10'
+
+        column.label = 'Value'
+        self.assertEqual(cache, {'font': 'Courier 10'})
+
+        column.editable = False
+        self.assertEqual(cache, {})
+
+        cache['cell_states'] = (False, False)
+        column.show_checkbox = False
+        self.assertEqual(cache, {})
+
+
+class TestTabularAdapterStyles(unittest.TestCase):
+
+    def test_default_styles_are_constant(self):
+        adapter = TabularAdapter(columns=['a', 'b'])
+        for name in ['font', 'alignment', 'text_color', 'bg_color']:
+            self.assertTrue(adapter.is_constant_style(name))
+
+    def test_row_colors(self):
+        adapter = TabularAdapter(columns=['a'], default_bg_color='white')
+        self.assertTrue(adapter.is_constant_style('bg_color'))
+
+        adapter.odd_bg_color = 'light grey'
+        self.assertFalse(adapter.is_constant_style('bg_color'))
+        self.assertTrue(adapter.is_constant_style('text_color'))
+
+    def test_column_styles(self):
+        adapter = ItemAdapter()
+        self.assertFalse(adapter.is_constant_style('font'))
+        self.assertTrue(adapter.is_constant_style('text_color'))
+
+    def test_delegated_adapters(self):
+        adapter = TabularAdapter(columns=['a'], adapters=[AnITabularAdapter()])
+        self.assertFalse(adapter.is_constant_style('alignment'))
+
+    def test_cache_is_emptied_when_a_style_changes(self):
+        adapter = TabularAdapter(columns=['a'])
+        cache = adapter.get_style_cache()
+        cache['alignment'] = 'left'
+
+        adapter.row = 3
+        self.assertEqual(cache, {'alignment': 'left'})
+
+        adapter.alignment = 'right'
+        self.assertEqual(cache, {})
+
+        cache['bg_color'] = None
+        adapter.even_bg_color = 'light grey'
+        self.assertEqual(cache, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+"""
+Test cases for the shared enumeration value mappings.
+"""
+
+import unittest
+
+from traits.api import Enum, HasTraits
+
+from traitsui import helper
+from traitsui.helper import (
+    clear_compile_cache, common_length, compile_cache_info, compiled,
+    enum_values_changed, invalidate_enum_values)
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        return unicode(value)
+
+
+class TestEnumValuesChanged(unittest.TestCase):
+
+    def test_mappings(self):
+        names, mapping, inverse_mapping = enum_values_changed(
+            {1: '2:one', 2: '1:two'})
+
+        self.assertEqual(names, ['two', 'one'])
+        self.assertEqual(mapping, {'one': 1, 'two': 2})
+        self.assertEqual(inverse_mapping, {1: 'one', 2: 'two'})
+
+    def test_same_values_are_shared(self):
+        values = ['a', 'b', 'c']
+        strfunc = Counter()
+
+        first = enum_values_changed(values, strfunc)
+        second = enum_values_changed(values, strfunc)
+
+        self.assertIs(first, second)
+        self.assertEqual(strfunc.calls, 3)
+
+    def test_trait_handler_is_shared(self):
+        class Model(HasTraits):
+            value = Enum('x', 'y')
+
+        trait = Model().trait('value')
+        strfunc = Counter()
+
+        first = enum_values_changed(trait, strfunc)
+        second = enum_values_changed(trait.handler, strfunc)
+
+        self.assertIs(first, second)
+        self.assertEqual(first[0], ['x', 'y'])
+
+    def test_in_place_change_is_recomputed(self):
+        values = ['a', 'b']
+        enum_values_changed(values)
+        values.append('c')
+
+        names, mapping, inverse_mapping = enum_values_changed(values)
+
+        self.assertEqual(names, ['a', 'b', 'c'])
+
+    def test_in_place_replacement_requires_invalidation(self):
+        values = ['a', 'b']
+        first = enum_values_changed(values)
+        values[0] = 'z'
+        self.assertIs(enum_values_changed(values), first)
+
+        invalidate_enum_values(values)
+        names, mapping, inverse_mapping = enum_values_changed(values)
+
+        self.assertEqual(names, ['z', 'b'])
+
+    def test_invalidate(self):
+        values = ['a', 'b']
+        strfunc = Counter()
+        first = enum_values_changed(values, strfunc)
+
+        invalidate_enum_values(values)
+        second = enum_values_changed(values, strfunc)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(strfunc.calls, 4)
+
+    def test_bound_method_requires_key(self):
+        values = ['a', 'b']
+        strfunc = Counter().__call__
+
+        first = enum_values_changed(values, strfunc)
+        second = enum_values_changed(values, strfunc)
+        self.assertIsNot(first, second)
+
+        first = enum_values_changed(values, strfunc, 'key')
+        second = enum_values_changed(values, strfunc, 'key')
+        self.assertIs(first, second)
+
+
+class TestCommonLength(unittest.TestCase):
+
+    def test_prefix(self):
+        a = range(100)
+        b = range(50) + [-1] + range(51, 100)
+
+        self.assertEqual(common_length(a, b), 50)
+        self.assertEqual(common_length(a, b, 10), 10)
+        self.assertEqual(common_length(a, a), 100)
+        self.assertEqual(common_length(a, []), 0)
+        self.assertEqual(common_length(a, range(101)), 100)
+
+    def test_suffix(self):
+        a = range(100)
+        b = [-1] + range(60, 100)
+
+        self.assertEqual(common_length(a, b, reverse=True), 40)
+        self.assertEqual(common_length(a, b, 5, True), 5)
+        self.assertEqual(common_length(a, range(1, 100), reverse=True), 99)
+        self.assertEqual(common_length(a, [0], reverse=True), 0)
+
+
+class TestCompiled(unittest.TestCase):
+
+    def setUp(self):
+        clear_compile_cache()
+
+    def tearDown(self):
+        clear_compile_cache()
+
+    def test_code_objects_are_shared(self):
+        code = compiled('object.value > 1')
+
+        self.assertIs(compiled('object.value > 1'), code)
+        self.assertIsNot(compiled('object.value > 1', 'exec'), code)
+        self.assertEqual(compile_cache_info(), {
+            'hits': 1, 'misses': 2, 'size': 2,
+            'maxsize': helper.COMPILE_CACHE_SIZE})
+
+    def test_evaluation(self):
+        self.assertEqual(eval(compiled(' 1 + x'), {}, {'x': 2}), 3)
+        code = compile('1', '<string>', 'eval')
+        self.assertIs(compiled(code), code)
+        with self.assertRaises(SyntaxError):
+            compiled('1 +')
+
+    def test_least_recently_used_are_discarded(self):
+        old_size = helper.COMPILE_CACHE_SIZE
+        helper.COMPILE_CACHE_SIZE = 2
+        try:
+            first = compiled('a')
+            compiled('b')
+            compiled('a')
+            compiled('c')
+
+            self.assertIs(compiled('a'), first)
+            self.assertEqual(compile_cache_info()['size'], 2)
+            self.assertEqual(compile_cache_info()['misses'], 3)
+            compiled('b')
+            self.assertEqual(compile_cache_info()['misses'], 4)
+        finally:
+            helper.COMPILE_CACHE_SIZE = old_size
+
+
+if __name__ == '__main__':
+    unittest.main()
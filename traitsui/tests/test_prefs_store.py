@@ -0,0 +1,92 @@
+"""
+Test cases for the user interface preference stores.
+"""
+
+import os
+import shelve
+import shutil
+import tempfile
+import unittest
+
+from traitsui.prefs_store import PicklePrefsStore, SQLitePrefsStore
+
+
+class PrefsStoreTests(object):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, 'prefs')
+        self.store = self.create_store()
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def create_store(self):
+        return self.store_class(filename=self.filename, delay=0)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.store.get('missing'))
+        self.assertEqual(self.store.get('missing', {}), {})
+
+    def test_set_returns_copies(self):
+        prefs = {'': (1, 2, 3, 4)}
+        self.store.set('window', prefs)
+        prefs[''] = None
+
+        self.assertEqual(self.store.get('window'), {'': (1, 2, 3, 4)})
+
+    def test_writes_are_batched_until_flush(self):
+        self.store.set('window', {'': (1, 2, 3, 4)})
+        other = self.create_store()
+        self.assertIsNone(other.get('window'))
+        other.close()
+
+        self.store.flush()
+
+        other = self.create_store()
+        self.assertEqual(other.get('window'), {'': (1, 2, 3, 4)})
+        other.close()
+
+    def test_flush_keeps_entries_from_other_stores(self):
+        other = self.create_store()
+        self.store.get('first')
+        other.set('second', 2)
+        other.close()
+
+        self.store.set('first', 1)
+        self.store.flush()
+
+        store = self.create_store()
+        self.assertEqual(store.get('first'), 1)
+        self.assertEqual(store.get('second'), 2)
+        store.close()
+
+    def test_missing_entries_are_read_from_legacy_database(self):
+        legacy_filename = os.path.join(self.directory, 'traits_ui')
+        db = shelve.open(legacy_filename, flag='c', protocol=-1)
+        db['window'] = {'': (1, 2, 3, 4)}
+        db['other'] = 1
+        db.close()
+        self.store.close()
+        self.store = self.store_class(filename=self.filename, delay=0,
+                                      legacy_filename=legacy_filename)
+
+        self.store.set('other', 2)
+        self.assertEqual(self.store.get('window'), {'': (1, 2, 3, 4)})
+        self.assertEqual(self.store.get('other'), 2)
+        self.assertIsNone(self.store.get('missing'))
+
+
+class TestPicklePrefsStore(PrefsStoreTests, unittest.TestCase):
+
+    store_class = PicklePrefsStore
+
+
+class TestSQLitePrefsStore(PrefsStoreTests, unittest.TestCase):
+
+    store_class = SQLitePrefsStore
+
+
+if __name__ == '__main__':
+    unittest.main()
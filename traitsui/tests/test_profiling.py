@@ -0,0 +1,90 @@
+"""
+Test cases for the opt-in profiling of user interfaces.
+"""
+
+import unittest
+
+from traits.api import HasTraits, Int, Str
+from traitsui.api import Item, View
+
+from traitsui import profiling
+from traitsui.tests._tools import (
+    skip_if_not_qt4, store_exceptions_on_all_threads)
+
+
+class FakeEditor(object):
+
+    object_name = 'object'
+
+    name = 'value'
+
+
+class Model(HasTraits):
+
+    value = Int
+
+    text = Str
+
+    traits_view = View(Item('value'), Item('text'))
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        profiling.reset()
+
+    def tearDown(self):
+        profiling.disable()
+        profiling.reset()
+
+    def test_disabled_hooks_record_nothing(self):
+        profiling.disable()
+        self.assertIsNone(profiling.start())
+        self.assertEqual(profiling.report(), {
+            'editors': [], 'uis': [], 'panels': [], 'cell_data': []})
+
+    def test_profiled_restores_state(self):
+        profiling.disable()
+        with profiling.profiled():
+            self.assertTrue(profiling.enabled)
+            self.assertIsNotNone(profiling.start())
+        self.assertFalse(profiling.enabled)
+
+    def test_editor_report(self):
+        editor = FakeEditor()
+        with profiling.profiled():
+            profiling.editor_built(editor, profiling.start())
+            for i in range(3):
+                profiling.editor_updated(editor, profiling.start())
+            profiling.editor_dropped(editor)
+            profiling.cell_data(editor, 0)
+            profiling.cell_data(editor, 0)
+
+        report = profiling.report()
+        self.assertEqual(len(report['editors']), 1)
+        info = report['editors'][0]
+        self.assertIn('FakeEditor(object.value)', info['editor'])
+        self.assertEqual(info['builds'], 1)
+        self.assertEqual(info['updates'], 3)
+        self.assertEqual(info['dropped'], 1)
+        self.assertEqual(info['coalesced'], 0)
+        self.assertEqual(report['cell_data'], [
+            {'model': 'FakeEditor', 'role': 0, 'calls': 2}])
+
+    @skip_if_not_qt4
+    def test_ui_is_profiled(self):
+        model = Model()
+        with store_exceptions_on_all_threads(), profiling.profiled():
+            ui = model.edit_traits()
+            model.value = 5
+            ui.dispose()
+
+        report = profiling.report()
+        self.assertEqual(len(report['uis']), 1)
+        self.assertEqual(len(report['editors']), 2)
+        updates = sum(info['updates'] for info in report['editors'])
+        self.assertEqual(updates, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
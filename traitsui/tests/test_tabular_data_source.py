@@ -0,0 +1,95 @@
+"""
+Test cases for the data sources displayed by tabular editors.
+"""
+
+import sqlite3
+import unittest
+
+from traits.api import HasTraits, Instance
+
+from traitsui.tabular_data_source import (
+    DataSourceAdapter, ITabularDataSource, SQLiteDataSource)
+
+
+class Results(HasTraits):
+
+    rows = Instance(ITabularDataSource)
+
+
+def make_source(size):
+    connection = sqlite3.connect(':memory:', check_same_thread=False)
+    connection.execute('CREATE TABLE results (name TEXT, value INTEGER)')
+    connection.executemany(
+        'INSERT INTO results VALUES (?, ?)',
+        [('row %d' % i, (i * 7) % size) for i in range(size)])
+    return SQLiteDataSource(connection=connection, table='results')
+
+
+class TestSQLiteDataSource(unittest.TestCase):
+
+    def setUp(self):
+        self.source = make_source(100)
+
+    def test_fetch(self):
+        source = self.source
+        self.assertEqual(source.columns, ['name', 'value'])
+        self.assertEqual(source.row_count(), 100)
+        self.assertEqual(source.fetch(2, 4),
+                         [('row 2', 'row 3'), (14, 21)])
+        self.assertEqual(source.fetch(99, 120), [('row 99',), (93,)])
+        self.assertEqual(source.fetch(100, 120), [(), ()])
+
+    def test_sort_and_filter(self):
+        source = self.source
+        changes = []
+        source.on_trait_change(lambda: changes.append(True), 'rows_changed')
+
+        source.sort('value', ascending=False)
+        self.assertEqual(source.fetch(0, 2), [('row 57', 'row 14'), (99, 98)])
+
+        source.filter('value < 10')
+        self.assertEqual(source.row_count(), 10)
+        self.assertEqual(source.fetch(0, 1), [('row 87',), (9,)])
+        self.assertEqual(len(changes), 2)
+
+        with self.assertRaises(ValueError):
+            source.sort('missing')
+
+
+class TestDataSourceAdapter(unittest.TestCase):
+
+    def test_rows_are_fetched_in_blocks(self):
+        results = Results(rows=make_source(100))
+        adapter = DataSourceAdapter(columns=[('Name', 'name'), 'value'],
+                                    block_size=10, max_blocks=2)
+        self.assertEqual(adapter.len(results, 'rows'), 100)
+        self.assertEqual(adapter.get_text(results, 'rows', 3, 0), 'row 3')
+        self.assertEqual(adapter.get_text(results, 'rows', 3, 1), '21')
+        self.assertEqual(adapter.get_text(results, 'rows', 25, 0), 'row 25')
+        self.assertEqual(adapter.get_text(results, 'rows', 45, 0), 'row 45')
+        self.assertEqual(list(adapter._blocks), [2, 4])
+        self.assertIsNone(adapter.get_item(results, 'rows', 100))
+
+    def test_rows_changed(self):
+        results = Results(rows=make_source(100))
+        adapter = DataSourceAdapter(columns=['name', 'value'])
+        self.assertEqual(adapter.get_text(results, 'rows', 0, 0), 'row 0')
+        changes = []
+        adapter.on_trait_change(lambda: changes.append(True), 'rows_changed')
+
+        results.rows.sort('value')
+        self.assertEqual(changes, [True])
+        self.assertEqual(adapter.get_text(results, 'rows', 0, 0), 'row 0')
+        self.assertEqual(adapter.get_text(results, 'rows', 1, 0), 'row 43')
+
+        copy = adapter.copy_for_thread()
+        self.assertEqual(copy.get_text(results, 'rows', 1, 0), 'row 43')
+        self.assertIsNot(copy._blocks, adapter._blocks)
+
+        results.rows = make_source(5)
+        self.assertEqual(adapter.len(results, 'rows'), 5)
+        self.assertEqual(adapter.get_text(results, 'rows', 1, 1), '2')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Test cases for the ContextJournal used by modal dialogs.
+"""
+
+import unittest
+
+from traits.api import HasTraits, Int, List, Str
+
+from traitsui.undo import ContextJournal
+
+
+class Settings(HasTraits):
+
+    name = Str
+
+    count = Int
+
+    data = List(Int)
+
+
+class TestContextJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.data = range(1000)
+        self.settings = Settings(name='a', count=1, data=self.data)
+        self.journal = ContextJournal({'object': self.settings, 'other': None})
+        self.working = self.journal.working['object']
+
+    def tearDown(self):
+        self.journal.dispose()
+
+    def test_working_copy_is_not_deep_copied(self):
+        self.assertIsNot(self.working, self.settings)
+        self.assertIsNone(self.journal.working['other'])
+        self.assertEqual(self.working.name, 'a')
+        self.assertEqual(self.working.data, self.data)
+
+    def test_edits_are_deferred_until_apply(self):
+        self.working.name = 'b'
+        self.working.data.append(1000)
+
+        self.assertEqual(self.settings.name, 'a')
+        self.assertEqual(len(self.settings.data), 1000)
+        self.assertEqual(self.journal.edited,
+                         [('object', 'name'), ('object', 'data')])
+
+        self.journal.apply()
+
+        self.assertEqual(self.settings.name, 'b')
+        self.assertEqual(len(self.settings.data), 1001)
+        self.assertEqual(self.journal.edited, [])
+
+    def test_only_edited_traits_are_applied(self):
+        self.working.name = 'b'
+        self.settings.count = 2
+
+        self.journal.apply()
+
+        self.assertEqual(self.settings.count, 2)
+
+    def test_revert_restores_applied_and_pending_changes(self):
+        self.working.name = 'b'
+        self.working.data.append(1000)
+        self.journal.apply()
+        self.working.count = 5
+
+        self.journal.revert()
+
+        self.assertEqual(self.settings.name, 'a')
+        self.assertEqual(self.settings.data, self.data)
+        self.assertEqual(self.working.name, 'a')
+        self.assertEqual(self.working.count, 1)
+        self.assertEqual(self.working.data, self.data)
+        self.assertEqual(self.journal.edited, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
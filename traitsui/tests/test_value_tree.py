@@ -0,0 +1,69 @@
+"""
+Test cases for the paged container nodes of the value tree.
+"""
+
+import unittest
+
+from traitsui.value_tree import DictNode, IntNode, ListNode, RangeNode, SetNode
+
+
+class TestPagedNodes(unittest.TestCase):
+
+    def labels(self, nodes):
+        return [node.tno_get_label(None) for node in nodes]
+
+    def test_small_list_shows_all_items(self):
+        node = ListNode(value=range(5), page_size=10)
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(len(children), 5)
+        self.assertIsInstance(children[0], IntNode)
+        self.assertEqual(children[4].tno_get_label(None), '[4]: 4')
+
+    def test_large_list_is_split_into_ranges(self):
+        node = ListNode(value=range(25), page_size=10)
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(self.labels(children),
+                         ['[0..9]', '[10..19]', '[20..24]'])
+        items = children[2].tno_get_children(None)
+        self.assertEqual(self.labels(items),
+                         ['[20]: 20', '[21]: 21', '[22]: 22', '[23]: 23',
+                          '[24]: 24'])
+
+    def test_ranges_are_nested(self):
+        node = ListNode(value=range(250), page_size=10)
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(self.labels(children),
+                         ['[0..99]', '[100..199]', '[200..249]'])
+        ranges = children[2].tno_get_children(None)
+        self.assertEqual(len(ranges), 5)
+        self.assertIsInstance(ranges[0], RangeNode)
+        self.assertEqual(len(ranges[4].tno_get_children(None)), 10)
+
+    def test_dict_bucket_is_sorted(self):
+        value = dict((i, i) for i in range(30))
+        node = DictNode(value=value, page_size=10)
+
+        children = node.tno_get_children(None)
+        self.assertEqual(len(children), 3)
+
+        names = [child.name for child in children[0].tno_get_children(None)]
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(len(names), 10)
+
+    def test_set_range(self):
+        node = SetNode(value=set(range(15)), page_size=10)
+
+        children = node.tno_get_children(None)
+
+        self.assertEqual(len(children), 2)
+        self.assertEqual(len(children[1].tno_get_children(None)), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+#  Copyright (c) 2017, Enthought, Inc.
+#  All rights reserved.
+#
+#  This software is provided without warranty under the terms of the BSD
+#  license included in enthought/LICENSE.txt and may be redistributed only
+#  under the conditions described in the aforementioned license.  The license
+#  is also available online at http://www.enthought.com/licenses/BSD.txt
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from traits.api import Any, Array, HasTraits
+
+from traitsui.item import Item
+from traitsui.ui_editors.array_view_editor import (
+    ArrayViewAdapter, ArrayViewEditor)
+from traitsui.view import View
+
+from traitsui.tests._tools import skip_if_null
+
+
+class OutOfCoreArray(object):
+    """ An array-like object counting the values read from it.
+    """
+
+    def __init__(self, array):
+        self.array = array
+        self.shape = array.shape
+        self.values_read = 0
+
+    def __getitem__(self, key):
+        values = np.array(self.array[key])
+        self.values_read += values.size
+        return values
+
+
+class ArrayViewer(HasTraits):
+
+    data = Any
+
+    view = View(Item('data', editor=ArrayViewEditor(show_statistics=True)))
+
+
+class TestArrayViewAdapter(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def adapter_for(self, viewer, **traits):
+        columns = [(str(i), i) for i in range(viewer.data.shape[-1])]
+        return ArrayViewAdapter(columns=columns, **traits)
+
+    def test_memmap_rows_are_views(self):
+        path = os.path.join(self.directory, 'data.npy')
+        data = np.memmap(path, dtype=float, mode='w+', shape=(1000, 4))
+        data[:] = np.arange(4000).reshape(1000, 4)
+        viewer = ArrayViewer(data=data)
+        adapter = self.adapter_for(viewer, block_size=100, max_blocks=2)
+
+        self.assertEqual(adapter.len(viewer, 'data'), 1000)
+        self.assertEqual(adapter.get_text(viewer, 'data', 501, 2), '2006.0')
+        item = adapter.get_item(viewer, 'data', 502)
+        self.assertTrue(np.may_share_memory(item, data))
+        self.assertEqual(adapter.blocks_read, 1)
+
+        adapter.get_item(viewer, 'data', 0)
+        adapter.get_item(viewer, 'data', 999)
+        adapter.get_item(viewer, 'data', 503)
+        self.assertEqual(adapter.blocks_read, 4)
+        self.assertIsNone(adapter.get_item(viewer, 'data', 1000))
+
+    def test_only_visible_blocks_are_read(self):
+        data = OutOfCoreArray(np.arange(40000).reshape(10000, 4))
+        viewer = ArrayViewer(data=data)
+        adapter = self.adapter_for(viewer, block_size=50)
+
+        for row in range(5000, 5020):
+            for column in range(4):
+                adapter.get_text(viewer, 'data', row, column)
+        self.assertEqual(adapter.get_text(viewer, 'data', 5001, 1), '20005')
+        self.assertEqual(data.values_read, 200)
+        self.assertEqual(adapter.blocks_read, 1)
+
+    def test_slices_of_nd_arrays(self):
+        data = np.arange(2 * 3 * 4).reshape(2, 3, 4)
+        viewer = ArrayViewer(data=data)
+        adapter = self.adapter_for(viewer, row_axis=1, column_axis=2,
+                                   indices=[1, 0, 0])
+        self.assertEqual(adapter.len(viewer, 'data'), 3)
+        self.assertEqual(adapter.get_text(viewer, 'data', 2, 3), '23')
+
+        adapter.trait_set(row_axis=2, column_axis=0, indices=[0, 1, 0])
+        self.assertEqual(adapter.len(viewer, 'data'), 4)
+        self.assertEqual(adapter.get_text(viewer, 'data', 3, 1), '19')
+
+        adapter.transpose = True
+        self.assertEqual(adapter.len(viewer, 'data'), 2)
+        self.assertEqual(adapter.get_text(viewer, 'data', 1, 3), '19')
+
+
+class TestArrayViewEditor(unittest.TestCase):
+
+    @skip_if_null
+    def test_axes_controls(self):
+        viewer = ArrayViewer(data=np.arange(2 * 3 * 4).reshape(2, 3, 4))
+        ui = viewer.edit_traits()
+        try:
+            editor, = ui.get_editors('data')
+            adapter = editor.adapter
+            # Axis 1 is displayed as the columns, after the index column:
+            self.assertEqual((editor.row_axis, editor.column_axis), (0, 1))
+            self.assertEqual(len(adapter.columns), 4)
+
+            # Showing axis 1 as the rows moves axis 0 to the columns:
+            editor.row_axis = 1
+            self.assertEqual((editor.row_axis, editor.column_axis), (1, 0))
+            self.assertEqual((adapter.row_axis, adapter.column_axis), (1, 0))
+            self.assertEqual(len(adapter.columns), 3)
+
+            editor.indices = [0, 0, 7]
+            self.assertEqual(list(adapter.indices), [0, 0, 3])
+        finally:
+            ui.dispose()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -16,7 +16,7 @@ except ImportError as exc:
     print "Can't import Pandas: skipping"
     raise nose.SkipTest
 
-from traits.api import Event, HasTraits, Instance
+from traits.api import Event, HasTraits, Instance, Str
 
 from traitsui.item import Item
 from traitsui.ui_editors.data_frame_editor import (
@@ -59,6 +59,14 @@ DATA = [[ 0,  1,  2],
         [ 9, 10, 11]]
 
 
+class ColumnClicked(object):
+    """ Stands in for the event of a column header being clicked.
+    """
+
+    def __init__(self, column):
+        self.column = column
+
+
 def sample_data():
     df = DataFrame(DATA, index=['one', 'two', 'three', 'four'],
                    columns=['X', 'Y', 'Z'])
@@ -439,3 +447,65 @@ def test_data_frame_editor_with_refresh():
         ui = viewer.edit_traits()
         viewer.df_updated = True
         ui.dispose()
+
+
+@skip_if_null
+def test_adapter_sort():
+    viewer = sample_text_data()
+    adapter = DataFrameAdapter(sort_column='Z')
+
+    assert_array_equal(adapter.get_positions(viewer, 'data'), [2, 3, 1, 0])
+    assert adapter.get_item(viewer, 'data', 0).index[0] == 'three'
+
+    adapter.sort_ascending = False
+    assert_array_equal(adapter.get_positions(viewer, 'data'), [0, 1, 3, 2])
+
+    adapter.sort_column = 'index'
+    assert_array_equal(adapter.get_positions(viewer, 'data'), [1, 2, 0, 3])
+
+
+@skip_if_null
+def test_adapter_query():
+    viewer = sample_data()
+    adapter = DataFrameAdapter(query='X > 2 and Z < 10')
+
+    assert adapter.len(viewer, 'data') == 2
+    assert adapter.get_item(viewer, 'data', 1).index[0] == 'three'
+
+    adapter.sort_column = 'Y'
+    adapter.sort_ascending = False
+    assert_array_equal(adapter.get_positions(viewer, 'data'), [2, 1])
+
+    adapter.delete(viewer, 'data', 0)
+    assert_array_equal(viewer.data.index, ['one', 'two', 'four'])
+    assert adapter.len(viewer, 'data') == 1
+
+
+@skip_if_null
+def test_data_frame_editor_sort_and_filter():
+
+    class DataFrameViewer(HasTraits):
+        data = Instance(DataFrame)
+        query = Str
+        view = View(
+            Item('data', editor=DataFrameEditor(sortable=True,
+                                                filter='query'))
+        )
+
+    viewer = DataFrameViewer(data=sample_text_data().data)
+    with store_exceptions_on_all_threads():
+        ui = viewer.edit_traits()
+        editor, = ui.get_editors('data')
+        adapter = editor.adapter
+
+        viewer.query = 'X > 2'
+        assert adapter.query == 'X > 2'
+        assert adapter.len(viewer, 'data') == 3
+
+        # Click on the header of the 'Z' column (after the index column):
+        editor.column_clicked = ColumnClicked(3)
+        assert adapter.sort_column == 'Z'
+        assert_array_equal(adapter.get_positions(viewer, 'data'), [2, 3, 1])
+        editor.column_clicked = ColumnClicked(3)
+        assert not adapter.sort_ascending
+        ui.dispose()
@@ -25,6 +25,7 @@
 
 from __future__ import absolute_import
 
+import logging
 import shelve
 import os
 
@@ -58,8 +59,19 @@ from .ui_info import UIInfo
 
 from .item import Item
 
+from .prefs_store import get_prefs_store
+
+from .helper import compiled
+
+from .conditions import ConditionContext, parse_condition
+
+from . import profiling
+
 from .group import Group, ShadowGroup
 
+
+logger = logging.getLogger(__name__)
+
 #-------------------------------------------------------------------------
 #  Constants:
 #-------------------------------------------------------------------------
@@ -160,6 +172,18 @@ class UI(HasPrivateTraits):
     # List of (checked_when,Editor) pairs
     _checked = List
 
+    # The (visible, enabled, checked) lists of the condition pairs that must
+    # be evaluated when a trait changes, keyed by (object id, trait name)
+    _dependents = Any
+
+    # The (visible, enabled, checked) lists of the condition pairs whose
+    # dependencies are unknown, which are evaluated whenever anything changes
+    _independents = Any
+
+    # List of (object, trait name) pairs listened to for the conditions (a
+    # trait name of None means any trait)
+    _when_listeners = List
+
     # Search stack used while building a user interface
     _search = List
 
@@ -198,7 +222,8 @@ class UI(HasPrivateTraits):
     # (i.e. rebuilt).
     recyclable_traits = [
         '_context', '_revert', '_defined', '_visible', '_enabled', '_checked',
-        '_search', '_dispatchers', '_editors', '_names', '_active_group',
+        '_dependents', '_independents', '_when_listeners', '_search',
+        '_dispatchers', '_editors', '_names', '_active_group',
         '_undoable', '_rebuild', '_groups_cache'
     ]
 
@@ -265,6 +290,9 @@ class UI(HasPrivateTraits):
         # Discard any context object associated with the ui view control:
         self.control._object = None
 
+        # Stop evaluating the 'visible', 'enabled' and 'checked' conditions:
+        self._unwatch_conditions()
+
         # Reset all recyclable traits:
         self.reset_traits(self.recyclable_traits)
 
@@ -281,8 +309,7 @@ class UI(HasPrivateTraits):
 
         # Make sure that 'visible', 'enabled', and 'checked' handlers are not
         # called after the editor has been disposed:
-        for object in self.context.values():
-            object.on_trait_change(self._evaluate_when, remove=True)
+        self._unwatch_conditions()
 
         # Notify the handler that the view has been closed:
         self.handler.closed(self.info, self.result)
@@ -410,6 +437,8 @@ class UI(HasPrivateTraits):
         """ Performs all processing that occurs after the user interface is
             created.
         """
+        start = profiling.start()
+
         # Invoke all of the editor 'name_defined' methods we've accumulated:
         info = self.info.set(initialized=False)
         for method in self._defined:
@@ -457,21 +486,25 @@ class UI(HasPrivateTraits):
 
         # If there are any Editor object's whose 'visible', 'enabled' or
         # 'checked' state is controlled by a 'visible_when', 'enabled_when' or
-        # 'checked_when' expression, set up an 'anytrait' changed notification
-        # handler on each object in the 'context' that will cause the 'visible',
-        # 'enabled' or 'checked' state of each affected Editor to be set. Also
-        # trigger the evaluation immediately, so the visible, enabled or checked
-        # state of each Editor can be correctly initialized:
+        # 'checked_when' expression, set up trait change notification handlers
+        # on the traits read by the expressions (or an 'anytrait' handler on
+        # each object in the 'context' if some of them are unknown) that will
+        # cause the 'visible', 'enabled' or 'checked' state of each affected
+        # Editor to be set. Also trigger the evaluation immediately, so the
+        # visible, enabled or checked state of each Editor can be correctly
+        # initialized:
         if (len(self._visible) +
             len(self._enabled) +
                 len(self._checked)) > 0:
-            for object in context.values():
-                object.on_trait_change(self._evaluate_when, dispatch='ui')
+            self._watch_conditions()
             self._do_evaluate_when(at_init=True)
 
         # Indicate that the user interface has been initialized:
         info.initialized = True
 
+        if start is not None:
+            profiling.ui_prepared(self, start)
+
     #-------------------------------------------------------------------------
     #  Synchronize context object traits with view editor traits:
     #-------------------------------------------------------------------------
@@ -538,14 +571,12 @@ class UI(HasPrivateTraits):
         """
         id = self.id
         if id != '':
-            db = self.get_ui_db()
-            if db is not None:
-                try:
-                    ui_prefs = db.get(id)
-                    db.close()
-                    return self.set_prefs(ui_prefs)
-                except:
-                    pass
+            try:
+                ui_prefs = get_prefs_store().get(id)
+                return self.set_prefs(ui_prefs)
+            except Exception:
+                logger.exception('Unable to restore the preferences for %r',
+                                 id)
 
         return None
 
@@ -587,10 +618,10 @@ class UI(HasPrivateTraits):
 
         id = self.id
         if id != '':
-            db = self.get_ui_db(mode='c')
-            if db is not None:
-                db[id] = self.get_prefs(prefs)
-                db.close()
+            try:
+                get_prefs_store().set(id, self.get_prefs(prefs))
+            except Exception:
+                logger.exception('Unable to save the preferences for %r', id)
 
     #-------------------------------------------------------------------------
     #  Gets the preferences to be saved for the user interface:
@@ -621,7 +652,9 @@ class UI(HasPrivateTraits):
     #-------------------------------------------------------------------------
 
     def get_ui_db(self, mode='r'):
-        """ Returns a reference to the Traits UI preference database.
+        """ Returns a reference to the legacy Traits UI shelve preference
+            database. User interface preferences are now saved in the store
+            returned by traitsui.prefs_store.get_prefs_store().
         """
         try:
             return shelve.open(os.path.join(traits_home(), 'traits_ui'),
@@ -678,8 +711,7 @@ class UI(HasPrivateTraits):
             'visible_when' objects.
         """
         try:
-            self._visible.append((compile(visible_when, '<string>', 'eval'),
-                                  editor))
+            self._visible.append((parse_condition(visible_when), editor))
         except:
             pass
             # fixme: Log an error here...
@@ -694,8 +726,7 @@ class UI(HasPrivateTraits):
             'enabled_when' objects.
         """
         try:
-            self._enabled.append((compile(enabled_when, '<string>', 'eval'),
-                                  editor))
+            self._enabled.append((parse_condition(enabled_when), editor))
         except:
             pass
             # fixme: Log an error here...
@@ -710,8 +741,7 @@ class UI(HasPrivateTraits):
             monitored 'checked_when' objects.
         """
         try:
-            self._checked.append((compile(checked_when, '<string>', 'eval'),
-                                  editor))
+            self._checked.append((parse_condition(checked_when), editor))
         except:
             pass
             # fixme: Log an error here...
@@ -778,7 +808,8 @@ class UI(HasPrivateTraits):
         context = self.context.copy()
         context['ui'] = self
         context['handler'] = self.handler
-        return eval(function, globals(), context)(*args, **kw_args)
+        return eval(compiled(function), globals(), context)(*args,
+                                                            **kw_args)
 
     #-------------------------------------------------------------------------
     #  Evaluates an expression in the UI's 'context' and returns the result:
@@ -790,7 +821,7 @@ class UI(HasPrivateTraits):
         """
         context = self._get_context(self.context)
         try:
-            result = eval(when, globals(), context)
+            result = eval(compiled(when), globals(), context)
         except:
             from traitsui.api import raise_to_debug
             raise_to_debug()
@@ -815,13 +846,8 @@ class UI(HasPrivateTraits):
         elif n == 1:
             name = context.keys()[0]
 
-        value = context.get(name)
-        if value is not None:
-            context2 = value.trait_get()
-            context2.update(context)
-        else:
-            context2 = context.copy()
-
+        # The traits of the main object are only fetched if they are used:
+        context2 = ConditionContext(context, context.get(name))
         context2['ui'] = self
 
         return context2
@@ -832,12 +858,25 @@ class UI(HasPrivateTraits):
     #  expression:
     #-------------------------------------------------------------------------
 
-    def _evaluate_when(self):
-        """ Set the 'visible', 'enabled', and 'checked' states for all Editors
+    def _evaluate_when(self, object, name, new):
+        """ Set the 'visible', 'enabled', and 'checked' states for the Editors
             controlled by a 'visible_when', 'enabled_when' or 'checked_when'
-            expression.
+            expression which depends on a trait that has changed.
         """
-        self._do_evaluate_when(at_init=False)
+        dependents = self._dependents.get((id(object), name))
+        independents = self._independents
+        if dependents is None:
+            if not (independents[0] or independents[1] or independents[2]):
+                return
+            dependents = independents
+        elif independents[0] or independents[1] or independents[2]:
+            dependents = [dependent + independent for dependent, independent
+                          in zip(dependents, independents)]
+
+        context = self._get_context(self.context)
+        self._evaluate_condition(dependents[0], 'visible', context=context)
+        self._evaluate_condition(dependents[1], 'enabled', context=context)
+        self._evaluate_condition(dependents[2], 'checked', context=context)
 
     def _do_evaluate_when(self, at_init=False):
         """ Set the 'visible', 'enabled', and 'checked' states for all Editors.
@@ -850,18 +889,72 @@ class UI(HasPrivateTraits):
         time at initialization. In that case, we want to force the state of
         the items to be set (normally it is set only if it changes).
         """
-        self._evaluate_condition(self._visible, 'visible', at_init)
-        self._evaluate_condition(self._enabled, 'enabled', at_init)
-        self._evaluate_condition(self._checked, 'checked', at_init)
+        context = self._get_context(self.context)
+        self._evaluate_condition(self._visible, 'visible', at_init, context)
+        self._evaluate_condition(self._enabled, 'enabled', at_init, context)
+        self._evaluate_condition(self._checked, 'checked', at_init, context)
+
+    #-------------------------------------------------------------------------
+    #  Listens to the traits read by the 'visible_when', 'enabled_when' and
+    #  'checked_when' expressions:
+    #-------------------------------------------------------------------------
+
+    def _watch_conditions(self):
+        """ Indexes the 'visible_when', 'enabled_when' and 'checked_when'
+            expressions by the traits they read, and listens to those traits
+            (or to any trait of the context objects if the traits read by some
+            expressions cannot be determined).
+        """
+        context = self._get_context(self.context)
+        dependents = {}
+        independents = ([], [], [])
+        listeners = []
+        for i, conditions in enumerate(
+                (self._visible, self._enabled, self._checked)):
+            for pair in conditions:
+                traits = pair[0].traits(context, context.object)
+                if traits is None:
+                    independents[i].append(pair)
+                    continue
+                for object, name in traits:
+                    names = [name]
+                    if object.trait(name + '_items') is not None:
+                        names.append(name + '_items')
+                    for name in names:
+                        key = (id(object), name)
+                        lists = dependents.get(key)
+                        if lists is None:
+                            lists = dependents[key] = ([], [], [])
+                            listeners.append((object, name))
+                        lists[i].append(pair)
+
+        if independents[0] or independents[1] or independents[2]:
+            # Any change may affect the state of an Editor:
+            listeners = [(object, None) for object in self.context.values()]
+
+        self._dependents = dependents
+        self._independents = independents
+        self._when_listeners = listeners
+        for object, name in listeners:
+            object.on_trait_change(self._evaluate_when, name, dispatch='ui')
+
+    def _unwatch_conditions(self):
+        """ Stops listening to the traits read by the 'visible_when',
+            'enabled_when' and 'checked_when' expressions.
+        """
+        for object, name in self._when_listeners:
+            object.on_trait_change(self._evaluate_when, name, remove=True)
+        self._when_listeners = []
 
     #-------------------------------------------------------------------------
     #  Evaluates a list of ( eval, editor ) pairs and sets a specified trait on
     #  each editor to reflect the boolean truth of the expression evaluated:
     #-------------------------------------------------------------------------
 
-    def _evaluate_condition(self, conditions, trait, at_init=False):
-        """ Evaluates a list of (eval, editor) pairs and sets a specified trait
-        on each editor to reflect the Boolean value of the expression.
+    def _evaluate_condition(self, conditions, trait, at_init=False,
+                            context=None):
+        """ Evaluates a list of (condition, editor) pairs and sets a specified
+        trait on each editor to reflect the Boolean value of the expression.
 
         1) All conditions are evaluated
         2) The elements whose condition evaluates to False are updated
@@ -878,10 +971,10 @@ class UI(HasPrivateTraits):
 
         Parameters
         ----------
-        conditions : list of (str, Editor) tuple
-            A list of tuples, each formed by 1) a string that contains a
-            condition that evaluates to either True or False, and
-            2) the editor whose state depends on the condition
+        conditions : list of (Condition, Editor) tuple
+            A list of tuples, each formed by 1) a parsed condition that
+            evaluates to either True or False, and 2) the editor whose state
+            depends on the condition
 
         trait : str
             The trait that is set by the condition.
@@ -892,9 +985,13 @@ class UI(HasPrivateTraits):
             (e.g., a visible element would not be updated to visible=True
             again). If True, the state is always updated (used at
             initialization).
-        """
 
-        context = self._get_context(self.context)
+        context : ConditionContext
+            The context to evaluate the conditions in (if None, it is created
+            from the UI's context).
+        """
+        if context is None:
+            context = self._get_context(self.context)
 
         # list of elements that should be activated
         activate = []
@@ -903,7 +1000,7 @@ class UI(HasPrivateTraits):
 
         for when, editor in conditions:
             try:
-                cond_value = eval(when, globals(), context)
+                cond_value = eval(when.code, globals(), context)
                 editor_state = getattr(editor, trait)
 
                 # add to update lists only if at_init is True (called on
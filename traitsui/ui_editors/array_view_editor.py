@@ -15,16 +15,27 @@
 
 #-------------------------------------------------------------------------
 
-""" Defines an ArrayViewEditor for displaying 1-d or 2-d arrays of values.
+""" Defines an ArrayViewEditor for displaying 1-d or 2-d arrays of values,
+    or 2-d slices of arrays with more dimensions.
+
+    The array may also be out-of-core (such as a numpy.memmap, or an HDF5
+    dataset), since only the blocks of rows being displayed are read from
+    it.
 """
 
 #-- Imports --------------------------------------------------------------
 
 from __future__ import absolute_import
 
-from traits.api import Instance, Property, List, Str, Bool, Font
+from collections import OrderedDict
+
+import numpy as np
 
-from ..api import View, Item, TabularEditor, BasicEditorFactory
+from traits.api import (Any, Instance, Int, Property, List, Str, Bool, Font,
+                        on_trait_change)
+
+from ..api import (View, Item, HGroup, TabularEditor, BasicEditorFactory,
+                   EnumEditor, ListEditor)
 
 from ..tabular_adapter import TabularAdapter
 
@@ -32,6 +43,9 @@ from ..toolkit import toolkit_object
 
 from ..ui_editor import UIEditor
 
+# The maximum number of values read from the array at once:
+MAX_BLOCK_VALUES = 1000000
+
 #-- Tabular Adapter Definition -------------------------------------------
 
 
@@ -43,9 +57,38 @@ class ArrayViewAdapter(TabularAdapter):
     # Should array rows and columns be transposed:
     transpose = Bool(False)
 
+    # The axis of the array displayed as rows:
+    row_axis = Int(0)
+
+    # The axis of the array displayed as columns:
+    column_axis = Int(1)
+
+    # The index along each axis of the array which is not displayed (the
+    # values for the displayed axes are ignored):
+    indices = List(Int, update=True)
+
+    # The number of rows read from the array at once (fewer if the rows
+    # have too many values):
+    block_size = Int(256)
+
+    # The maximum number of blocks of rows kept in memory:
+    max_blocks = Int(8)
+
+    # The number of blocks of rows read from the array so far:
+    blocks_read = Int
+
     alignment = 'right'
     index_text = Property
 
+    #-- Private Traits -------------------------------------------------------
+
+    # The array the cached blocks were read from:
+    _array = Any(transient=True)
+
+    # The cached blocks of rows, keyed by block index, the least recently
+    # used first:
+    _blocks = Any(transient=True)
+
     def _get_index_text(self):
         return str(self.row)
 
@@ -56,24 +99,92 @@ class ArrayViewAdapter(TabularAdapter):
         return self.item
 
     def get_item(self, object, trait, row):
-        """ Returns the value of the *object.trait[row]* item.
+        """ Returns the value of the *object.trait[row]* item, reading the
+            block of rows containing it if it is not cached.
         """
+        array = getattr(object, trait)
+        blocks = self._blocks
+        if (array is not self._array) or (blocks is None):
+            self._array = array
+            blocks = self._blocks = OrderedDict()
+
+        size = self._block_rows(array)
+        index, offset = divmod(row, size)
+        block = blocks.pop(index, None)
+        if block is None:
+            if len(blocks) >= max(self.max_blocks, 1):
+                blocks.popitem(last=False)
+            block = self._read_block(array, index * size, (index + 1) * size)
+        blocks[index] = block
+
+        if offset >= len(block):
+            return None
+
+        return block[offset]
+
+    def len(self, object, trait):
+        """ Returns the number of items in the specified *object.trait* list.
+        """
+        # Sometimes, during shutdown, the object has been set to None.
+        if object is None:
+            return 0
+
+        shape = getattr(object, trait).shape
         if self.is_2d:
-            if self.transpose:
-                return getattr(object, trait)[:, row]
+            return shape[self._axes()[0]]
 
-            return super(ArrayViewAdapter, self).get_item(object, trait,
-                                                          row)
+        return shape[0]
 
-        return getattr(object, trait)[row]
+    #-- Private Methods ------------------------------------------------------
 
-    def len(self, object, trait):
-        """ Returns the number of items in the specified *object.trait* list.
+    def _axes(self):
+        """ Returns the axes of the array displayed as rows and as columns.
         """
         if self.transpose:
-            return getattr(object, trait).shape[1]
+            return (self.column_axis, self.row_axis)
+
+        return (self.row_axis, self.column_axis)
 
-        return super(ArrayViewAdapter, self).len(object, trait)
+    def _block_rows(self, array):
+        """ Returns the number of rows of the blocks read from an array.
+        """
+        size = max(self.block_size, 1)
+        if self.is_2d:
+            columns = array.shape[self._axes()[1]]
+            size = max(min(size, MAX_BLOCK_VALUES // max(columns, 1)), 1)
+
+        return size
+
+    def _read_block(self, array, start, stop):
+        """ Returns the rows from *start* up to (but not including) *stop*.
+            The rows of an in-memory (or memory-mapped) array are a view of
+            it, while those of other arrays are read into memory.
+        """
+        if self.is_2d:
+            rows, columns = self._axes()
+            key = [0] * len(array.shape)
+            key[:len(self.indices)] = self.indices[:len(key)]
+            key[rows] = slice(start, stop)
+            key[columns] = slice(None)
+            block = array[tuple(key)]
+            if not isinstance(block, np.ndarray):
+                block = np.asarray(block)
+            if rows > columns:
+                block = block.T
+        else:
+            block = array[start:stop]
+            if not isinstance(block, np.ndarray):
+                block = np.asarray(block)
+
+        self.blocks_read += 1
+        return block
+
+    @on_trait_change('is_2d, transpose, row_axis, column_axis, indices, '
+                     'indices_items, block_size')
+    def _flush_blocks(self):
+        """ Discards the cached blocks when the rows displayed change.
+        """
+        self._blocks = None
 
 # Define the actual abstract Traits UI array view editor (each backend should
 # implement its own editor that inherits from this class.
@@ -90,19 +201,44 @@ class _ArrayViewEditor(UIEditor):
     # The tabular adapter being used for the editor view:
     adapter = Instance(ArrayViewAdapter)
 
+    # For arrays with more than 2 dimensions, the axis displayed as rows, the
+    # axis displayed as columns, and the index along each axis (the indices
+    # of the displayed axes are ignored):
+    row_axis = Int(0)
+
+    column_axis = Int(1)
+
+    indices = List(Int)
+
     #-- Private Methods ------------------------------------------------------
 
     def _array_view(self):
         """ Return the view used by the editor.
         """
+        items = [Item('object.object.' + self.name,
+                      id='tabular_editor',
+                      show_label=False,
+                      editor=TabularEditor(show_titles=self.show_titles,
+                                           editable=False,
+                                           adapter=self.adapter)
+                      )]
+
+        n_axes = len(self.value.shape)
+        if n_axes > 2:
+            axes = EnumEditor(values=list(range(n_axes)))
+            items.insert(0, HGroup(
+                Item('row_axis', label='Rows', editor=axes),
+                Item('column_axis', label='Columns', editor=axes),
+                Item('indices', style='custom',
+                     editor=ListEditor(mutable=False, columns=n_axes)),
+            ))
+
+        if self.factory.show_statistics:
+            items.append(Item('object.adapter.blocks_read', style='readonly',
+                              label='Blocks read'))
+
         return View(
-            Item('object.object.' + self.name,
-                 id='tabular_editor',
-                 show_label=False,
-                 editor=TabularEditor(show_titles=self.show_titles,
-                                      editable=False,
-                                      adapter=self.adapter)
-                 ),
+            items,
             id='array_view_editor',
             resizable=True
         )
@@ -113,21 +249,37 @@ class _ArrayViewEditor(UIEditor):
         # Make sure that the value is an array of the correct shape:
         shape = self.value.shape
         len_shape = len(shape)
-        if (len_shape == 0) or (len_shape > 2):
-            raise ValueError("ArrayViewEditor can only display 1D or 2D "
-                             "arrays")
+        if len_shape == 0:
+            raise ValueError("ArrayViewEditor can only display arrays with "
+                             "at least one dimension")
 
         factory = self.factory
+        self.show_titles = (len(factory.titles) > 0)
+        self.indices = [0] * len_shape
+        self.adapter = ArrayViewAdapter(is_2d=(len_shape >= 2),
+                                        columns=self._columns(),
+                                        transpose=factory.transpose,
+                                        indices=self.indices,
+                                        format=factory.format,
+                                        font=factory.font)
+
+        return self.edit_traits(view='_array_view',
+                                parent=parent,
+                                kind='subpanel')
+
+    def _columns(self):
+        """ Returns the columns of the adapter for the axes displayed.
+        """
+        factory = self.factory
+        shape = self.value.shape
         cols = 1
-        titles = factory.titles
+        titles = list(factory.titles)
         n = len(titles)
-        self.show_titles = (n > 0)
-        is_2d = (len_shape == 2)
-        if is_2d:
-            index = 1
+        if len(shape) >= 2:
+            axis = self.column_axis
             if factory.transpose:
-                index = 0
-            cols = shape[index]
+                axis = self.row_axis
+            cols = shape[axis]
             if self.show_titles:
                 if n > cols:
                     titles = titles[:cols]
@@ -148,15 +300,41 @@ class _ArrayViewEditor(UIEditor):
         if factory.show_index:
             columns.insert(0, ('Index', 'index'))
 
-        self.adapter = ArrayViewAdapter(is_2d=is_2d,
-                                        columns=columns,
-                                        transpose=factory.transpose,
-                                        format=factory.format,
-                                        font=factory.font)
+        return columns
 
-        return self.edit_traits(view='_array_view',
-                                parent=parent,
-                                kind='subpanel')
+    #-- Trait Event Handlers -------------------------------------------------
+
+    def _row_axis_changed(self, old, new):
+        if new == self.column_axis:
+            self.column_axis = old
+        else:
+            self._update_slice()
+
+    def _column_axis_changed(self, old, new):
+        if new == self.row_axis:
+            self.row_axis = old
+        else:
+            self._update_slice()
+
+    @on_trait_change('indices, indices_items')
+    def _update_slice(self):
+        """ Displays the slice of the array selected by the axes and indices.
+        """
+        adapter = self.adapter
+        if adapter is None:
+            return
+
+        shape = self.value.shape
+        indices = [min(max(index, 0), size - 1)
+                   for index, size in zip(self.indices, shape)]
+        if indices != self.indices:
+            self.indices = indices
+            return
+
+        adapter.trait_set(row_axis=self.row_axis,
+                          column_axis=self.column_axis,
+                          indices=indices)
+        adapter.columns = self._columns()
 
 # Define the ArrayViewEditor class used by client code:
 
@@ -181,6 +359,9 @@ class ArrayViewEditor(BasicEditorFactory):
     # The font to use for displaying each array element:
     font = Font('Courier 10')
 
+    # Should the number of blocks of rows read from the array be displayed:
+    show_statistics = Bool(False)
+
     def _get_klass(self):
         """ The class used to construct editor objects.
         """
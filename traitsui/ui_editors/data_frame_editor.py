@@ -8,8 +8,11 @@
 
 from __future__ import absolute_import
 
-from traits.api import (Bool, Dict, Either, Enum, Font, Instance, List,
-                        Property, Str)
+import logging
+
+from traits.api import (Any, Bool, Dict, Either, Enum, Font, Instance, List,
+                        Property, Str, on_trait_change)
+from traits.trait_base import xsetattr
 
 from traitsui.basic_editor_factory import BasicEditorFactory
 from traitsui.editors.tabular_editor import TabularEditor
@@ -19,6 +22,8 @@ from traitsui.toolkit import toolkit_object
 from traitsui.ui_editor import UIEditor
 from traitsui.view import View
 
+logger = logging.getLogger(__name__)
+
 
 class DataFrameAdapter(TabularAdapter):
     """ Generic tabular adapter for data frames
@@ -48,6 +53,24 @@ class DataFrameAdapter(TabularAdapter):
     #: The font for each element, or a mapping column ID to font.
     _fonts = Either(Font, Dict, default='Courier 10')
 
+    #: The ID of the column the rows are sorted by ('index' for the index),
+    #: or None to display them in the order of the data frame.
+    sort_column = Any
+
+    #: Are the rows sorted in ascending order?
+    sort_ascending = Bool(True)
+
+    #: The expression (evaluated by DataFrame.eval) the rows displayed must
+    #: match, or an empty string to display every row.
+    query = Str
+
+    #: The positions in the data frame of the rows displayed, or None if
+    #: every row is displayed in order.
+    _positions = Any
+
+    #: The data frame the positions were computed for.
+    _positions_frame = Any
+
     def _get_index_alignment(self):
         import numpy as np
 
@@ -99,7 +122,8 @@ class DataFrameAdapter(TabularAdapter):
         index = getattr(self.object, self.name).index
         dtype = index.dtype
         value = dtype.type(value)
-        index.values[self.row] = value
+        row = self._frame_row(self.object, self.name, self.row)
+        index.values[row] = value
 
     #---- Adapter methods that are not sensitive to item type ----------------
 
@@ -110,8 +134,22 @@ class DataFrameAdapter(TabularAdapter):
         using a dataframe preserves dtypes.
 
         """
+        row = self._frame_row(object, trait, row)
         return getattr(object, trait).iloc[row:row + 1]
 
+    def len(self, object, trait):
+        """ Override the base implementation to only count the rows
+        displayed.
+        """
+        if object is None:
+            return 0
+
+        positions = self.get_positions(object, trait)
+        if positions is None:
+            return len(getattr(object, trait))
+
+        return len(positions)
+
     def delete(self, object, trait, row):
         """ Override the base implementation to work with DataFrames
 
@@ -121,6 +159,7 @@ class DataFrameAdapter(TabularAdapter):
         import pandas as pd
 
         df = getattr(object, trait)
+        row = self._frame_row(object, trait, row)
         if 0 < row < len(df) - 1:
             new_df = pd.concat([df.iloc[:row, :], df.iloc[row + 1:, :]])
         elif row == 0:
@@ -138,6 +177,7 @@ class DataFrameAdapter(TabularAdapter):
         import pandas as pd
 
         df = getattr(object, trait)
+        row = self._frame_row(object, trait, row)
         if 0 < row < len(df) - 1:
             new_df = pd.concat([df.iloc[:row, :], value, df.iloc[row:, :]])
         elif row == 0:
@@ -147,6 +187,93 @@ class DataFrameAdapter(TabularAdapter):
         setattr(object, trait, new_df)
 
 
+    #---- Sorting and filtering ----------------------------------------------
+
+    def get_positions(self, object, trait):
+        """ Returns the positions in the *object.trait* data frame of the rows
+        displayed, or None if every row is displayed in order.
+
+        The positions are computed on the whole data frame (without copying
+        it), and only again when the data frame is replaced or the sorting
+        or filtering changes.
+        """
+        df = getattr(object, trait)
+        if df is not self._positions_frame:
+            self._positions = self._compute_positions(df)
+            self._positions_frame = df
+
+        return self._positions
+
+    def _frame_row(self, object, trait, row):
+        """ Returns the position in the data frame of a displayed row.
+        """
+        positions = self.get_positions(object, trait)
+        if positions is None:
+            return row
+        if row >= len(positions):
+            # After the last row displayed:
+            return len(getattr(object, trait))
+
+        return positions[row]
+
+    def _compute_positions(self, df):
+        """ Returns the positions of the rows of a data frame matching the
+        query, in the sort order.
+        """
+        import numpy as np
+
+        positions = None
+        if self.query:
+            try:
+                mask = df.eval(self.query)
+            except Exception:
+                logger.warning('Invalid data frame query: %r', self.query,
+                               exc_info=True)
+            else:
+                positions = np.flatnonzero(np.asarray(mask, dtype=bool))
+
+        if self.sort_column is not None:
+            if self.sort_column == 'index':
+                values = df.index.values
+            else:
+                values = df[self.sort_column].values
+            if positions is not None:
+                values = values[positions]
+            order = _argsort(values, self.sort_ascending)
+            positions = order if positions is None else positions[order]
+
+        return positions
+
+    @on_trait_change('sort_column, sort_ascending, query')
+    def _rows_reordered(self):
+        """ Recomputes the positions of the rows displayed when the sorting
+        or filtering changes.
+        """
+        self._positions_frame = None
+        self.rows_changed = True
+
+
+def _argsort(values, ascending=True):
+    """ Returns the indices sorting an array of values, with the missing
+    values last.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if values.dtype.kind not in 'biuf':
+        return pd.Series(values).sort_values(ascending=ascending).index.values
+
+    order = np.argsort(values)
+    if not ascending:
+        # Reverse the order, but keep the NaNs (sorted last) at the end:
+        n = len(order)
+        if values.dtype.kind == 'f':
+            n -= np.count_nonzero(np.isnan(values))
+        order = np.concatenate([order[:n][::-1], order[n:]])
+
+    return order
+
+
 class _DataFrameEditor(UIEditor):
     """ TraitsUI-based editor implementation for data frames """
 
@@ -159,6 +286,12 @@ class _DataFrameEditor(UIEditor):
     # The tabular adapter being used for the editor view:
     adapter = Instance(DataFrameAdapter)
 
+    # The expression the rows displayed must match (if any):
+    query = Str
+
+    # The column header clicked (when the data frame can be sorted):
+    column_clicked = Any
+
     #-- Private Methods ------------------------------------------------------
 
     def _target_name(self, name):
@@ -170,6 +303,10 @@ class _DataFrameEditor(UIEditor):
     def _data_frame_view(self):
         """ Return the view used by the editor.
         """
+        if self.factory.sortable:
+            column_clicked = 'object.column_clicked'
+        else:
+            column_clicked = self._target_name(self.factory.column_clicked)
 
         return View(
             Item(
@@ -189,7 +326,7 @@ class _DataFrameEditor(UIEditor):
                     dclicked=self._target_name(self.factory.dclicked),
                     right_clicked=self._target_name(self.factory.right_clicked),  # noqa
                     right_dclicked=self._target_name(self.factory.right_dclicked),  # noqa
-                    column_clicked=self._target_name(self.factory.column_clicked),  # noqa
+                    column_clicked=column_clicked,
                     column_right_clicked=self._target_name(self.factory.column_right_clicked),  # noqa
                     operations=self.factory.operations,
                     update=self._target_name(self.factory.update),
@@ -238,6 +375,8 @@ class _DataFrameEditor(UIEditor):
                 _fonts=factory.fonts
             )
 
+        self.sync_value(factory.filter, 'query', 'from')
+
         return self.edit_traits(
             view='_data_frame_view',
             parent=parent,
@@ -245,6 +384,29 @@ class _DataFrameEditor(UIEditor):
         )
 
 
+    #-- Trait Event Handlers -------------------------------------------------
+
+    def _query_changed(self, query):
+        self.adapter.query = query
+
+    def _column_clicked_changed(self, event):
+        """ Sorts the rows by the clicked column, in the opposite order if
+            they are already sorted by it.
+        """
+        if self.factory.column_clicked:
+            xsetattr(self.object, self.factory.column_clicked, event)
+
+        if event is None:
+            return
+
+        adapter = self.adapter
+        column_id = adapter.column_map[event.column]
+        if column_id == adapter.sort_column:
+            adapter.sort_ascending = not adapter.sort_ascending
+        else:
+            adapter.trait_set(sort_column=column_id, sort_ascending=True)
+
+
 class DataFrameEditor(BasicEditorFactory):
     """ Editor factory for basic data frame editor """
 
@@ -316,6 +478,13 @@ class DataFrameEditor(BasicEditorFactory):
     operations = List(Enum('delete', 'insert', 'append', 'edit', 'move'),
                       ['delete', 'insert', 'append', 'edit', 'move'])
 
+    #: Can the rows be sorted by clicking on the column headers?
+    sortable = Bool(False)
+
+    #: The optional extended name of the trait containing an expression
+    #: (evaluated by DataFrame.eval) the rows displayed must match.
+    filter = Str
+
     # The optional extended name of the trait used to indicate that a complete
     # table update is needed:
     update = Str
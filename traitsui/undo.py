@@ -27,8 +27,8 @@ from __future__ import absolute_import
 
 import collections
 
-from traits.api import (Event, HasPrivateTraits, HasStrictTraits, HasTraits,
-                        Instance, Int, List, Property, Str, Trait)
+from traits.api import (Bool, Dict, Event, HasPrivateTraits, HasStrictTraits,
+                        HasTraits, Instance, Int, List, Property, Str, Trait)
 
 #-------------------------------------------------------------------------
 #  Constants:
@@ -491,3 +491,196 @@ class UndoHistoryUndoItem(AbstractUndoItem):
         for i in range(0, history.now):
             for item in history.history[i]:
                 item.redo()
+
+#-------------------------------------------------------------------------
+#  'ContextJournal' class:
+#-------------------------------------------------------------------------
+
+
+class ContextJournal(HasPrivateTraits):
+    """ Journals the changes made to working copies of a user interface
+        context, so that they can later be applied to, or reverted on, the
+        original context objects.
+
+        Unlike **clone_traits**, the working copies share their trait values
+        with the originals, and only the traits that are actually edited are
+        ever copied back or remembered for reverting.
+    """
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The original context being edited
+    context = Dict
+
+    # The working copies of the context objects
+    working = Dict
+
+    # The (context name, trait name) pairs edited since the last apply
+    edited = List
+
+    # Original values of the applied traits, keyed by (context name, trait
+    # name)
+    _originals = Dict
+
+    # The order in which the original values were recorded
+    _order = List
+
+    # Names of the traits shared by each working copy
+    _names = Dict
+
+    # Are changes currently being ignored?
+    _ignore = Bool(False)
+
+    #-------------------------------------------------------------------------
+    #  Initializes the object:
+    #-------------------------------------------------------------------------
+
+    def __init__(self, context, **traits):
+        """ Initializes the object.
+        """
+        super(ContextJournal, self).__init__(context=context, **traits)
+
+        working = {}
+        for name, value in context.items():
+            if value is not None:
+                working[name] = self._share(name, value)
+            else:
+                working[name] = None
+        self.working = working
+
+    #-------------------------------------------------------------------------
+    #  Applies the journaled changes to the original context:
+    #-------------------------------------------------------------------------
+
+    def apply(self):
+        """ Applies the changes made to the working copies since the last
+            apply to the original context objects.
+        """
+        for key in self.edited:
+            name, trait_name = key
+            original = self.context[name]
+            if key not in self._originals:
+                self._originals[key] = self._copy_value(
+                    getattr(original, trait_name))
+                self._order.append(key)
+            try:
+                setattr(original, trait_name,
+                        getattr(self.working[name], trait_name))
+            except:
+                pass
+
+        del self.edited[:]
+
+    #-------------------------------------------------------------------------
+    #  Reverts all changes made since the journal was created:
+    #-------------------------------------------------------------------------
+
+    def revert(self):
+        """ Restores the original values of all applied traits on the original
+            context objects, and discards the changes made to the working
+            copies.
+        """
+        originals = self._originals
+        for key in reversed(self._order):
+            name, trait_name = key
+            try:
+                setattr(self.context[name], trait_name, originals[key])
+            except:
+                pass
+
+        self._ignore = True
+        try:
+            for name, trait_name in self._order + self.edited:
+                try:
+                    setattr(self.working[name], trait_name,
+                            getattr(self.context[name], trait_name))
+                except:
+                    pass
+        finally:
+            self._ignore = False
+
+        originals.clear()
+        del self._order[:]
+        del self.edited[:]
+
+    #-------------------------------------------------------------------------
+    #  Disposes of the journal:
+    #-------------------------------------------------------------------------
+
+    def dispose(self):
+        """ Stops journaling changes to the working copies.
+        """
+        for value in self.working.values():
+            if value is not None:
+                value.on_trait_change(self._value_changed, remove=True)
+
+    #-------------------------------------------------------------------------
+    #  Creates a working copy sharing the trait values of an object:
+    #-------------------------------------------------------------------------
+
+    def _share(self, name, object):
+        """ Creates a working copy sharing the trait values of an object.
+        """
+        clone = object.__new__(object.__class__)
+        clone._init_trait_listeners()
+        names = []
+        for trait_name in object.copyable_trait_names():
+            trait = object.base_trait(trait_name)
+            if trait.type in ('delegate', 'event'):
+                continue
+            try:
+                setattr(clone, trait_name, getattr(object, trait_name))
+            except:
+                continue
+            names.append(trait_name)
+        clone._post_init_trait_listeners()
+        clone.traits_init()
+        clone.traits_inited(True)
+
+        self._names[name] = set(names)
+        clone.on_trait_change(self._value_changed)
+
+        return clone
+
+    #-------------------------------------------------------------------------
+    #  Returns a copy of a value suitable for restoring later:
+    #-------------------------------------------------------------------------
+
+    def _copy_value(self, value):
+        """ Returns a copy of a value suitable for restoring later.
+        """
+        if isinstance(value, list):
+            return value[:]
+
+        if isinstance(value, dict):
+            return value.copy()
+
+        return value
+
+    #-------------------------------------------------------------------------
+    #  Handles a trait on a working copy being changed:
+    #-------------------------------------------------------------------------
+
+    def _value_changed(self, object, trait_name, old, new):
+        """ Handles a trait on a working copy being changed.
+        """
+        if self._ignore:
+            return
+
+        for name, value in self.working.items():
+            if value is object:
+                break
+        else:
+            return
+
+        names = self._names[name]
+        if trait_name not in names:
+            if trait_name.endswith('_items') and (trait_name[:-6] in names):
+                trait_name = trait_name[:-6]
+            else:
+                return
+
+        key = (name, trait_name)
+        if key not in self.edited:
+            self.edited.append(key)
@@ -25,16 +25,26 @@
 from __future__ import absolute_import
 
 import inspect
+from itertools import islice
 from operator import itemgetter
 
 from types import FunctionType, MethodType
 
-from traits.api import Any, Bool, HasPrivateTraits, HasTraits, Instance, List, Str
+from traits.api import (Any, Bool, HasPrivateTraits, HasTraits, Instance, Int,
+                        List, Str)
 
 from .tree_node import ObjectTreeNode, TreeNode, TreeNodeObject
 
 from .editors.tree_editor import TreeEditor
 
+#-------------------------------------------------------------------------
+#  Constants:
+#-------------------------------------------------------------------------
+
+# The default maximum number of children shown for a container before they
+# are split into range buckets:
+PAGE_SIZE = 10000
+
 #-------------------------------------------------------------------------
 #  'SingleValueTreeNodeObject' class:
 #-------------------------------------------------------------------------
@@ -308,6 +318,14 @@ class OtherNode(SingleValueTreeNodeObject):
 class TupleNode(MultiValueTreeNodeObject):
     """ A tree node for tuples.
     """
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The maximum number of children shown before they are split into
+    # (lazily populated) range buckets:
+    page_size = Int(PAGE_SIZE)
+
     #-------------------------------------------------------------------------
     #  Returns the formatted version of the value:
     #-------------------------------------------------------------------------
@@ -334,16 +352,43 @@ class TupleNode(MultiValueTreeNodeObject):
     def tno_get_children(self, node):
         """ Gets the object's children.
         """
-        node_for = self.node_for
-        value = self.value
-        if len(value) > 500:
-            return ([node_for('[%d]' % i, x)
-                     for i, x in enumerate(value[: 250])] +
-                    [StringNode(value='...', readonly=True)] +
-                    [node_for('[%d]' % i, x)
-                     for i, x in enumerate(value[-250:])])
+        return self.page_children(0, len(self.value))
+
+    #-------------------------------------------------------------------------
+    #  Gets the children for a range of the object's items:
+    #-------------------------------------------------------------------------
+
+    def page_children(self, start, end):
+        """ Gets the children for the items from *start* up to (but not
+            including) *end*. If there are more than **page_size** of them,
+            range buckets are returned instead, without touching the items.
+        """
+        page_size = self.page_size
+        count = end - start
+        if count <= page_size:
+            node_for = self.node_for
+            return [node_for(name, x) for name, x in self.get_items(start, end)]
+
+        step = page_size
+        while ((count + step - 1) // step) > page_size:
+            step *= page_size
 
-        return [node_for('[%d]' % i, x) for i, x in enumerate(value)]
+        return [RangeNode(owner=self,
+                          start=i,
+                          end=min(i + step, end),
+                          readonly=self.readonly)
+                for i in xrange(start, end, step)]
+
+    #-------------------------------------------------------------------------
+    #  Returns the names and values of a range of the object's items:
+    #-------------------------------------------------------------------------
+
+    def get_items(self, start, end):
+        """ Returns the (name, value) pairs for the items from *start* up to
+            (but not including) *end*.
+        """
+        return [('[%d]' % i, x)
+                for i, x in enumerate(self.value[start: end], start)]
 
 #-------------------------------------------------------------------------
 #  'ListNode' class:
@@ -401,6 +446,17 @@ class SetNode(ListNode):
         """
         return 'Set(%d)' % len(value)
 
+    #-------------------------------------------------------------------------
+    #  Returns the names and values of a range of the object's items:
+    #-------------------------------------------------------------------------
+
+    def get_items(self, start, end):
+        """ Returns the (name, value) pairs for the items from *start* up to
+            (but not including) *end*, in iteration order.
+        """
+        return [('[%d]' % i, x)
+                for i, x in enumerate(islice(self.value, start, end), start)]
+
 #-------------------------------------------------------------------------
 #  'ArrayNode' class:
 #-------------------------------------------------------------------------
@@ -441,18 +497,16 @@ class DictNode(TupleNode):
     #  Gets the object's children:
     #-------------------------------------------------------------------------
 
-    def tno_get_children(self, node):
-        """ Gets the object's children.
+    def get_items(self, start, end):
+        """ Returns the (name, value) pairs for the items from *start* up to
+            (but not including) *end* in iteration order, sorted by key. Only
+            the keys in the range are formatted and sorted.
         """
-        node_for = self.node_for
-        items = [(repr(k), v) for k, v in self.value.items()]
+        items = [('[%s]' % repr(k), v)
+                 for k, v in islice(self.value.iteritems(), start, end)]
         items.sort(key=itemgetter(0))
-        if len(items) > 500:
-            return ([node_for('[%s]' % k, v) for k, v in items[: 250]] +
-                    [StringNode(value='...', readonly=True)] +
-                    [node_for('[%s]' % k, v) for k, v in items[-250:]])
 
-        return [node_for('[%s]' % k, v) for k, v in items]
+        return items
 
     #-------------------------------------------------------------------------
     #  Returns whether or not the object's children can be deleted:
@@ -463,6 +517,56 @@ class DictNode(TupleNode):
         """
         return (not self.readonly)
 
+#-------------------------------------------------------------------------
+#  'RangeNode' class:
+#-------------------------------------------------------------------------
+
+
+class RangeNode(MultiValueTreeNodeObject):
+    """ A tree node for a range of the items of a large container, whose
+    children are only created when the node is expanded.
+    """
+
+    #-------------------------------------------------------------------------
+    #  Trait definitions:
+    #-------------------------------------------------------------------------
+
+    # The node for the container the range belongs to
+    owner = Instance(TupleNode)
+
+    # The index of the first item in the range
+    start = Int
+
+    # The index after the last item in the range
+    end = Int
+
+    #-------------------------------------------------------------------------
+    #  Gets the label to display for a specified object:
+    #-------------------------------------------------------------------------
+
+    def tno_get_label(self, node):
+        """ Gets the label to display for a specified object.
+        """
+        return '[%d..%d]' % (self.start, self.end - 1)
+
+    #-------------------------------------------------------------------------
+    #  Returns the icon for a specified object:
+    #-------------------------------------------------------------------------
+
+    def tno_get_icon(self, node, is_expanded):
+        """ Returns the icon for a specified object.
+        """
+        return self.owner.tno_get_icon(node, is_expanded)
+
+    #-------------------------------------------------------------------------
+    #  Gets the object's children:
+    #-------------------------------------------------------------------------
+
+    def tno_get_children(self, node):
+        """ Gets the object's children.
+        """
+        return self.owner.page_children(self.start, self.end)
+
 #-------------------------------------------------------------------------
 #  'FunctionNode' class:
 #-------------------------------------------------------------------------
@@ -753,8 +857,8 @@ value_tree_nodes = [
     ObjectTreeNode(
         node_for=[NoneNode, StringNode, BoolNode, IntNode, FloatNode,
                   ComplexNode, OtherNode, TupleNode, ListNode, ArrayNode,
-                  DictNode, SetNode, FunctionNode, MethodNode, ObjectNode,
-                  TraitsNode, RootNode, ClassNode])
+                  DictNode, SetNode, RangeNode, FunctionNode, MethodNode,
+                  ObjectNode, TraitsNode, RootNode, ClassNode])
 ]
 
 # Editor for a value tree:
@@ -773,7 +877,7 @@ value_tree_editor_with_root = TreeEditor(
         ObjectTreeNode(
             node_for=[NoneNode, StringNode, BoolNode, IntNode, FloatNode,
                       ComplexNode, OtherNode, TupleNode, ListNode, ArrayNode,
-                      DictNode, SetNode, FunctionNode, MethodNode,
+                      DictNode, SetNode, RangeNode, FunctionNode, MethodNode,
                       ObjectNode, TraitsNode, RootNode, ClassNode]
         ),
         TreeNode(node_for=[_ValueTree],
@@ -257,6 +257,11 @@ class View(ViewElement):
     # Called when modal changes are applied or reverted:
     on_apply = OnApply
 
+    # Should a modal dialog edit working copies sharing the trait values of the
+    # context objects and journal the edited traits, rather than deep-copying
+    # every context object when it opens? (Qt only)
+    journal = Bool(False)
+
     # Can the user resize the window?
     resizable = IsResizable
 
@@ -354,6 +354,10 @@ class TabularEditor(Editor):
         self.on_trait_change(self._rebuild_all, 'adapter.columns',
                              dispatch='ui')
 
+        # Refresh the rows whenever they change without the trait changing:
+        self.on_trait_change(self.update_editor, 'adapter.rows_changed',
+                             dispatch='ui')
+
         # Make sure the tabular view gets initialized:
         self._rebuild()
 
@@ -396,6 +400,8 @@ class TabularEditor(Editor):
         self.on_trait_change(self._refresh, 'adapter.+update', remove=True)
         self.on_trait_change(self._rebuild_all, 'adapter.columns',
                              remove=True)
+        self.on_trait_change(self.update_editor, 'adapter.rows_changed',
+                             remove=True)
 
         super(TabularEditor, self).dispose()
 